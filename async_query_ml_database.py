@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Asyncio interface to the ML technologies database reports
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import query_ml_database
+from query_ml_database import DATABASE_PATH, QuerySession
+
+DEFAULT_WORKERS = 4
+
+# The report set query_ml_database.main() prints, as (method, args)
+MAIN_REPORTS = (
+    ('show_all_companies', ()),
+    ('show_technology_categories', ()),
+    ('show_ml_technologies_by_company', ()),
+    ('get_company_stats', ()),
+    ('show_datagod_technologies', ()),
+    ('search_technologies', ('anomaly',)),
+)
+
+class _Worker:
+    """A QuerySession pinned to its own thread.
+
+    sqlite3 connections refuse to be used from a thread other than the one
+    that opened them, so every session gets a single-thread executor.
+    """
+
+    def __init__(self, database_path):
+        self.session = QuerySession(database_path, echo=False)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='report-db')
+
+    def close(self):
+        self.executor.submit(self.session.close).result()
+        self.executor.shutdown()
+
+class AsyncQuerySession:
+    """Runs the query_ml_database reports without blocking the event loop.
+
+    Reports execute on a bounded set of worker threads, each holding one
+    read connection, so at most ``workers`` queries hit SQLite at once and
+    the loop only awaits their results.
+    """
+
+    def __init__(self, database_path=DATABASE_PATH, workers=DEFAULT_WORKERS):
+        self.database_path = database_path
+        self._workers = [_Worker(database_path) for _ in range(workers)]
+        self._idle = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def run(self, report, *args, **kwargs):
+        """Run a QuerySession report method on an idle worker"""
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for worker in self._workers:
+                self._idle.put_nowait(worker)
+        worker = await self._idle.get()
+        try:
+            loop = asyncio.get_running_loop()
+            method = getattr(worker.session, report)
+            return await loop.run_in_executor(worker.executor,
+                                              functools.partial(method, *args, **kwargs))
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def gather(self, *reports):
+        """Run many (report, args) pairs concurrently, results in order"""
+        return await asyncio.gather(*(self.run(report, *args) for report, args in reports))
+
+    async def close(self):
+        """Close every worker connection"""
+        loop = asyncio.get_running_loop()
+        for worker in self._workers:
+            await loop.run_in_executor(None, worker.close)
+        self._workers = []
+
+    async def show_all_companies(self):
+        """Fetch all companies"""
+        return await self.run('show_all_companies')
+
+    async def show_ml_technologies_by_company(self, company_name=None):
+        """Fetch ML technologies, for one company or for all of them"""
+        return await self.run('show_ml_technologies_by_company', company_name)
+
+    async def show_technology_categories(self):
+        """Fetch technology categories"""
+        return await self.run('show_technology_categories')
+
+    async def get_company_stats(self):
+        """Fetch per-company and per-type technology counts"""
+        return await self.run('get_company_stats')
+
+    async def search_technologies(self, keyword, limit=None):
+        """Search technologies by keyword"""
+        return await self.run('search_technologies', keyword, limit)
+
+    async def show_datagod_technologies(self):
+        """Fetch DATAGOD technologies"""
+        return await self.run('show_datagod_technologies')
+
+    async def search_equipment(self, limit=None, cheapest_first=False, **filters):
+        """Find equipment by typed spec and price ranges and compatible systems"""
+        return await self.run('search_equipment', limit, cheapest_first, **filters)
+
+    async def search_sensors(self, limit=None, **filters):
+        """Find sensors by SI power draw, range and accuracy"""
+        return await self.run('search_sensors', limit, **filters)
+
+    async def configure_stack(self, system, budget_cents=None, max_amps=None,
+                              objective='cheapest', top=5):
+        """Find autopilot stacks for a flight control system"""
+        return await self.run('configure_stack', system, budget_cents, max_amps, objective, top)
+
+    async def adoptions(self, bucket='quarter', by='technology_type', **filters):
+        """Count technologies per year or quarter from the adoption rollup"""
+        return await self.run('adoptions', bucket, by, **filters)
+
+    async def main_reports(self):
+        """Run the full main() report set concurrently"""
+        return await self.gather(*MAIN_REPORTS)
+
+async def run_main_reports(database_path=DATABASE_PATH, workers=DEFAULT_WORKERS):
+    """Run and print the main() report set, querying in parallel"""
+    async with AsyncQuerySession(database_path, workers) as session:
+        started = time.perf_counter()
+        (companies, categories, technologies, stats,
+         datagod, search) = await session.main_reports()
+        elapsed = time.perf_counter() - started
+
+    query_ml_database.print_companies(companies)
+    query_ml_database.print_categories(categories)
+    query_ml_database.print_technologies(technologies)
+    query_ml_database.print_company_stats(*stats)
+    query_ml_database.print_datagod_technologies(datagod)
+    query_ml_database.print_search_results('anomaly', search)
+    return elapsed
+
+def main():
+    """Main function to run the query tool reports concurrently"""
+    print("🚀 ML TECHNOLOGIES DATABASE QUERY TOOL (async)")
+    print("=" * 50)
+
+    elapsed = asyncio.run(run_main_reports())
+
+    print(f"\n✅ {len(MAIN_REPORTS)} reports fetched concurrently in {elapsed * 1000:.1f} ms")
+    print(f"\n📁 Database location: {DATABASE_PATH}")
+
+if __name__ == "__main__":
+    main()
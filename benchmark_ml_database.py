@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the ML technologies database: times bulk ingestion and
+every query_ml_database report on synthetic catalogs and checks the results
+against a stored baseline
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+import generate_synthetic_catalog
+from query_ml_database import QuerySession
+
+DEFAULT_BASELINE = 'ml_database_benchmark_baseline.json'
+DEFAULT_TOLERANCE = 0.25
+
+# Regressions smaller than this are timer noise, whatever the ratio
+MIN_REGRESSION_MS = 0.05
+MIN_REGRESSION_KB = 64
+MIN_REGRESSION_RSS_KB = 8192
+
+# Repeats per report; full listings at large scales get fewer
+DEFAULT_REPEATS = 50
+LISTING_REPEATS = 5
+
+# (name, report call, is a full listing)
+BENCHMARK_REPORTS = (
+    ('show_all_companies', lambda s: s.show_all_companies(), False),
+    ('show_technology_categories', lambda s: s.show_technology_categories(), False),
+    ('show_ml_technologies_by_company', lambda s: s.show_ml_technologies_by_company(), True),
+    ('show_ml_technologies_by_company[DATAGOD]',
+     lambda s: s.show_ml_technologies_by_company('DATAGOD'), True),
+    ('get_company_stats', lambda s: s.get_company_stats(), False),
+    ('search_technologies[anomaly]', lambda s: s.search_technologies('anomaly', 100), False),
+    ('search_technologies[all]', lambda s: s.search_technologies('anomaly'), True),
+    ('show_datagod_technologies', lambda s: s.show_datagod_technologies(), True),
+    ('iter_ml_technologies_by_company[first page]',
+     lambda s: list(zip(range(500), s.iter_ml_technologies_by_company())), False),
+    ('search_equipment[400MHz, 16 PWM]',
+     lambda s: s.search_equipment(20, min_clock_mhz=400, min_pwm_outputs=16), False),
+    ('search_equipment[PX4 under $300, cheapest]',
+     lambda s: s.search_equipment(20, True, compatible_with=('PX4',), budget_max_cents=30000),
+     False),
+    ('search_sensors[IMU under 5 mA]',
+     lambda s: s.search_sensors(20, sensor_type='IMU', max_current_amps=0.005), False),
+    ('configure_stack[PX4 cheapest]',
+     lambda s: s.configure_stack('PX4', budget_cents=80000, max_amps=0.05), False),
+    ('configure_stack[PX4 best]',
+     lambda s: s.configure_stack('PX4', budget_cents=80000, objective='best'), False),
+    ('adoptions[quarter by type]', lambda s: s.adoptions(start_year=2020), False),
+    ('adoptions[year by company]', lambda s: s.adoptions('year', 'company_name'), True),
+)
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def time_report(session, report, repeats):
+    """Return p50/p99 latency in ms and traced peak memory in KB for a report"""
+    report(session)  # warm the page cache and prepared statements
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        report(session)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    report(session)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'p50_ms': round(percentile(samples, 0.50), 4),
+        'p99_ms': round(percentile(samples, 0.99), 4),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+def benchmark_scale(scale_name, workdir, repeats, regenerate=False):
+    """Generate (or reuse) a catalog at one scale and benchmark it"""
+    path = os.path.join(workdir, f"synthetic_{scale_name}.db")
+    results = {'ingestion': {}, 'reports': {}}
+    if regenerate or not os.path.exists(path):
+        ingestion = generate_synthetic_catalog.generate_catalog(
+            path, generate_synthetic_catalog.SCALES[scale_name])
+        for table, (count, seconds) in ingestion.items():
+            results['ingestion'][table] = {
+                'rows': count,
+                'rows_per_s': round(count / seconds if seconds else 0.0, 1),
+            }
+
+    # Benchmark the queries themselves, not the result cache
+    with QuerySession(path, echo=False, cache_entries=0) as session:
+        for name, report, is_listing in BENCHMARK_REPORTS:
+            count = LISTING_REPEATS if is_listing and scale_name != '10k' else repeats
+            results['reports'][name] = time_report(session, report, count)
+    results['max_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return results
+
+def find_regressions(results, baseline, tolerance):
+    """Return (scale, metric, baseline, current) for every regression"""
+    regressions = []
+    for scale, current in results.items():
+        previous = baseline.get(scale)
+        if previous is None:
+            continue
+        for name, metrics in current['reports'].items():
+            before = previous.get('reports', {}).get(name)
+            if before is None:
+                continue
+            for metric, floor in (('p50_ms', MIN_REGRESSION_MS), ('p99_ms', MIN_REGRESSION_MS),
+                                  ('peak_kb', MIN_REGRESSION_KB)):
+                limit = before[metric] * (1 + tolerance)
+                if metrics[metric] > limit and metrics[metric] - before[metric] > floor:
+                    regressions.append((scale, f"{name} {metric}", before[metric], metrics[metric]))
+        for table, metrics in current['ingestion'].items():
+            before = previous.get('ingestion', {}).get(table)
+            if before is None:
+                continue
+            if metrics['rows_per_s'] < before['rows_per_s'] * (1 - tolerance):
+                regressions.append((scale, f"ingest {table} rows_per_s",
+                                    before['rows_per_s'], metrics['rows_per_s']))
+        before = previous.get('max_rss_kb')
+        if (before is not None and current['max_rss_kb'] > before * (1 + tolerance)
+                and current['max_rss_kb'] - before > MIN_REGRESSION_RSS_KB):
+            regressions.append((scale, 'max_rss_kb', before, current['max_rss_kb']))
+    return regressions
+
+def print_results(scale, results):
+    """Print one scale's benchmark table"""
+    print(f"\n📊 SCALE {scale.upper()}")
+    print("=" * 100)
+    if results['ingestion']:
+        print(f"{'Ingestion':<45} {'Rows':>12} {'Rows/s':>14}")
+        print("-" * 100)
+        for table, metrics in results['ingestion'].items():
+            print(f"{table:<45} {metrics['rows']:>12,} {metrics['rows_per_s']:>14,.0f}")
+        print()
+    print(f"{'Report':<45} {'p50 ms':>12} {'p99 ms':>12} {'Peak KB':>12}")
+    print("-" * 100)
+    for name, metrics in results['reports'].items():
+        print(f"{name:<45} {metrics['p50_ms']:>12.3f} {metrics['p99_ms']:>12.3f} "
+              f"{metrics['peak_kb']:>12,.1f}")
+    print(f"\n   Max RSS: {results['max_rss_kb']:,} KB")
+
+def main():
+    """Run the benchmark suite and compare it with the stored baseline"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--scales', nargs='+', default=['10k'],
+                        choices=sorted(generate_synthetic_catalog.SCALES))
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    parser.add_argument('--workdir', default='.')
+    parser.add_argument('--regenerate', action='store_true',
+                        help='rebuild the synthetic catalogs even if they exist')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store these results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed slowdown as a fraction of the baseline')
+    args = parser.parse_args()
+
+    print("🚀 ML TECHNOLOGIES DATABASE BENCHMARK")
+    results = {}
+    for scale in args.scales:
+        results[scale] = benchmark_scale(scale, args.workdir, args.repeats, args.regenerate)
+        print_results(scale, results[scale])
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n✅ Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️  No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ Regressions beyond {args.tolerance:.0%} of the baseline:")
+        for scale, metric, before, after in regressions:
+            print(f"   • [{scale}] {metric}: {before} -> {after}")
+        sys.exit(1)
+
+    print(f"\n🎉 No regressions beyond {args.tolerance:.0%} of the baseline!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Script to generate a deterministic synthetic ML technologies catalog at
+benchmark scale (10k, 1M or 10M rows per table)
+"""
+
+import argparse
+import itertools
+import os
+import random
+
+import create_ml_database
+import extend_database_final
+from ml_database_ingest import LOAD_CHUNK_SIZE, bulk_load
+
+SCALES = {
+    '10k': 10_000,
+    '1m': 1_000_000,
+    '10m': 10_000_000,
+}
+
+# Rows per table as a fraction of the scale. Technologies, equipment and
+# sensors grow with the scale; companies, categories and flight control
+# systems stay proportionally small, as in the seed data
+TABLE_RATIOS = {
+    'companies': 0.01,
+    'technology_categories': 0.001,
+    'ml_technologies': 1.0,
+    'equipment': 1.0,
+    'flight_control_systems': 0.01,
+    'sensors': 1.0,
+}
+
+# Weights follow the seed catalog: Deep Learning dominates, then Computer
+# Vision and Predictive Analytics
+TECHNOLOGY_TYPES = (
+    ('Deep Learning', 38), ('Computer Vision', 8), ('Predictive Analytics', 4),
+    ('Anomaly Detection', 3), ('Natural Language Processing', 2),
+    ('Reinforcement Learning', 1), ('Time Series Analysis', 1), ('Clustering', 1),
+    ('Classification', 1), ('Regression', 1),
+)
+
+APPLICATION_AREAS = (
+    'Infrastructure Monitoring', 'AI/ML Monitoring', 'Alert Management', 'Log Analysis',
+    'Application Performance', 'Error Management', 'Data Analytics', 'Security Analytics',
+    'Business Intelligence', 'Search & Analytics', 'Observability', 'MLOps', 'Automated ML',
+    'Feature Engineering', 'Data Preparation', 'LLM Development', 'Drug Development',
+    'Autonomous Systems', 'Defense Applications', 'Autonomous Flight', 'Safety Systems',
+    'Flight Control', 'Mission Management', 'Image Generation', 'Speech Recognition',
+    'ML Platform', 'Autonomous Driving', 'Drone Tracking', 'Edge Computing', 'Industrial IoT',
+)
+
+INDUSTRIES = (
+    'Observability & Monitoring', 'APM & Observability', 'Data Analytics & Security',
+    'Search & Analytics', 'Data & AI Platform', 'AI Research', 'Cloud Computing',
+    'Autonomous Vehicles', 'Drone Technology', 'Flight Controllers', 'Sensor Technology',
+    'Industrial IoT', 'Robotics', 'Edge AI', 'Defense AI',
+)
+
+COUNTRIES = (
+    ('USA', 30), ('China', 5), ('International', 5), ('Germany', 3), ('UK', 2),
+    ('France', 1), ('Canada', 1), ('Switzerland', 1), ('Japan', 1), ('Ukraine', 1),
+)
+
+DESCRIPTION_WORDS = (
+    'AI-powered', 'machine', 'learning', 'anomaly', 'detection', 'predictive', 'alerting',
+    'monitoring', 'infrastructure', 'metrics', 'logs', 'traces', 'computer', 'vision',
+    'autonomous', 'flight', 'navigation', 'drone', 'real-time', 'platform', 'model',
+    'training', 'inference', 'edge', 'deep', 'neural', 'network', 'forecasting', 'security',
+    'threat', 'pattern', 'recognition', 'language', 'analytics', 'optimization', 'sensor',
+    'fusion', 'obstacle', 'avoidance', 'mission', 'planning', 'telemetry', 'data', 'pipeline',
+)
+
+TECHNOLOGY_NOUNS = (
+    'Engine', 'Platform', 'Toolkit', 'Monitor', 'Detector', 'Predictor', 'Pipeline',
+    'Assistant', 'Analyzer', 'Planner', 'Navigator', 'Studio', 'Runtime', 'Agent',
+)
+
+EQUIPMENT_CATEGORIES = (
+    ('Flight Controller', 5), ('GPS Module', 2), ('Telemetry Radio', 2),
+    ('Power Management', 2), ('Edge AI Computer', 2), ('AI GPU', 1),
+    ('Single Board Computer', 1), ('Professional Drone', 1), ('Industrial IoT Gateway', 1),
+)
+
+PROCESSORS = (
+    ('STM32F427', 168), ('STM32F765', 216), ('STM32F7', 216), ('STM32H7', 400),
+    ('STM32H743', 480), ('ARM Cortex-A72', 1500), ('ARM Cortex-A78AE', 2200),
+)
+
+SOFTWARE = ('ArduPilot', 'PX4', 'QGroundControl', 'Mission Planner', 'MAVSDK', 'ROS 2')
+
+FLIGHT_SYSTEM_TYPES = (
+    'Autopilot Software', 'Ground Control Station', 'Communication Protocol',
+    'Software Development Kit', 'Robotics Framework', 'Drone Simulation',
+)
+
+SENSOR_TYPES = ('IMU', 'Barometer', 'Magnetometer', 'GNSS', 'Optical Flow', 'Rangefinder')
+
+SENSOR_RANGES = {
+    'IMU': lambda rng: f"Gyro: ±{rng.choice((125, 250, 500, 2000))}°/s, Accel: ±{rng.choice((2, 3, 8, 16))}g",
+    'Barometer': lambda rng: f"{rng.choice((10, 300))}-{rng.choice((1100, 1200, 1250))} mbar",
+    'Magnetometer': lambda rng: f"±{rng.choice((2, 4, 8, 16))} Gauss",
+    'GNSS': lambda rng: 'Global',
+    'Optical Flow': lambda rng: f"0.{rng.randint(1, 3)}-{rng.randint(2, 5)}m",
+    'Rangefinder': lambda rng: f"0.{rng.randint(1, 5)}-{rng.randint(10, 40)}m",
+}
+
+SENSOR_ACCURACY = {
+    'IMU': lambda rng: f"±{rng.choice((0.05, 0.1, 0.5))}°",
+    'Barometer': lambda rng: f"±{rng.choice((0.012, 0.08, 0.5))} mbar",
+    'Magnetometer': lambda rng: f"±{rng.choice((1, 2))}°",
+    'GNSS': lambda rng: rng.choice(('RTK: 1cm, Standard: 2.5m', '2.5m CEP', '1.5m CEP')),
+    'Optical Flow': lambda rng: f"±{rng.choice((3, 5, 10))}%",
+    'Rangefinder': lambda rng: f"±{rng.choice((1, 2, 5))}cm",
+}
+
+INTERFACES = ('I2C', 'SPI', 'I2C/SPI', 'UART', 'CAN')
+
+def _weighted(choices):
+    """Split (value, weight) pairs into parallel tuples for Random.choices"""
+    values, weights = zip(*choices)
+    return values, list(itertools.accumulate(weights))
+
+def table_sizes(scale):
+    """Return the number of rows to generate per table for a scale"""
+    return {table: max(10, int(scale * ratio)) for table, ratio in TABLE_RATIOS.items()}
+
+def _company_names(count):
+    """Seed company names first, then numbered synthetic ones"""
+    seed = ['DATAGOD', 'New Relic', 'Splunk', 'Elastic', 'Databricks', 'Scale AI',
+            'Insitro', 'Shield AI', 'CUAV', 'Hex Technology', 'Pixhawk', 'U-Blox',
+            'Bosch Sensortec', 'Invensense', 'PX4 Foundation', 'ArduPilot Community']
+    return seed[:count] + [f"Company {i:07d}" for i in range(len(seed), count)]
+
+def _description(rng, words):
+    return ' '.join(rng.choices(DESCRIPTION_WORDS, k=words))
+
+def generate_companies(rng, names):
+    """Yield companies rows"""
+    countries, country_weights = _weighted(COUNTRIES)
+    for name in names:
+        yield (name, rng.choice(INDUSTRIES),
+               rng.choices(countries, cum_weights=country_weights)[0],
+               rng.randint(1950, 2022), _description(rng, 6))
+
+def generate_categories(rng, count):
+    """Yield technology_categories rows: the seed taxonomy, then subcategories"""
+    base = [name for name, _ in TECHNOLOGY_TYPES]
+    for i in range(count):
+        name = base[i] if i < len(base) else f"{base[i % len(base)]} {i // len(base)}"
+        yield (name, _description(rng, 8))
+
+def generate_technologies(rng, names, count):
+    """Yield ml_technologies rows with a Zipf-like skew towards early companies"""
+    types, type_weights = _weighted(TECHNOLOGY_TYPES)
+    company_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(names))))
+    for i in range(count):
+        company = rng.choices(names, cum_weights=company_weights)[0]
+        technology_type = rng.choices(types, cum_weights=type_weights)[0]
+        area = rng.choice(APPLICATION_AREAS)
+        name = f"{area.split()[0]} {rng.choice(TECHNOLOGY_NOUNS)} {i}"
+        date = f"{rng.randint(2015, 2025)}-{rng.randint(1, 12):02d}-01"
+        source = f"https://example.com/{company.lower().replace(' ', '-')}/{i}"
+        yield (company, name, technology_type, area, _description(rng, 10), date, source)
+
+def _price_range(rng, low):
+    high = low + rng.choice((1, 2, 5)) * max(10, low // 4)
+    return f"${low:,}-{high:,}"
+
+def generate_equipment(rng, names, count):
+    """Yield equipment rows with parseable specifications and price ranges"""
+    categories, category_weights = _weighted(EQUIPMENT_CATEGORIES)
+    for i in range(count):
+        category = rng.choices(categories, cum_weights=category_weights)[0]
+        processor, mhz = rng.choice(PROCESSORS)
+        flash_mb = rng.choice((1, 2, 4, 16))
+        ram_kb = rng.choice((256, 512, 1024, 8192))
+        ram = f"{ram_kb // 1024}MB" if ram_kb >= 1024 else f"{ram_kb}KB"
+        specs = f"{processor} processor, {mhz}MHz, {flash_mb}MB Flash, {ram} RAM"
+        if category == 'Flight Controller':
+            specs += f", {rng.choice((8, 12, 14, 16, 20))} PWM outputs"
+        elif category == 'Power Management':
+            specs = f"Input: {rng.choice((2, 6))}-{rng.choice((26, 60))}V, Output: 5V/{rng.randint(2, 5)}A"
+        software = ', '.join(sorted(rng.sample(SOFTWARE, rng.randint(1, 3))))
+        low = rng.choice((30, 50, 60, 100, 150, 200, 300, 400, 2000, 10000))
+        yield (f"{category} {i}", rng.choice(names), category, _description(rng, 8),
+               specs, software, _price_range(rng, low),
+               rng.choices(('Available', 'Limited', 'Discontinued'), cum_weights=(8, 9, 10))[0])
+
+def generate_flight_control_systems(rng, count):
+    """Yield flight_control_systems rows"""
+    for i in range(count):
+        name = ('PX4', 'ArduPilot')[i] if i < 2 else f"Flight Stack {i}"
+        yield (name, rng.choice(FLIGHT_SYSTEM_TYPES), _description(rng, 10),
+               _description(rng, 6), 'Pixhawk, Cube, CUAV X7+, Holybro',
+               rng.random() < 0.8, 'Active development', f"https://example.com/fcs/{i}")
+
+def generate_sensors(rng, names, count):
+    """Yield sensors rows with parseable power, range and accuracy text"""
+    for i in range(count):
+        sensor_type = rng.choice(SENSOR_TYPES)
+        current = rng.choice(('3.4μA', '100μA', '1.2mA', '3.9mA', '50mA', '100mA', '200mA'))
+        sensor_range = SENSOR_RANGES[sensor_type](rng)
+        yield (f"{sensor_type} {i}", sensor_type, rng.choice(names),
+               _description(rng, 8), sensor_range, SENSOR_ACCURACY[sensor_type](rng),
+               sensor_range, f"{rng.choice(('3.3V', '5V'))}, {current}",
+               rng.choice(INTERFACES))
+
+def generate_catalog(database_path, scale, seed=42, chunk_size=LOAD_CHUNK_SIZE):
+    """Create a fresh synthetic catalog; return {table: (rows, seconds)}"""
+    if os.path.exists(database_path):
+        os.remove(database_path)
+    conn = create_ml_database.create_database(database_path)
+    conn.close()
+    conn = extend_database_final.extend_database(database_path)
+
+    rng = random.Random(seed)
+    sizes = table_sizes(scale)
+    names = _company_names(sizes['companies'])
+    sources = {
+        'companies': generate_companies(rng, names),
+        'technology_categories': generate_categories(rng, sizes['technology_categories']),
+        'ml_technologies': generate_technologies(rng, names, sizes['ml_technologies']),
+        'equipment': generate_equipment(rng, names, sizes['equipment']),
+        'flight_control_systems': generate_flight_control_systems(rng, sizes['flight_control_systems']),
+        'sensors': generate_sensors(rng, names, sizes['sensors']),
+    }
+    loaded = bulk_load(conn, sources, chunk_size)
+    results = {table: (counts['inserted'], counts['seconds']) for table, counts in loaded.items()}
+    conn.execute("ANALYZE")
+    conn.close()
+    return results
+
+def main():
+    """Generate a synthetic catalog at the requested scale"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('scale', choices=sorted(SCALES), help='rows per large table')
+    parser.add_argument('--output', default=None,
+                        help='database file (default: synthetic_<scale>.db)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    path = args.output or f"synthetic_{args.scale}.db"
+    print(f"🚀 Generating {args.scale} synthetic catalog into {path}...")
+    results = generate_catalog(path, SCALES[args.scale], args.seed)
+    for table, (count, seconds) in results.items():
+        rate = count / seconds if seconds else float('inf')
+        print(f"   • {table}: {count:,} rows in {seconds:.2f}s ({rate:,.0f} rows/s)")
+    print("\n🎉 Synthetic catalog ready!")
+
+if __name__ == "__main__":
+    main()
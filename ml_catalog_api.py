@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Read-only HTTP JSON API over the ML technologies database
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import ml_database_migrations
+import ml_search_index
+import ml_time_buckets
+import query_ml_database
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8081
+DEFAULT_POOL_SIZE = 4
+
+# Rows fetched per executor round trip and written as one HTTP chunk
+STREAM_BATCH_SIZE = 200
+DEFAULT_LIMIT = 1000
+MAX_LIMIT = 100000
+
+# Each listing endpoint: the table or view it reads, the columns it returns,
+# the query-string filters it accepts (mapped to columns) and its ordering
+ENDPOINTS = {
+    '/companies': {
+        'table': 'companies',
+        'columns': ('id', 'company_name', 'industry', 'country', 'founded_year', 'description'),
+        'filters': {'name': 'company_name', 'industry': 'industry', 'country': 'country'},
+        'order': 'company_name',
+    },
+    '/technologies': {
+        'table': 'ml_technologies_labeled',
+        'columns': ('id', 'company_name', 'technology_name', 'technology_type',
+                    'application_area', 'description', 'implementation_date', 'source'),
+        'filters': {'company': 'company_name', 'company_id': 'company_id',
+                    'type': 'technology_type', 'area': 'application_area'},
+        'order': 'company_name, technology_name, id',
+    },
+    '/categories': {
+        'table': 'technology_categories',
+        'columns': ('id', 'category_name', 'description'),
+        'filters': {'name': 'category_name'},
+        'order': 'category_name',
+    },
+    '/equipment': {
+        'table': 'equipment',
+        'columns': ('id', 'name', 'manufacturer', 'category', 'description', 'specifications',
+                    'supported_software', 'price_range', 'availability'),
+        'filters': {'manufacturer': 'manufacturer', 'company_id': 'company_id',
+                    'category': 'category', 'availability': 'availability'},
+        'order': 'id',
+    },
+    '/flight-control-systems': {
+        'table': 'flight_control_systems',
+        'columns': ('id', 'name', 'type', 'description', 'features', 'supported_hardware',
+                    'open_source', 'community_support', 'documentation_url'),
+        'filters': {'name': 'name', 'type': 'type', 'open_source': 'open_source'},
+        'order': 'id',
+    },
+    '/sensors': {
+        'table': 'sensors',
+        'columns': ('id', 'name', 'type', 'manufacturer', 'specifications', 'accuracy',
+                    'range', 'power_consumption', 'interface'),
+        'filters': {'type': 'type', 'manufacturer': 'manufacturer', 'company_id': 'company_id',
+                    'interface': 'interface'},
+        'order': 'id',
+    },
+}
+
+SEARCH_COLUMNS = ('company_name', 'technology_name', 'technology_type', 'application_area',
+                  'description')
+STATS_COLUMNS = ('company_name', 'industry', 'technology_count')
+TYPE_STATS_COLUMNS = ('technology_type', 'technology_count')
+
+# /stats/adoptions query-string filters -> build_adoption_query keywords
+ADOPTION_FILTERS = {'start_year': 'start_year', 'end_year': 'end_year',
+                    'type': 'technology_type', 'company': 'company_name'}
+
+HTTP_REASONS = {
+    200: 'OK',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    500: 'Internal Server Error',
+}
+
+class ApiError(Exception):
+    """Error reported to the client as a JSON body with an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def connect_read_only(database_path):
+    """Open a connection that can never write to the database"""
+    uri = 'file:' + os.path.abspath(database_path) + '?mode=ro'
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                           cached_statements=query_ml_database.STATEMENT_CACHE_SIZE)
+    conn.execute("PRAGMA query_only = 1")
+    for pragma in query_ml_database.SESSION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+class ReadOnlyPool:
+    """Fixed set of read-only connections, each used by one request at a time.
+
+    Queries run on a thread pool of the same size so SQLite work never
+    blocks the event loop.
+    """
+
+    def __init__(self, database_path, size=DEFAULT_POOL_SIZE):
+        self.database_path = database_path
+        self.size = size
+        self.executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='catalog-db')
+        self._idle = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(connect_read_only(database_path))
+
+    async def acquire(self):
+        """Wait for an idle connection"""
+        return await self._idle.get()
+
+    def release(self, conn):
+        """Return a connection to the pool"""
+        self._idle.put_nowait(conn)
+
+    async def run(self, func, *args):
+        """Run a blocking call on the database thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def close(self):
+        """Close every connection once all of them are back in the pool"""
+        for _ in range(self.size):
+            conn = await self._idle.get()
+            conn.close()
+        self.executor.shutdown()
+
+class DatabaseVersion:
+    """Server-wide content version used to build ETags.
+
+    ``PRAGMA data_version`` is only comparable on one connection, so a
+    dedicated watcher connection polls it and bumps a generation counter
+    whenever another connection has committed.
+    """
+
+    def __init__(self, database_path):
+        self._conn = connect_read_only(database_path)
+        self._data_version = None
+        self._generation = 0
+        stat = os.stat(database_path)
+        self._epoch = f'{stat.st_ino:x}{stat.st_mtime_ns:x}'
+
+    def current(self):
+        """Return the version token for the database as it is now"""
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._generation += 1
+        return f'{self._epoch}-{self._generation}'
+
+    def close(self):
+        self._conn.close()
+
+def parse_limit(params):
+    """Read the limit query parameter"""
+    raw = params.get('limit', str(DEFAULT_LIMIT))
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise ApiError(400, f"limit must be an integer, got {raw!r}")
+    if limit < 1 or limit > MAX_LIMIT:
+        raise ApiError(400, f"limit must be between 1 and {MAX_LIMIT}")
+    return limit
+
+def build_listing_query(endpoint, params):
+    """Return (sql, args, columns) for a filtered listing endpoint"""
+    spec = ENDPOINTS[endpoint]
+    clauses = []
+    args = []
+    for name, value in params.items():
+        if name == 'limit':
+            continue
+        if name == 'q' and endpoint == '/technologies':
+            continue
+        column = spec['filters'].get(name)
+        if column is None:
+            raise ApiError(400, f"Unknown filter '{name}' for {endpoint}")
+        clauses.append(f"{column} = ?")
+        args.append(value)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    sql = (f"SELECT {', '.join(spec['columns'])} FROM {spec['table']} {where} "
+           f"ORDER BY {spec['order']} LIMIT ?")
+    args.append(parse_limit(params))
+    return sql, args, spec['columns']
+
+def build_search_query(params):
+    """Return (sql, args, columns) for a ranked full-text search"""
+    keyword = params.get('q', '')
+    expression = ml_search_index.build_match_expression(keyword)
+    if not expression:
+        raise ApiError(400, "q must contain at least one search term")
+    return ml_search_index.SEARCH_QUERY, [expression, parse_limit(params)], SEARCH_COLUMNS
+
+def build_adoptions_query(params):
+    """Return (sql, args, columns) for technologies per year or quarter"""
+    bucket = params.get('bucket', 'quarter')
+    by = params.get('by', 'technology_type')
+    by = None if by == 'none' else by
+    filters = {}
+    for name, value in params.items():
+        if name in ('bucket', 'by'):
+            continue
+        keyword = ADOPTION_FILTERS.get(name)
+        if keyword is None:
+            raise ApiError(400, f"Unknown filter '{name}' for /stats/adoptions")
+        if keyword.endswith('_year'):
+            try:
+                value = int(value)
+            except ValueError:
+                raise ApiError(400, f"{name} must be an integer, got {value!r}")
+        filters[keyword] = value
+    try:
+        sql, args = ml_time_buckets.build_adoption_query(bucket, by, **filters)
+    except ValueError as error:
+        raise ApiError(400, str(error))
+    columns = ('period', by, 'technology_count') if by else ('period', 'technology_count')
+    return sql, args, columns
+
+def route(method, path, params, features):
+    """Map a request onto (sql, args, columns)"""
+    if method not in ('GET', 'HEAD'):
+        raise ApiError(405, f"{method} is not supported; the catalog API is read-only")
+    if path == '/search' or (path == '/technologies' and 'q' in params):
+        return build_search_query(params)
+    if path == '/stats/companies':
+        return query_ml_database.SUMMARY_COMPANY_STATS_QUERY, [], STATS_COLUMNS
+    if path == '/stats/technology-types':
+        return query_ml_database.SUMMARY_TECHNOLOGY_TYPE_STATS_QUERY, [], TYPE_STATS_COLUMNS
+    if path == '/stats/adoptions':
+        return build_adoptions_query(params)
+    if path in ENDPOINTS:
+        if ENDPOINTS[path]['table'] not in features['tables']:
+            raise ApiError(404, f"Table '{ENDPOINTS[path]['table']}' is not in this database")
+        return build_listing_query(path, params)
+    raise ApiError(404, f"No endpoint at {path}")
+
+class CatalogApi:
+    """asyncio HTTP/1.1 server answering catalog requests with streamed JSON"""
+
+    def __init__(self, database_path=query_ml_database.DATABASE_PATH,
+                 pool_size=DEFAULT_POOL_SIZE):
+        self.database_path = database_path
+        self.pool = ReadOnlyPool(database_path, pool_size)
+        self.version = DatabaseVersion(database_path)
+        self.features = self._detect_features()
+
+    def _detect_features(self):
+        conn = connect_read_only(self.database_path)
+        try:
+            tables = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')")}
+            return {'tables': tables}
+        finally:
+            conn.close()
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one client connection until it closes"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = await self.handle_request(request_line, headers, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, request_line, headers, writer):
+        """Answer one request; return whether the connection stays open"""
+        keep_alive = headers.get('connection', '').lower() != 'close'
+        try:
+            method, target, _ = request_line.decode('latin-1').split(' ', 2)
+        except ValueError:
+            await self.send_error(writer, ApiError(400, "Malformed request line"), False)
+            return False
+
+        url = urlsplit(target)
+        path = unquote(url.path).rstrip('/') or '/'
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        try:
+            sql, args, columns = route(method, path, params, self.features)
+        except ApiError as error:
+            await self.send_error(writer, error, keep_alive)
+            return keep_alive
+
+        etag = f'"{self.version.current()}"'
+        if etag in headers.get('if-none-match', ''):
+            self.write_head(writer, 304, {'ETag': etag}, keep_alive)
+            await writer.drain()
+            return keep_alive
+
+        conn = await self.pool.acquire()
+        try:
+            cursor = await self.pool.run(conn.execute, sql, args)
+            first_batch = await self.pool.run(cursor.fetchmany, STREAM_BATCH_SIZE)
+        except sqlite3.Error as error:
+            self.pool.release(conn)
+            await self.send_error(writer, ApiError(500, str(error)), keep_alive)
+            return keep_alive
+
+        try:
+            self.write_head(writer, 200, {
+                'Content-Type': 'application/json; charset=utf-8',
+                'Transfer-Encoding': 'chunked',
+                'ETag': etag,
+                'Cache-Control': 'no-cache',
+            }, keep_alive)
+            if method == 'HEAD':
+                return keep_alive
+            batch = first_batch
+            prefix = '['
+            while batch:
+                body = prefix + ','.join(
+                    json.dumps(dict(zip(columns, row)), ensure_ascii=False) for row in batch)
+                self.write_chunk(writer, body.encode('utf-8'))
+                await writer.drain()
+                prefix = ','
+                batch = await self.pool.run(cursor.fetchmany, STREAM_BATCH_SIZE)
+            self.write_chunk(writer, b'[]' if prefix == '[' else b']')
+            writer.write(b'0\r\n\r\n')
+            await writer.drain()
+        finally:
+            cursor.close()
+            self.pool.release(conn)
+        return keep_alive
+
+    def write_head(self, writer, status, headers, keep_alive):
+        """Write the status line and headers"""
+        lines = [f'HTTP/1.1 {status} {HTTP_REASONS[status]}']
+        headers = dict(headers)
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        lines.extend(f'{name}: {value}' for name, value in headers.items())
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+
+    def write_chunk(self, writer, data):
+        """Write one chunk of a chunked response body"""
+        writer.write(f'{len(data):X}\r\n'.encode('ascii') + data + b'\r\n')
+
+    async def send_error(self, writer, error, keep_alive):
+        """Send an ApiError as a JSON body"""
+        body = json.dumps({'error': error.message}).encode('utf-8')
+        self.write_head(writer, error.status, {
+            'Content-Type': 'application/json; charset=utf-8',
+            'Content-Length': str(len(body)),
+        }, keep_alive)
+        writer.write(body)
+        await writer.drain()
+
+    async def close(self):
+        """Release every database connection"""
+        await self.pool.close()
+        self.version.close()
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT,
+                database_path=query_ml_database.DATABASE_PATH, pool_size=DEFAULT_POOL_SIZE):
+    """Run the catalog API until cancelled"""
+    # The schema is brought up to date once; requests only ever read
+    ml_database_migrations.connect(database_path).close()
+    api = CatalogApi(database_path, pool_size)
+    server = await asyncio.start_server(api.handle_connection, host, port)
+    print(f"🚀 ML catalog API listening on http://{host}:{port}")
+    print(f"📁 Database: {database_path} (read-only, {pool_size} connections)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await api.close()
+
+def main():
+    """Parse arguments and run the catalog API"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--database', default=query_ml_database.DATABASE_PATH)
+    parser.add_argument('--pool-size', type=int, default=DEFAULT_POOL_SIZE)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.database, args.pool_size))
+    except KeyboardInterrupt:
+        print("\n✅ ML catalog API stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Script to build the equipment / flight control system compatibility links
+from the supported_software and supported_hardware lists and to answer
+compatibility questions from them
+"""
+
+import argparse
+import re
+
+import ml_database_migrations
+
+# The compatibility table, created by ml_database_migrations.py, holds one
+# row per (system, equipment) pair and the list it came from: 'software' when
+# the equipment lists the system in supported_software, 'hardware' when the
+# system's supported_hardware names the equipment
+
+REFRESH_CHUNK_SIZE = 50_000
+
+# "All PX4 and ArduPilot compatible hardware": everything linked to the
+# systems named
+COMPATIBLE_WITH_PATTERN = re.compile(r'^(?:all\s+)?(.+?)\s+compatible\s+(?:hardware|systems)$',
+                                     re.IGNORECASE)
+# "..., and other compatible hardware" adds nothing to match on
+FILLER_PATTERN = re.compile(r'^and\s+other\b', re.IGNORECASE)
+
+# Ends every name that starts with a given prefix and a space
+PREFIX_END = ' \U0010ffff'
+
+def has_compatibility_table(conn):
+    """Check whether the database already carries the compatibility links"""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'compatibility'"
+    ).fetchone() is not None
+
+def split_names(text):
+    """Split a comma-separated supported list into trimmed names"""
+    if not text:
+        return []
+    return [name.strip() for name in text.split(',') if name.strip()]
+
+def system_aliases(conn):
+    """Map casefolded system name -> id, including both halves of names
+    like 'ROS (Robot Operating System)'"""
+    aliases = {}
+    for system_id, name in conn.execute("SELECT id, name FROM flight_control_systems ORDER BY id"):
+        names = [name]
+        if name.endswith(')') and ' (' in name:
+            head, _, inner = name[:-1].partition(' (')
+            names += [head, inner]
+        for alias in names:
+            aliases.setdefault(alias.strip().casefold(), system_id)
+    return aliases
+
+def _link_software(conn, aliases, scope):
+    """Insert 'software' links for the equipment in scope; return the count"""
+    sql = "INSERT OR IGNORE INTO compatibility (system_id, equipment_id, via) VALUES (?, ?, 'software')"
+    where = "WHERE id IN (SELECT id FROM temp.compatibility_scope)" if scope else ''
+    cursor = conn.execute(f"SELECT id, supported_software FROM equipment {where}")
+    total = 0
+    while True:
+        rows = cursor.fetchmany(REFRESH_CHUNK_SIZE)
+        if not rows:
+            return total
+        links = [(aliases[name.casefold()], equipment_id)
+                 for equipment_id, text in rows
+                 for name in split_names(text) if name.casefold() in aliases]
+        conn.executemany(sql, links)
+        total += len(links)
+
+def _link_hardware(conn, aliases, scope):
+    """Insert 'hardware' links for the equipment in scope; return the count"""
+    def restrict(column):
+        return f"AND {column} IN (SELECT id FROM temp.compatibility_scope)" if scope else ''
+    insert = "INSERT OR IGNORE INTO compatibility (system_id, equipment_id, via) "
+    total = 0
+    for system_id, text in conn.execute(
+            "SELECT id, supported_hardware FROM flight_control_systems").fetchall():
+        for name in split_names(text):
+            if FILLER_PATTERN.match(name):
+                continue
+            match = COMPATIBLE_WITH_PATTERN.match(name)
+            if match:
+                systems = {aliases[alias.casefold()]
+                           for alias in re.split(r'\s+and\s+|\s*,\s*', match.group(1))
+                           if alias.casefold() in aliases} - {system_id}
+                # Only 'software' links, so the result does not depend on
+                # which system's hardware list is expanded first
+                for other in systems:
+                    total += conn.execute(f'''{insert}
+                        SELECT ?, equipment_id, 'hardware' FROM compatibility
+                        WHERE system_id = ? AND via = 'software' {restrict('equipment_id')}
+                    ''', (system_id, other)).rowcount
+                continue
+            # The exact name, names it prefixes ("Cube" -> "Cube Orange+"),
+            # or a manufacturer ("Holybro")
+            total += conn.execute(f'''{insert}
+                SELECT ?, e.id, 'hardware' FROM equipment e
+                WHERE e.name >= ? AND e.name < ? {restrict('e.id')}
+            ''', (system_id, name, name + PREFIX_END)).rowcount
+            total += conn.execute(f'''{insert}
+                SELECT ?, e.id, 'hardware' FROM equipment e
+                WHERE e.company_id = (SELECT id FROM companies WHERE company_name = ?) {restrict('e.id')}
+            ''', (system_id, name)).rowcount
+    return total
+
+def refresh_compatibility(conn, equipment_names=None):
+    """Rebuild the compatibility links; return (software, hardware) links written.
+
+    With ``equipment_names`` only those equipment rows are relinked, which
+    is what a write to equipment needs; a change to flight_control_systems
+    needs the full rebuild. Does not commit.
+    """
+    scope = equipment_names is not None
+    if scope:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS compatibility_scope (id INTEGER PRIMARY KEY)")
+        conn.execute("DELETE FROM temp.compatibility_scope")
+        conn.executemany("INSERT OR IGNORE INTO temp.compatibility_scope SELECT id FROM equipment "
+                         "WHERE name = ?", ((name,) for name in equipment_names))
+        conn.execute("DELETE FROM compatibility "
+                     "WHERE equipment_id IN (SELECT id FROM temp.compatibility_scope)")
+    else:
+        conn.execute("DELETE FROM compatibility")
+
+    aliases = system_aliases(conn)
+    software = _link_software(conn, aliases, scope)
+    hardware = _link_hardware(conn, aliases, scope)
+    return software, hardware
+
+def compatible_equipment_clause(systems):
+    """Return (sql condition, params) matching equipment compatible with every
+    named system: one primary key range per system, intersected"""
+    select = ('SELECT equipment_id FROM compatibility '
+              'WHERE system_id = (SELECT id FROM flight_control_systems WHERE name = ?)')
+    return f"id IN ({' INTERSECT '.join(select for _ in systems)})", list(systems)
+
+def compatible_systems(conn, equipment_name):
+    """Return (system name, via) for every system compatible with a piece of equipment"""
+    return conn.execute('''
+        SELECT s.name, group_concat(c.via, ', ')
+        FROM equipment e
+        JOIN compatibility c ON c.equipment_id = e.id
+        JOIN flight_control_systems s ON s.id = c.system_id
+        WHERE e.name = ?
+        GROUP BY s.id
+        ORDER BY s.name
+    ''', (equipment_name,)).fetchall()
+
+def unmatched_software(conn, limit=20):
+    """Return (name, equipment rows) for supported_software names matching no system"""
+    aliases = system_aliases(conn)
+    counts = {}
+    for (text,) in conn.execute("SELECT supported_software FROM equipment"):
+        for name in split_names(text):
+            if name.casefold() not in aliases:
+                counts[name] = counts.get(name, 0) + 1
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+def main():
+    """Rebuild the compatibility links and report what they cover"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database', default=ml_database_migrations.DATABASE_PATH)
+    parser.add_argument('--equipment', help='list the systems compatible with this equipment')
+    args = parser.parse_args()
+
+    print("🚀 Rebuilding equipment compatibility links...")
+
+    conn = ml_database_migrations.connect(args.database)
+    software, hardware = refresh_compatibility(conn)
+    conn.commit()
+    print(f"✅ {software} software links, {hardware} hardware links")
+
+    unmatched = unmatched_software(conn)
+    if unmatched:
+        print("\n⚠️  Supported software naming no flight control system:")
+        for name, count in unmatched:
+            print(f"   • {name}: {count} equipment rows")
+
+    if args.equipment:
+        print(f"\n🔗 COMPATIBLE WITH {args.equipment.upper()}:")
+        for name, via in compatible_systems(conn, args.equipment):
+            print(f"   • {name} ({via})")
+    conn.close()
+
+    print("\n🎉 Compatibility links rebuilt!")
+
+if __name__ == "__main__":
+    main()
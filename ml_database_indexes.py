@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Script to check that no query shipped with the query tools falls back to a
+full table scan
+"""
+
+import sys
+
+import ml_database_migrations
+import ml_equipment_specs
+import ml_search_index
+import ml_sensor_specs
+import ml_stack_configurator
+import ml_time_buckets
+import query_ml_database
+
+# The indexes are created by ml_database_migrations.py, each shaped after a
+# query in query_ml_database.py. The UNIQUE natural key
+# idx_ml_technologies_company_name also serves ALL_TECHNOLOGIES_QUERY ordering,
+# and idx_ml_technologies_company_date serves COMPANY_TECHNOLOGIES_QUERY. The
+# company and type statistics read the summary tables, whose indexes are
+# created with them
+
+def shipped_queries():
+    """Return (name, sql, params) for every query the tools run"""
+    return [
+        ('companies', query_ml_database.COMPANIES_QUERY, []),
+        ('company technologies', query_ml_database.COMPANY_TECHNOLOGIES_QUERY, ['DATAGOD']),
+        ('all technologies', query_ml_database.ALL_TECHNOLOGIES_QUERY, []),
+        ('technology categories', query_ml_database.CATEGORIES_QUERY, []),
+        ('search', ml_search_index.SEARCH_QUERY, ['anomaly', 10]),
+        ('summary company stats', query_ml_database.SUMMARY_COMPANY_STATS_QUERY, []),
+        ('summary technology type stats', query_ml_database.SUMMARY_TECHNOLOGY_TYPE_STATS_QUERY, []),
+        ('companies page', query_ml_database.COMPANIES_NEXT_PAGE, ['DATAGOD', 10]),
+        ('all technologies page', query_ml_database.ALL_TECHNOLOGIES_NEXT_PAGE,
+         ['DATAGOD', 'AI Agent Monitoring', 1, 10]),
+        ('company technologies page', query_ml_database.COMPANY_TECHNOLOGIES_NEXT_PAGE,
+         ['DATAGOD', '2024-01-01', 1, 10]),
+        ('company technologies undated page', query_ml_database.COMPANY_TECHNOLOGIES_UNDATED_PAGE,
+         ['DATAGOD', 1, 10]),
+        ('categories page', query_ml_database.CATEGORIES_NEXT_PAGE, ['Clustering', 10]),
+        ('summary company stats page', query_ml_database.SUMMARY_COMPANY_STATS_PAGE, ['DATAGOD', 10]),
+        ('search page', ml_search_index.SEARCH_PAGE, ['anomaly', 0, 10]),
+        ('parametric equipment',
+         *ml_equipment_specs.build_search_query(20, min_clock_mhz=400, min_pwm_outputs=16)),
+        ('equipment in budget, cheapest first',
+         *ml_equipment_specs.build_search_query(20, True, budget_min_cents=10000,
+                                                budget_max_cents=40000)),
+        ('equipment compatible with PX4 and QGroundControl under $300',
+         *ml_equipment_specs.build_search_query(20, compatible_with=('PX4', 'QGroundControl'),
+                                                budget_max_cents=30000)),
+        ('low-power IMUs', *ml_sensor_specs.build_search_query(
+            20, sensor_type='IMU', max_current_amps=0.005)),
+        ('sensors under 1 mA', *ml_sensor_specs.build_search_query(20, max_current_amps=0.001)),
+        ('barometers covering sea level',
+         *ml_sensor_specs.build_search_query(20, range_unit='Pa', range_high=110000)),
+        ('rangefinders accurate to 2 cm',
+         *ml_sensor_specs.build_search_query(20, accuracy_unit='m', max_accuracy=0.02)),
+        ('cheapest compatible flight controllers', ml_stack_configurator.candidate_sql('equipment'),
+         {'category': 'Flight Controller', 'system': 1, 'limit': 5}),
+        ('fastest compatible flight controllers',
+         ml_stack_configurator.candidate_sql('equipment', 'clock_mhz', 'higher', ranked=True),
+         {'category': 'Flight Controller', 'system': 1, 'limit': -1}),
+        ('unranked flight controllers',
+         ml_stack_configurator.candidate_sql('equipment', 'clock_mhz', 'higher'),
+         {'category': 'Flight Controller', 'system': 1, 'limit': 5}),
+        ('lowest-draw barometers', ml_stack_configurator.candidate_sql('sensors'),
+         {'category': 'Barometer', 'limit': 5}),
+        ('most accurate barometers',
+         ml_stack_configurator.candidate_sql('sensors', 'accuracy_value', 'lower', 'Pa', True),
+         {'category': 'Barometer', 'unit': 'Pa', 'limit': -1}),
+        ('unranked barometers',
+         ml_stack_configurator.candidate_sql('sensors', 'accuracy_value', 'lower', 'Pa'),
+         {'category': 'Barometer', 'unit': 'Pa', 'limit': 5}),
+        ('widest-range IMUs',
+         ml_stack_configurator.candidate_sql('sensors', 'range_max', 'higher', 'rad/s', True),
+         {'category': 'IMU', 'unit': 'rad/s', 'limit': -1}),
+        ('unranked IMUs',
+         ml_stack_configurator.candidate_sql('sensors', 'range_max', 'higher', 'rad/s'),
+         {'category': 'IMU', 'unit': 'rad/s', 'limit': 5}),
+        ('adoptions per quarter by type since 2020',
+         *ml_time_buckets.build_adoption_query(start_year=2020)),
+        ('company adoptions per year',
+         *ml_time_buckets.build_adoption_query('year', None, company_name='DATAGOD')),
+        ('technologies implemented between dates', ml_time_buckets.TECHNOLOGIES_BETWEEN,
+         [19723, 20088, 10]),
+    ]
+
+def is_table_scan(detail):
+    """Tell whether an EXPLAIN QUERY PLAN step reads a table without an index"""
+    if not detail.startswith('SCAN '):
+        return False
+    return 'USING' not in detail and 'VIRTUAL TABLE' not in detail and 'CONSTANT ROW' not in detail
+
+def check_query_plans(conn, queries=None):
+    """Return (name, plan step) for every shipped query step that scans a table"""
+    failures = []
+    for name, sql, params in queries or shipped_queries():
+        for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params):
+            detail = row[3]
+            if is_table_scan(detail):
+                failures.append((name, detail))
+    return failures
+
+def main():
+    """Bring the database up to date and fail if any shipped query scans a table"""
+    print("🚀 Checking ML technologies query plans...")
+
+    conn = ml_database_migrations.connect('/home/vovkes/DATADOG/ml_technologies.db')
+    print("✅ Schema, indexes, search index and summary tables up to date")
+
+    failures = check_query_plans(conn)
+    conn.close()
+
+    if failures:
+        print("\n❌ Queries still scanning a table:")
+        for name, detail in failures:
+            print(f"   • {name}: {detail}")
+        sys.exit(1)
+
+    print("\n🎉 Every shipped query uses an index!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1080 @@
+#!/usr/bin/env python3
+"""
+Versioned schema migrations for the ML technologies database, tracked in
+PRAGMA user_version
+"""
+
+import sqlite3
+
+import ml_compatibility
+import ml_equipment_specs
+import ml_sensor_specs
+import ml_time_buckets
+
+DATABASE_PATH = '/home/vovkes/DATADOG/ml_technologies.db'
+
+CATALOG_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS ml_technologies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_name TEXT NOT NULL,
+        technology_name TEXT NOT NULL,
+        technology_type TEXT,
+        application_area TEXT,
+        description TEXT,
+        implementation_date DATE,
+        source TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS companies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_name TEXT UNIQUE NOT NULL,
+        industry TEXT,
+        country TEXT,
+        founded_year INTEGER,
+        description TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS technology_categories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_name TEXT UNIQUE NOT NULL,
+        description TEXT
+    )
+    ''',
+)
+
+EQUIPMENT_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS equipment (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        manufacturer TEXT,
+        category TEXT,
+        description TEXT,
+        specifications TEXT,
+        supported_software TEXT,
+        price_range TEXT,
+        availability TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS flight_control_systems (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT,
+        description TEXT,
+        features TEXT,
+        supported_hardware TEXT,
+        open_source BOOLEAN,
+        community_support TEXT,
+        documentation_url TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS sensors (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT,
+        manufacturer TEXT,
+        description TEXT,
+        specifications TEXT,
+        accuracy TEXT,
+        range TEXT,
+        power_consumption TEXT,
+        interface TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+)
+
+def _columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+def _table_exists(conn, table):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+def _execute_all(conn, statements):
+    for statement in statements:
+        conn.execute(statement)
+
+def _add_columns(conn, table, columns):
+    existing = _columns(conn, table)
+    for name, kind in columns:
+        if name not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {kind}")
+
+def _adoption_key(row):
+    """SQL (year, quarter, condition) for a technology row's implementation_date.
+    The modifier makes date() roll impossible dates such as 2024-02-30 over,
+    so comparing it with the text keeps only valid ones"""
+    date = f'{row}.implementation_date'
+    return (f"CAST(strftime('%Y', {date}) AS INTEGER)",
+            f"(CAST(strftime('%m', {date}) AS INTEGER) + 2) / 3",
+            f"date({date}, '+0 days') = {date} AND {row}.category_id IS NOT NULL")
+
+def _adoption_up(row):
+    """Trigger step adding one technology to its adoption_summary bucket"""
+    year, quarter, valid = _adoption_key(row)
+    return f'''
+        INSERT INTO adoption_summary (year, quarter, category_id, company_name, technology_count)
+        SELECT {year}, {quarter}, {row}.category_id, {row}.company_name, 1 WHERE {valid}
+        ON CONFLICT (year, quarter, category_id, company_name)
+        DO UPDATE SET technology_count = technology_count + 1;'''
+
+def _adoption_down(row):
+    """Trigger steps removing one technology from its adoption_summary bucket"""
+    year, quarter, valid = _adoption_key(row)
+    bucket = (f"year = {year} AND quarter = {quarter} AND category_id = {row}.category_id "
+              f"AND company_name = {row}.company_name AND {valid}")
+    return f'''
+        UPDATE adoption_summary SET technology_count = technology_count - 1 WHERE {bucket};
+        DELETE FROM adoption_summary WHERE {bucket} AND technology_count <= 0;'''
+
+def _count_up(table, column, value):
+    """Trigger step adding one technology to a per-value summary row"""
+    return f'''
+        INSERT INTO {table} ({column}, technology_count)
+        SELECT {value}, 1 WHERE {value} IS NOT NULL
+        ON CONFLICT ({column}) DO UPDATE SET technology_count = technology_count + 1;'''
+
+def _count_down(table, column, value):
+    """Trigger steps removing one technology from a per-value summary row"""
+    return f'''
+        UPDATE {table} SET technology_count = technology_count - 1 WHERE {column} = {value};
+        DELETE FROM {table} WHERE {column} = {value} AND technology_count <= 0;'''
+
+def _technology_added(row):
+    """Trigger steps for a technology row entering the catalog"""
+    return (
+        _count_up('technology_type_summary', 'category_id', f'{row}.category_id')
+        + _count_up('application_area_summary', 'application_area_id', f'{row}.application_area_id')
+        + _adoption_up(row)
+    )
+
+def _technology_removed(row):
+    """Trigger steps for a technology row leaving the catalog"""
+    return (
+        _count_down('technology_type_summary', 'category_id', f'{row}.category_id')
+        + _count_down('application_area_summary', 'application_area_id', f'{row}.application_area_id')
+        + _adoption_down(row)
+    )
+
+def _company_count(company_id, change):
+    """Trigger steps adding change to a company's and its country's counts"""
+    return f'''
+        UPDATE country_summary SET technology_count = technology_count {change}
+        WHERE country = (SELECT country FROM company_summary WHERE company_id = {company_id});
+        UPDATE company_summary SET technology_count = technology_count {change}
+        WHERE company_id = {company_id};'''
+
+def _recount_country(country):
+    """Trigger steps rebuilding one country_summary row from company_summary"""
+    return f'''
+        DELETE FROM country_summary WHERE country = {country};
+        INSERT INTO country_summary (country, company_count, technology_count)
+        SELECT country, COUNT(*), SUM(technology_count) FROM company_summary
+        WHERE country = {country}
+        GROUP BY country;'''
+
+def _company_removed(row):
+    """Trigger steps dropping a company row from the summaries"""
+    return (
+        f'''
+        DELETE FROM company_summary WHERE company_id = {row}.id;'''
+        + _recount_country(f'{row}.country')
+    )
+
+def _company_added(row):
+    """Trigger steps adding a company row with its technologies counted afresh"""
+    return (
+        f'''
+        INSERT INTO company_summary (company_id, company_name, industry, country, technology_count)
+        VALUES ({row}.id, {row}.company_name, {row}.industry, {row}.country,
+                (SELECT COUNT(*) FROM ml_technologies WHERE company_id = {row}.id));'''
+        + _recount_country(f'{row}.country')
+    )
+
+# Trigger name -> DDL keeping the summary tables of ml_database_summary.py in
+# step with the base tables. company_id is usually set by a later UPDATE from
+# the company lookup triggers, which the company_id update trigger counts. A
+# company's summary row is only adjusted while it exists; the companies
+# triggers count its technologies afresh, so neither depends on the order the
+# triggers fire in
+SUMMARY_TRIGGER_SCHEMA = {
+    'ml_technologies_summary_insert': f'''
+    CREATE TRIGGER IF NOT EXISTS ml_technologies_summary_insert
+    AFTER INSERT ON ml_technologies BEGIN{_technology_added('new')}
+    END
+    ''',
+    'ml_technologies_summary_delete': f'''
+    CREATE TRIGGER IF NOT EXISTS ml_technologies_summary_delete
+    AFTER DELETE ON ml_technologies BEGIN{_technology_removed('old')}
+    END
+    ''',
+    'ml_technologies_summary_update': f'''
+    CREATE TRIGGER IF NOT EXISTS ml_technologies_summary_update
+    AFTER UPDATE OF company_name, category_id, application_area_id, implementation_date
+    ON ml_technologies
+    BEGIN{_technology_removed('old')}{_technology_added('new')}
+    END
+    ''',
+    'ml_technologies_company_summary_insert': f'''
+    CREATE TRIGGER IF NOT EXISTS ml_technologies_company_summary_insert
+    AFTER INSERT ON ml_technologies WHEN new.company_id IS NOT NULL
+    BEGIN{_company_count('new.company_id', '+ 1')}
+    END
+    ''',
+    'ml_technologies_company_summary_delete': f'''
+    CREATE TRIGGER IF NOT EXISTS ml_technologies_company_summary_delete
+    AFTER DELETE ON ml_technologies WHEN old.company_id IS NOT NULL
+    BEGIN{_company_count('old.company_id', '- 1')}
+    END
+    ''',
+    'ml_technologies_company_summary_update': f'''
+    CREATE TRIGGER IF NOT EXISTS ml_technologies_company_summary_update
+    AFTER UPDATE OF company_id ON ml_technologies
+    BEGIN{_company_count('old.company_id', '- 1')}{_company_count('new.company_id', '+ 1')}
+    END
+    ''',
+    'companies_summary_insert': f'''
+    CREATE TRIGGER IF NOT EXISTS companies_summary_insert
+    AFTER INSERT ON companies BEGIN{_company_added('new')}
+    END
+    ''',
+    'companies_summary_delete': f'''
+    CREATE TRIGGER IF NOT EXISTS companies_summary_delete
+    AFTER DELETE ON companies BEGIN{_company_removed('old')}
+    END
+    ''',
+    'companies_summary_update': f'''
+    CREATE TRIGGER IF NOT EXISTS companies_summary_update
+    AFTER UPDATE OF id, company_name, industry, country ON companies
+    BEGIN{_company_removed('old')}{_company_added('new')}
+    END
+    ''',
+}
+
+def _drop_summary_triggers(conn):
+    for name in SUMMARY_TRIGGER_SCHEMA:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+def create_summary_triggers(conn):
+    """Replace the summary triggers with SUMMARY_TRIGGER_SCHEMA"""
+    _drop_summary_triggers(conn)
+    _execute_all(conn, SUMMARY_TRIGGER_SCHEMA.values())
+
+# Each step below holds the DDL its version shipped with, so replaying an old
+# version always builds the schema that version had. A change to the schema
+# is a new migration, never an edit to an existing step; steps call into the
+# other modules only to backfill data.
+#
+# The summary triggers are the one exception. They read the latest schema, so
+# a step that reshapes or refills the summary tables drops them, and migrate()
+# installs SUMMARY_TRIGGER_SCHEMA together with the latest version
+
+def _catalog_tables(conn):
+    _execute_all(conn, CATALOG_SCHEMA)
+
+def _equipment_tables(conn):
+    _execute_all(conn, EQUIPMENT_SCHEMA)
+    # Databases created before sensors carried a description
+    if 'description' not in _columns(conn, 'sensors'):
+        conn.execute("ALTER TABLE sensors ADD COLUMN description TEXT")
+
+def _natural_keys(conn):
+    # Rows duplicated by earlier non-idempotent loads are removed first,
+    # keeping the oldest copy, so the UNIQUE indexes can be built
+    for table, key, index in (
+            ('companies', 'company_name', None),
+            ('technology_categories', 'category_name', None),
+            ('ml_technologies', 'company_name, technology_name', 'idx_ml_technologies_company_name'),
+            ('equipment', 'name', 'idx_equipment_name'),
+            ('flight_control_systems', 'name', 'idx_flight_control_systems_name'),
+            ('sensors', 'name', 'idx_sensors_name')):
+        if not _table_exists(conn, table):
+            continue
+        _add_columns(conn, table, (('content_hash', 'TEXT'),))
+        if index is None or any(row[1] == index and row[2]
+                                for row in conn.execute(f"PRAGMA index_list({table})")):
+            continue
+        conn.execute(f"DELETE FROM {table} WHERE id NOT IN (SELECT MIN(id) FROM {table} GROUP BY {key})")
+        conn.execute(f"DROP INDEX IF EXISTS {index}")
+        conn.execute(f"CREATE UNIQUE INDEX {index} ON {table} ({key})")
+
+def _secondary_indexes(conn):
+    _execute_all(conn, (
+        '''
+        CREATE INDEX IF NOT EXISTS idx_ml_technologies_company_date
+        ON ml_technologies (company_name, implementation_date)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_ml_technologies_type
+        ON ml_technologies (technology_type)
+        ''',
+    ))
+
+def _search_index(conn):
+    existed = _table_exists(conn, 'ml_technologies_fts')
+    _execute_all(conn, (
+        '''
+        CREATE VIRTUAL TABLE IF NOT EXISTS ml_technologies_fts USING fts5(
+            technology_name,
+            description,
+            application_area,
+            content='ml_technologies',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS ml_technologies_fts_insert
+        AFTER INSERT ON ml_technologies BEGIN
+            INSERT INTO ml_technologies_fts (rowid, technology_name, description, application_area)
+            VALUES (new.id, new.technology_name, new.description, new.application_area);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS ml_technologies_fts_delete
+        AFTER DELETE ON ml_technologies BEGIN
+            INSERT INTO ml_technologies_fts (ml_technologies_fts, rowid, technology_name, description, application_area)
+            VALUES ('delete', old.id, old.technology_name, old.description, old.application_area);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS ml_technologies_fts_update
+        AFTER UPDATE OF id, technology_name, description, application_area ON ml_technologies BEGIN
+            INSERT INTO ml_technologies_fts (ml_technologies_fts, rowid, technology_name, description, application_area)
+            VALUES ('delete', old.id, old.technology_name, old.description, old.application_area);
+            INSERT INTO ml_technologies_fts (rowid, technology_name, description, application_area)
+            VALUES (new.id, new.technology_name, new.description, new.application_area);
+        END
+        ''',
+    ))
+    if not existed:
+        conn.execute("INSERT INTO ml_technologies_fts (ml_technologies_fts) VALUES ('rebuild')")
+
+def _summary_tables(conn):
+    tables = ('company_summary', 'technology_type_summary', 'application_area_summary',
+              'country_summary')
+    existed = all(_table_exists(conn, table) for table in tables)
+    _drop_summary_triggers(conn)
+    _execute_all(conn, (
+        '''
+        CREATE TABLE IF NOT EXISTS company_summary (
+            company_name TEXT PRIMARY KEY,
+            industry TEXT,
+            country TEXT,
+            listed INTEGER NOT NULL DEFAULT 0,
+            technology_count INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_company_summary_count
+        ON company_summary (listed, technology_count DESC, company_name, industry)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_company_summary_country
+        ON company_summary (country, listed)
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS technology_type_summary (
+            technology_type TEXT PRIMARY KEY,
+            technology_count INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_technology_type_summary_count
+        ON technology_type_summary (technology_count DESC, technology_type)
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS application_area_summary (
+            application_area TEXT PRIMARY KEY,
+            technology_count INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_application_area_summary_count
+        ON application_area_summary (technology_count DESC, application_area)
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS country_summary (
+            country TEXT PRIMARY KEY,
+            company_count INTEGER NOT NULL DEFAULT 0,
+            technology_count INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+    ))
+    if existed:
+        return
+    for table in tables:
+        conn.execute(f"DELETE FROM {table}")
+    _execute_all(conn, (
+        '''
+        INSERT INTO company_summary
+        SELECT names.company_name, c.industry, c.country,
+               c.id IS NOT NULL AS listed,
+               (SELECT COUNT(*) FROM ml_technologies mt
+                WHERE mt.company_name = names.company_name) AS technology_count
+        FROM (SELECT company_name FROM companies
+              UNION SELECT company_name FROM ml_technologies) names
+        LEFT JOIN companies c ON c.company_name = names.company_name
+        ''',
+        '''
+        INSERT INTO technology_type_summary
+        SELECT technology_type, COUNT(*) FROM ml_technologies
+        WHERE technology_type IS NOT NULL
+        GROUP BY technology_type
+        ''',
+        '''
+        INSERT INTO application_area_summary
+        SELECT application_area, COUNT(*) FROM ml_technologies
+        WHERE application_area IS NOT NULL
+        GROUP BY application_area
+        ''',
+        '''
+        INSERT INTO country_summary
+        SELECT c.country, COUNT(DISTINCT c.id), COUNT(mt.id) FROM companies c
+        LEFT JOIN ml_technologies mt ON mt.company_name = c.company_name
+        WHERE c.country IS NOT NULL
+        GROUP BY c.country
+        ''',
+    ))
+
+def _tombstones(conn):
+    # Rows removed by a delta import, kept so consumers can see what
+    # disappeared. A tombstone is cleared when its natural key is inserted again
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS tombstones (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            natural_key TEXT NOT NULL,
+            content_hash TEXT,
+            row TEXT,
+            deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (table_name, natural_key)
+        )
+    ''')
+    for table, key in (
+            ('companies', 'new.company_name'),
+            ('technology_categories', 'new.category_name'),
+            ('ml_technologies', 'new.company_name, new.technology_name'),
+            ('equipment', 'new.name'),
+            ('flight_control_systems', 'new.name'),
+            ('sensors', 'new.name')):
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_tombstone_clear
+            AFTER INSERT ON {table} BEGIN
+                DELETE FROM tombstones
+                WHERE table_name = '{table}' AND natural_key = json_array({key});
+            END
+        ''')
+
+def _add_references(conn, references):
+    """Add, resolve, index and maintain (table, text column, id column, lookup
+    table, lookup text column) references the way versions 8 and 9 did, with
+    a value missing from the lookup table registered there"""
+    for table, column, id_column, lookup, lookup_column in references:
+        if id_column not in _columns(conn, table):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {id_column} INTEGER REFERENCES {lookup} (id)")
+        conn.execute(f'''
+            INSERT INTO {lookup} ({lookup_column})
+            SELECT DISTINCT {column} FROM {table}
+            WHERE {column} IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM {lookup} l WHERE l.{lookup_column} = {table}.{column})
+        ''')
+        resolved = f"(SELECT id FROM {lookup} l WHERE l.{lookup_column} = {table}.{column})"
+        conn.execute(f"UPDATE {table} SET {id_column} = {resolved} WHERE {id_column} IS NOT {resolved}")
+    for table, column, id_column, lookup, lookup_column in references:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{id_column} ON {table} ({id_column})")
+    for table, column, id_column, lookup, lookup_column in references:
+        name = f"{table}_{id_column[:-len('_id')]}"
+        steps = f'''
+                INSERT INTO {lookup} ({lookup_column})
+                SELECT new.{column}
+                WHERE new.{column} IS NOT NULL
+                  AND NOT EXISTS (SELECT 1 FROM {lookup} WHERE {lookup_column} = new.{column});
+                UPDATE {table} SET {id_column} = (SELECT id FROM {lookup} WHERE {lookup_column} = new.{column})
+                WHERE id = new.id;'''
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {name}_insert
+            AFTER INSERT ON {table} WHEN new.{column} IS NOT NULL
+            BEGIN{steps}
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {name}_update
+            AFTER UPDATE OF {column} ON {table}
+            BEGIN{steps}
+            END
+        ''')
+
+def _company_references(conn):
+    _add_references(conn, (
+        ('ml_technologies', 'company_name', 'company_id', 'companies', 'company_name'),
+        ('equipment', 'manufacturer', 'company_id', 'companies', 'company_name'),
+        ('sensors', 'manufacturer', 'company_id', 'companies', 'company_name'),
+    ))
+
+def _lookup_references(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS application_areas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            application_area TEXT UNIQUE NOT NULL
+        )
+    ''')
+    _add_references(conn, (
+        ('ml_technologies', 'technology_type', 'category_id', 'technology_categories',
+         'category_name'),
+        ('ml_technologies', 'application_area', 'application_area_id', 'application_areas',
+         'application_area'),
+    ))
+    conn.execute('''
+        CREATE VIEW IF NOT EXISTS ml_technologies_labeled AS
+        SELECT mt.id, c.company_name, mt.technology_name, tc.category_name AS technology_type,
+               aa.application_area, mt.description, mt.implementation_date, mt.source,
+               mt.company_id, mt.category_id, mt.application_area_id
+        FROM ml_technologies mt
+        LEFT JOIN companies c ON c.id = mt.company_id
+        LEFT JOIN technology_categories tc ON tc.id = mt.category_id
+        LEFT JOIN application_areas aa ON aa.id = mt.application_area_id
+    ''')
+
+def _equipment_specs(conn):
+    _add_columns(conn, 'equipment', (
+        ('processor_family', 'TEXT'),
+        ('clock_mhz', 'REAL'),
+        ('flash_bytes', 'INTEGER'),
+        ('ram_bytes', 'INTEGER'),
+        ('pwm_outputs', 'INTEGER'),
+        ('input_min_volts', 'REAL'),
+        ('input_max_volts', 'REAL'),
+        ('ai_tops', 'REAL'),
+    ))
+    ml_equipment_specs.backfill_specifications(conn)
+    # Columns parametric searches range over; each gets its own index
+    for column in ('processor_family', 'clock_mhz', 'flash_bytes', 'ram_bytes', 'pwm_outputs',
+                   'ai_tops'):
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_equipment_{column} ON equipment ({column})")
+
+def _equipment_prices(conn):
+    _add_columns(conn, 'equipment', (('price_min_cents', 'INTEGER'), ('price_max_cents', 'INTEGER')))
+    ml_equipment_specs.backfill_prices(conn)
+    # Serves budget overlap filters (price_min_cents <= ?, with price_max_cents
+    # checked from the index) and cheapest-first ordering
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_equipment_price
+        ON equipment (price_min_cents, price_max_cents)
+    ''')
+
+def _compatibility(conn):
+    _execute_all(conn, (
+        '''
+        CREATE TABLE IF NOT EXISTS compatibility (
+            system_id INTEGER NOT NULL REFERENCES flight_control_systems (id) ON DELETE CASCADE,
+            equipment_id INTEGER NOT NULL REFERENCES equipment (id) ON DELETE CASCADE,
+            via TEXT NOT NULL,
+            PRIMARY KEY (system_id, equipment_id, via)
+        ) WITHOUT ROWID
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_compatibility_equipment
+        ON compatibility (equipment_id, system_id)
+        ''',
+    ))
+    ml_compatibility.refresh_compatibility(conn)
+
+def _duplicate_review(conn):
+    # One duplicate_candidates row per member of a candidate cluster;
+    # cluster_id is the cluster's smallest row id and similarity the estimated
+    # Jaccard similarity to it. Reviewers set status to 'duplicate' or
+    # 'distinct'; reruns of ml_near_duplicates.py only touch 'pending' rows
+    _execute_all(conn, (
+        '''
+        CREATE TABLE IF NOT EXISTS minhash_signatures (
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            content_hash TEXT,
+            signature BLOB NOT NULL,
+            PRIMARY KEY (table_name, row_id)
+        ) WITHOUT ROWID
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS duplicate_candidates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            cluster_id INTEGER NOT NULL,
+            row_id INTEGER NOT NULL,
+            similarity REAL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (table_name, row_id)
+        )
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_duplicate_candidates_cluster
+        ON duplicate_candidates (table_name, cluster_id)
+        ''',
+    ))
+
+def _adoption_rollups(conn):
+    _add_columns(conn, 'ml_technologies', (('implementation_day', 'INTEGER'),))
+    ml_time_buckets.backfill_days(conn)
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_ml_technologies_day
+        ON ml_technologies (implementation_day)
+    ''')
+    # A technology's bucket is the year and quarter of a valid YYYY-MM-DD
+    # implementation_date: date() rolls impossible dates over
+    _drop_summary_triggers(conn)
+    _execute_all(conn, (
+        '''
+        CREATE TABLE IF NOT EXISTS adoption_summary (
+            year INTEGER NOT NULL,
+            quarter INTEGER NOT NULL,
+            technology_type TEXT NOT NULL,
+            company_name TEXT NOT NULL,
+            technology_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (year, quarter, technology_type, company_name)
+        ) WITHOUT ROWID
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_adoption_summary_company
+        ON adoption_summary (company_name, year, quarter)
+        ''',
+    ))
+    conn.execute("DELETE FROM adoption_summary")
+    conn.execute('''
+        INSERT INTO adoption_summary
+        SELECT CAST(strftime('%Y', implementation_date) AS INTEGER),
+               (CAST(strftime('%m', implementation_date) AS INTEGER) + 2) / 3,
+               technology_type, company_name, COUNT(*)
+        FROM ml_technologies
+        WHERE date(implementation_date, '+0 days') = implementation_date
+          AND technology_type IS NOT NULL
+        GROUP BY 1, 2, technology_type, company_name
+    ''')
+
+def _sensor_specs(conn):
+    _add_columns(conn, 'sensors', (
+        ('supply_volts', 'REAL'),
+        ('current_amps', 'REAL'),
+        ('power_watts', 'REAL'),
+        ('range_min', 'REAL'),
+        ('range_max', 'REAL'),
+        ('range_unit', 'TEXT'),
+        ('accuracy_value', 'REAL'),
+        ('accuracy_unit', 'TEXT'),
+    ))
+    ml_sensor_specs.backfill_sensors(conn)
+    _execute_all(conn, (
+        # Power budgets: "IMUs drawing at most 5 mA", cheapest draw first
+        '''
+        CREATE INDEX IF NOT EXISTS idx_sensors_type_current
+        ON sensors (type, current_amps)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_sensors_current
+        ON sensors (current_amps)
+        ''',
+        # Range and accuracy filters always name the SI unit they compare in
+        '''
+        CREATE INDEX IF NOT EXISTS idx_sensors_range
+        ON sensors (range_unit, range_min, range_max)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_sensors_accuracy
+        ON sensors (accuracy_unit, accuracy_value)
+        ''',
+    ))
+
+def _stack_indexes(conn):
+    # Each candidate walk of ml_stack_configurator.py reads one of these in order
+    _execute_all(conn, (
+        '''
+        CREATE INDEX IF NOT EXISTS idx_equipment_category_price
+        ON equipment (category, price_min_cents)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_equipment_category_clock
+        ON equipment (category, clock_mhz DESC, price_min_cents)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_sensors_type_accuracy
+        ON sensors (type, accuracy_unit, accuracy_value, current_amps)
+        ''',
+    ))
+
+def _company_lookups(conn):
+    # Versions 8 to 16 registered a bare companies row for every unknown
+    # company name or manufacturer. company_id now only points at companies
+    # that were loaded: it stays NULL until a row with that name arrives, and
+    # goes back to NULL when the company is deleted
+    references = (('ml_technologies', 'company_name'), ('equipment', 'manufacturer'),
+                  ('sensors', 'manufacturer'))
+    for table, column in references:
+        conn.execute(f"DROP TRIGGER IF EXISTS {table}_company_insert")
+        conn.execute(f"DROP TRIGGER IF EXISTS {table}_company_update")
+        lookup = f'''
+                UPDATE {table} SET company_id = (SELECT id FROM companies WHERE company_name = new.{column})
+                WHERE id = new.id;'''
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_company_insert
+            AFTER INSERT ON {table} WHEN new.{column} IS NOT NULL
+            BEGIN{lookup}
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_company_update
+            AFTER UPDATE OF {column} ON {table}
+            BEGIN{lookup}
+            END
+        ''')
+    # The companies triggers below find a company's rows by name
+    _execute_all(conn, (
+        '''
+        CREATE INDEX IF NOT EXISTS idx_equipment_manufacturer
+        ON equipment (manufacturer)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_sensors_manufacturer
+        ON sensors (manufacturer)
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS companies_reference_insert
+        AFTER INSERT ON companies BEGIN
+            UPDATE ml_technologies SET company_id = new.id WHERE company_name = new.company_name;
+            UPDATE equipment SET company_id = new.id WHERE manufacturer = new.company_name;
+            UPDATE sensors SET company_id = new.id WHERE manufacturer = new.company_name;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS companies_reference_update
+        AFTER UPDATE OF id, company_name ON companies BEGIN
+            UPDATE ml_technologies SET company_id = NULL WHERE company_id = old.id;
+            UPDATE equipment SET company_id = NULL WHERE company_id = old.id;
+            UPDATE sensors SET company_id = NULL WHERE company_id = old.id;
+            UPDATE ml_technologies SET company_id = new.id WHERE company_name = new.company_name;
+            UPDATE equipment SET company_id = new.id WHERE manufacturer = new.company_name;
+            UPDATE sensors SET company_id = new.id WHERE manufacturer = new.company_name;
+        END
+        ''',
+        # Acts as ON DELETE SET NULL, which ALTER TABLE cannot add to the
+        # existing company_id columns. The NO ACTION foreign key is checked
+        # at the end of the DELETE, after this has run
+        '''
+        CREATE TRIGGER IF NOT EXISTS companies_reference_delete
+        AFTER DELETE ON companies BEGIN
+            UPDATE ml_technologies SET company_id = NULL WHERE company_id = old.id;
+            UPDATE equipment SET company_id = NULL WHERE company_id = old.id;
+            UPDATE sensors SET company_id = NULL WHERE company_id = old.id;
+        END
+        ''',
+    ))
+    conn.execute('''
+        DELETE FROM companies
+        WHERE content_hash IS NULL AND industry IS NULL AND country IS NULL
+          AND founded_year IS NULL AND description IS NULL
+    ''')
+    for table, column in references:
+        conn.execute(f'''
+            UPDATE {table} SET company_id = (SELECT id FROM companies c WHERE c.company_name = {table}.{column})
+            WHERE company_id IS NOT (SELECT id FROM companies c WHERE c.company_name = {table}.{column})
+        ''')
+
+def _company_summary_ids(conn):
+    # company_summary moves from one row per company name to one row per
+    # companies row, keyed by id. Technologies count towards the company their
+    # company_id points at, so its counts follow company_id rather than the name
+    _drop_summary_triggers(conn)
+    conn.execute("DROP TABLE IF EXISTS company_summary")
+    _execute_all(conn, (
+        '''
+        CREATE TABLE IF NOT EXISTS company_summary (
+            company_id INTEGER PRIMARY KEY,
+            company_name TEXT NOT NULL,
+            industry TEXT,
+            country TEXT,
+            technology_count INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        # SUMMARY_COMPANY_STATS_QUERY ordering
+        '''
+        CREATE INDEX IF NOT EXISTS idx_company_summary_count
+        ON company_summary (technology_count DESC, company_name, industry)
+        ''',
+        # SUMMARY_COMPANY_STATS_PAGE keyset
+        '''
+        CREATE INDEX IF NOT EXISTS idx_company_summary_name
+        ON company_summary (company_name, industry, technology_count)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_company_summary_country
+        ON company_summary (country)
+        ''',
+    ))
+    conn.execute('''
+        INSERT INTO company_summary
+        SELECT c.id, c.company_name, c.industry, c.country,
+               (SELECT COUNT(*) FROM ml_technologies mt WHERE mt.company_id = c.id)
+        FROM companies c
+    ''')
+    conn.execute("DELETE FROM country_summary")
+    conn.execute('''
+        INSERT INTO country_summary
+        SELECT country, COUNT(*), SUM(technology_count) FROM company_summary
+        WHERE country IS NOT NULL
+        GROUP BY country
+    ''')
+
+def _lookup_ids(conn):
+    # technology_type and application_area are stored only as category_id and
+    # application_area_id; ml_technologies_labeled serves the text. Everything
+    # naming the text columns is dropped first, as DROP COLUMN requires
+    for action in ('insert', 'update'):
+        conn.execute(f"DROP TRIGGER IF EXISTS ml_technologies_category_{action}")
+        conn.execute(f"DROP TRIGGER IF EXISTS ml_technologies_application_area_{action}")
+    _drop_summary_triggers(conn)
+    for action in ('insert', 'delete', 'update'):
+        conn.execute(f"DROP TRIGGER IF EXISTS ml_technologies_fts_{action}")
+    for statement in (
+            "DROP INDEX IF EXISTS idx_ml_technologies_type",
+            "DROP VIEW IF EXISTS ml_technologies_labeled",
+            "DROP TABLE IF EXISTS ml_technologies_fts",
+            "DROP TABLE IF EXISTS technology_type_summary",
+            "DROP TABLE IF EXISTS application_area_summary",
+            "DROP TABLE IF EXISTS adoption_summary"):
+        conn.execute(statement)
+    for column, id_column, lookup, lookup_column in (
+            ('technology_type', 'category_id', 'technology_categories', 'category_name'),
+            ('application_area', 'application_area_id', 'application_areas', 'application_area')):
+        conn.execute(f'''
+            INSERT INTO {lookup} ({lookup_column})
+            SELECT DISTINCT {column} FROM ml_technologies
+            WHERE {column} IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM {lookup} l WHERE l.{lookup_column} = ml_technologies.{column})
+        ''')
+        resolved = f"(SELECT id FROM {lookup} l WHERE l.{lookup_column} = ml_technologies.{column})"
+        conn.execute(f"UPDATE ml_technologies SET {id_column} = {resolved} WHERE {id_column} IS NOT {resolved}")
+        conn.execute(f"ALTER TABLE ml_technologies DROP COLUMN {column}")
+    _execute_all(conn, (
+        '''
+        CREATE VIEW IF NOT EXISTS ml_technologies_labeled AS
+        SELECT mt.id, mt.company_name, mt.technology_name, tc.category_name AS technology_type,
+               aa.application_area, mt.description, mt.implementation_date, mt.source,
+               mt.company_id, mt.category_id, mt.application_area_id, mt.implementation_day,
+               mt.created_at, mt.content_hash
+        FROM ml_technologies mt
+        LEFT JOIN technology_categories tc ON tc.id = mt.category_id
+        LEFT JOIN application_areas aa ON aa.id = mt.application_area_id
+        ''',
+        # The search index reads its content through the view; the triggers
+        # look the application area up from its id
+        '''
+        CREATE VIRTUAL TABLE IF NOT EXISTS ml_technologies_fts USING fts5(
+            technology_name,
+            description,
+            application_area,
+            content='ml_technologies_labeled',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS ml_technologies_fts_insert
+        AFTER INSERT ON ml_technologies BEGIN
+            INSERT INTO ml_technologies_fts (rowid, technology_name, description, application_area)
+            VALUES (new.id, new.technology_name, new.description,
+                    (SELECT application_area FROM application_areas WHERE id = new.application_area_id));
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS ml_technologies_fts_delete
+        AFTER DELETE ON ml_technologies BEGIN
+            INSERT INTO ml_technologies_fts (ml_technologies_fts, rowid, technology_name, description, application_area)
+            VALUES ('delete', old.id, old.technology_name, old.description,
+                    (SELECT application_area FROM application_areas WHERE id = old.application_area_id));
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS ml_technologies_fts_update
+        AFTER UPDATE OF id, technology_name, description, application_area_id ON ml_technologies BEGIN
+            INSERT INTO ml_technologies_fts (ml_technologies_fts, rowid, technology_name, description, application_area)
+            VALUES ('delete', old.id, old.technology_name, old.description,
+                    (SELECT application_area FROM application_areas WHERE id = old.application_area_id));
+            INSERT INTO ml_technologies_fts (rowid, technology_name, description, application_area)
+            VALUES (new.id, new.technology_name, new.description,
+                    (SELECT application_area FROM application_areas WHERE id = new.application_area_id));
+        END
+        ''',
+        "INSERT INTO ml_technologies_fts (ml_technologies_fts) VALUES ('rebuild')",
+        '''
+        CREATE TABLE IF NOT EXISTS technology_type_summary (
+            category_id INTEGER PRIMARY KEY,
+            technology_count INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_technology_type_summary_count
+        ON technology_type_summary (technology_count DESC, category_id)
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS application_area_summary (
+            application_area_id INTEGER PRIMARY KEY,
+            technology_count INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_application_area_summary_count
+        ON application_area_summary (technology_count DESC, application_area_id)
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS adoption_summary (
+            year INTEGER NOT NULL,
+            quarter INTEGER NOT NULL,
+            category_id INTEGER NOT NULL,
+            company_name TEXT NOT NULL,
+            technology_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (year, quarter, category_id, company_name)
+        ) WITHOUT ROWID
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_adoption_summary_company
+        ON adoption_summary (company_name, year, quarter)
+        ''',
+        '''
+        INSERT INTO technology_type_summary
+        SELECT category_id, COUNT(*) FROM ml_technologies
+        WHERE category_id IS NOT NULL
+        GROUP BY category_id
+        ''',
+        '''
+        INSERT INTO application_area_summary
+        SELECT application_area_id, COUNT(*) FROM ml_technologies
+        WHERE application_area_id IS NOT NULL
+        GROUP BY application_area_id
+        ''',
+        '''
+        INSERT INTO adoption_summary
+        SELECT CAST(strftime('%Y', implementation_date) AS INTEGER),
+               (CAST(strftime('%m', implementation_date) AS INTEGER) + 2) / 3,
+               category_id, company_name, COUNT(*)
+        FROM ml_technologies
+        WHERE date(implementation_date, '+0 days') = implementation_date
+          AND category_id IS NOT NULL
+        GROUP BY 1, 2, category_id, company_name
+        ''',
+    ))
+
+def _stack_range_index(conn):
+    # IMUs rank on gyro range, widest first, then lowest draw
+    _execute_all(conn, (
+        '''
+        CREATE INDEX IF NOT EXISTS idx_sensors_type_range
+        ON sensors (type, range_unit, range_max DESC, current_amps)
+        ''',
+    ))
+
+# (version, description, step). Steps run inside the migration's transaction
+# and must not commit. Every step also tolerates a database whose tables were
+# created by the scripts before migrations existed (user_version 0)
+MIGRATIONS = (
+    (1, 'catalog tables', _catalog_tables),
+    (2, 'equipment, flight control system and sensor tables', _equipment_tables),
+    (3, 'natural keys and content hashes', _natural_keys),
+    (4, 'secondary indexes', _secondary_indexes),
+    (5, 'full-text search index', _search_index),
+    (6, 'summary tables', _summary_tables),
+    (7, 'delta import tombstones', _tombstones),
+    (8, 'company_id references to companies', _company_references),
+    (9, 'technology type and application area lookups', _lookup_references),
+    (10, 'typed equipment spec columns', _equipment_specs),
+    (11, 'equipment price columns in cents', _equipment_prices),
+    (12, 'equipment / flight control system compatibility links', _compatibility),
+    (13, 'near-duplicate signatures and review table', _duplicate_review),
+    (14, 'integer implementation days and adoption rollups', _adoption_rollups),
+    (15, 'SI sensor power, range and accuracy columns', _sensor_specs),
+    (16, 'autopilot stack candidate indexes', _stack_indexes),
+    (17, 'company_id looks companies up instead of registering them', _company_lookups),
+    (18, 'company_summary keyed on company_id', _company_summary_ids),
+    (19, 'technology types and application areas stored as ids only', _lookup_ids),
+    (20, 'autopilot stack IMU range index', _stack_range_index),
+)
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def schema_version(conn):
+    """Return the migration version a database is on"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(conn, target=LATEST_VERSION):
+    """Apply the pending migrations up to target; return the versions applied.
+
+    Each migration runs in its own IMMEDIATE transaction together with the
+    user_version bump, so a failure leaves the database on the previous
+    version and concurrent readers keep working between steps. An
+    up-to-date database costs one PRAGMA read. The summary tables are only
+    maintained once the latest version is reached.
+    """
+    if schema_version(conn) >= target:
+        return []
+
+    conn.commit()
+    applied = []
+    for version, _, step in MIGRATIONS:
+        if version > target:
+            break
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another connection may have applied it while we waited
+            if schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            step(conn)
+            if version == LATEST_VERSION:
+                create_summary_triggers(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        applied.append(version)
+    return applied
+
+def connect(database_path, **options):
+    """Open a database, bring its schema up to date and enforce foreign keys.
+
+    Keyword options are passed on to sqlite3.connect.
+    """
+    conn = sqlite3.connect(database_path, **options)
+    migrate(conn)
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+def main():
+    """Bring the database schema up to the latest version"""
+    print("🚀 Migrating ML technologies database schema...")
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    print(f"   • Current version: {schema_version(conn)}")
+    applied = migrate(conn)
+    descriptions = {version: description for version, description, _ in MIGRATIONS}
+    for version in applied:
+        print(f"✅ {version}: {descriptions[version]}")
+    print(f"   • Schema version: {schema_version(conn)}")
+    conn.close()
+
+    if not applied:
+        print("\n🎉 Schema already up to date!")
+    else:
+        print(f"\n🎉 Applied {len(applied)} migrations!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Script to maintain the integer references from catalog rows to companies,
+technology categories and application areas and to check them for dangling
+rows
+"""
+
+import sys
+
+import ml_database_migrations
+
+# (table, text column, id column, lookup table, lookup text column). A company
+# name stays as the source value the seed files and upserts carry; company_id
+# is resolved from it and kept in step by triggers. The name is only looked
+# up: company_id stays NULL until a companies row with that name is loaded
+COMPANY_REFERENCES = (
+    ('ml_technologies', 'company_name', 'company_id', 'companies', 'company_name'),
+    ('equipment', 'manufacturer', 'company_id', 'companies', 'company_name'),
+    ('sensors', 'manufacturer', 'company_id', 'companies', 'company_name'),
+)
+
+# Seed rows name a technology type (a category name of technology_categories)
+# and an application area, but ml_technologies stores only the id: ingest
+# registers a value not seen before in its lookup table and writes the id it
+# names. The labeled view serves the text back
+LOOKUP_REFERENCES = (
+    ('ml_technologies', 'technology_type', 'category_id', 'technology_categories', 'category_name'),
+    ('ml_technologies', 'application_area', 'application_area_id', 'application_areas',
+     'application_area'),
+)
+
+REFERENCES = COMPANY_REFERENCES + LOOKUP_REFERENCES
+
+# Tables read through a view that joins their lookup text back in
+LABELED_VIEWS = {'ml_technologies': 'ml_technologies_labeled'}
+
+def _columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+def present_references(conn, references=REFERENCES):
+    """Return the references whose id column the database already carries"""
+    return tuple(reference for reference in references
+                 if reference[2] in _columns(conn, reference[0]))
+
+def lookup_reference(table, column):
+    """Return the LOOKUP_REFERENCES entry storing a table's column as an id,
+    or None if the column is stored as it is"""
+    for reference in LOOKUP_REFERENCES:
+        if reference[:2] == (table, column):
+            return reference
+    return None
+
+def register_lookups(conn, table, columns, rows):
+    """Add the technology types and application areas that rows of the given
+    columns name but their lookup tables lack; return the lookup rows created.
+
+    Does not commit.
+    """
+    created = 0
+    for source, column, _, lookup, lookup_column in LOOKUP_REFERENCES:
+        if source != table or column not in columns:
+            continue
+        position = columns.index(column)
+        values = [value for value in dict.fromkeys(row[position] for row in rows)
+                  if value is not None]
+        created += conn.executemany(
+            f"INSERT INTO {lookup} ({lookup_column}) VALUES (?) ON CONFLICT DO NOTHING",
+            [(value,) for value in values]).rowcount
+    return created
+
+def resolve_references(conn, references=None):
+    """Set every company_id from its company name; an unknown name leaves it
+    NULL.
+
+    Defaults to every company reference present. Returns the rows
+    repointed. Does not commit.
+    """
+    updated = 0
+    for table, column, id_column, lookup, lookup_column in (
+            present_references(conn, COMPANY_REFERENCES) if references is None else references):
+        resolved = f"(SELECT id FROM {lookup} l WHERE l.{lookup_column} = {table}.{column})"
+        updated += conn.execute(f'''
+            UPDATE {table} SET {id_column} = {resolved}
+            WHERE {id_column} IS NOT {resolved}
+        ''').rowcount
+    return updated
+
+def check_references(conn, references=None):
+    """Return (table, id column, rows with a dangling or unresolved id). A
+    lookup id is only checked for dangling: it has no text left to resolve"""
+    problems = []
+    checked = set()
+    for reference in present_references(conn) if references is None else references:
+        table, column, id_column, lookup, lookup_column = reference
+        dangling = 0
+        if table not in checked:
+            checked.add(table)
+            dangling = len(conn.execute(f"PRAGMA foreign_key_check({table})").fetchall())
+        unresolved = 0
+        if reference not in LOOKUP_REFERENCES:
+            unresolved = conn.execute(f'''
+                SELECT COUNT(*) FROM {table} t
+                WHERE t.{id_column} IS NOT (SELECT id FROM {lookup} l WHERE l.{lookup_column} = t.{column})
+            ''').fetchone()[0]
+        if dangling or unresolved:
+            problems.append((table, id_column, dangling + unresolved))
+    return problems
+
+def main():
+    """Resolve the integer references and verify them"""
+    print("🚀 Checking ML technologies references...")
+
+    conn = ml_database_migrations.connect('/home/vovkes/DATADOG/ml_technologies.db')
+    updated = resolve_references(conn)
+    conn.commit()
+    print(f"✅ {updated} references updated")
+
+    problems = check_references(conn)
+    conn.close()
+
+    if problems:
+        print("\n❌ References out of sync:")
+        for table, id_column, count in problems:
+            print(f"   • {table}.{id_column}: {count} rows")
+        sys.exit(1)
+
+    print("\n🎉 Every reference resolves!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Script to verify the trigger-updated summary tables for the company statistics
+report against a fresh recomputation, and to rebuild them
+"""
+
+import argparse
+import sys
+
+import ml_database_migrations
+
+SUMMARY_TABLES = (
+    'company_summary',
+    'technology_type_summary',
+    'application_area_summary',
+    'country_summary',
+    'adoption_summary',
+)
+
+# The tables and SUMMARY_TRIGGER_SCHEMA are created by ml_database_migrations.py.
+# company_summary keeps one row per companies row, keyed by its id, and a
+# technology counts towards the company its company_id points at. Per-type
+# and per-area counts are keyed on category_id and application_area_id.
+# adoption_summary counts technologies per calendar quarter, type and
+# company, leaving out rows without a valid YYYY-MM-DD implementation_date
+
+# Fresh recomputation from the base tables, shaped like the summary tables
+RECOMPUTED_SUMMARIES = {
+    'company_summary': '''
+        SELECT c.id, c.company_name, c.industry, c.country,
+               (SELECT COUNT(*) FROM ml_technologies mt
+                WHERE mt.company_id = c.id) AS technology_count
+        FROM companies c
+    ''',
+    'technology_type_summary': '''
+        SELECT category_id, COUNT(*) FROM ml_technologies
+        WHERE category_id IS NOT NULL
+        GROUP BY category_id
+    ''',
+    'application_area_summary': '''
+        SELECT application_area_id, COUNT(*) FROM ml_technologies
+        WHERE application_area_id IS NOT NULL
+        GROUP BY application_area_id
+    ''',
+    'country_summary': '''
+        SELECT c.country, COUNT(DISTINCT c.id), COUNT(mt.id) FROM companies c
+        LEFT JOIN ml_technologies mt ON mt.company_id = c.id
+        WHERE c.country IS NOT NULL
+        GROUP BY c.country
+    ''',
+    'adoption_summary': '''
+        SELECT CAST(strftime('%Y', implementation_date) AS INTEGER),
+               (CAST(strftime('%m', implementation_date) AS INTEGER) + 2) / 3,
+               category_id, company_name, COUNT(*)
+        FROM ml_technologies
+        WHERE date(implementation_date, '+0 days') = implementation_date
+          AND category_id IS NOT NULL
+        GROUP BY 1, 2, category_id, company_name
+    ''',
+}
+
+def has_summary_tables(conn):
+    """Check whether the database already carries the summary tables"""
+    placeholders = ', '.join('?' for _ in SUMMARY_TABLES)
+    row = conn.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+        SUMMARY_TABLES
+    ).fetchone()
+    return row[0] == len(SUMMARY_TABLES)
+
+def _normalized(statement):
+    """Trigger DDL as sqlite_master stores it, with whitespace collapsed"""
+    return ' '.join(statement.replace(' IF NOT EXISTS', '', 1).split())
+
+def stale_summary_triggers(conn):
+    """Return the summary triggers that are missing or differ from
+    ml_database_migrations.SUMMARY_TRIGGER_SCHEMA"""
+    stored = dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"))
+    return [name for name, statement in ml_database_migrations.SUMMARY_TRIGGER_SCHEMA.items()
+            if _normalized(stored.get(name) or '') != _normalized(statement)]
+
+def rebuild_summary_tables(conn):
+    """Replace the summary table contents with a fresh recomputation"""
+    cursor = conn.cursor()
+    for table in SUMMARY_TABLES:
+        cursor.execute(f"DELETE FROM {table}")
+        cursor.execute(f"INSERT INTO {table} {RECOMPUTED_SUMMARIES[table]}")
+    conn.commit()
+
+def verify_summary_tables(conn):
+    """Return (table, missing rows, unexpected rows) for each drifted summary"""
+    mismatches = []
+    for table in SUMMARY_TABLES:
+        expected = set(conn.execute(RECOMPUTED_SUMMARIES[table]).fetchall())
+        actual = set(conn.execute(f"SELECT * FROM {table}").fetchall())
+        if expected != actual:
+            mismatches.append((table, sorted(expected - actual, key=str),
+                               sorted(actual - expected, key=str)))
+    return mismatches
+
+def main():
+    """Bring the database up to date and verify its summary tables"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rebuild', action='store_true',
+                        help='reinstall the triggers and recompute the summary tables '
+                             'before verifying them')
+    args = parser.parse_args()
+
+    print("🚀 Checking ML technologies summary tables...")
+
+    conn = ml_database_migrations.connect('/home/vovkes/DATADOG/ml_technologies.db')
+    if args.rebuild:
+        ml_database_migrations.create_summary_triggers(conn)
+        rebuild_summary_tables(conn)
+        print("✅ Summary triggers reinstalled and tables rebuilt from the base tables")
+
+    stale = stale_summary_triggers(conn)
+    mismatches = verify_summary_tables(conn)
+    conn.close()
+
+    if stale:
+        print("\n❌ Summary triggers missing or out of date (run with --rebuild):")
+        for name in stale:
+            print(f"   • {name}")
+    if mismatches:
+        print("\n❌ Summary tables out of sync:")
+        for table, missing, unexpected in mismatches:
+            print(f"   • {table}: {len(missing)} missing rows, {len(unexpected)} unexpected rows")
+            for row in missing[:5]:
+                print(f"       expected {row}")
+            for row in unexpected[:5]:
+                print(f"       found    {row}")
+    if stale or mismatches:
+        sys.exit(1)
+
+    print("\n🎉 Summary tables match a fresh recomputation!")
+
+if __name__ == "__main__":
+    main()
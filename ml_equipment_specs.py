@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Spec and price extraction for equipment: parses the free-text
+specifications and price ranges into typed, indexed columns and runs
+parametric hardware searches over them
+"""
+
+import argparse
+import re
+
+import ml_compatibility
+import ml_database_migrations
+
+# Typed columns derived from equipment.specifications, in parse order
+SPEC_COLUMNS = (
+    ('processor_family', 'TEXT'),
+    ('clock_mhz', 'REAL'),
+    ('flash_bytes', 'INTEGER'),
+    ('ram_bytes', 'INTEGER'),
+    ('pwm_outputs', 'INTEGER'),
+    ('input_min_volts', 'REAL'),
+    ('input_max_volts', 'REAL'),
+    ('ai_tops', 'REAL'),
+)
+
+SPEC_COLUMN_NAMES = tuple(name for name, _ in SPEC_COLUMNS)
+
+# Price range bounds in integer cents, parsed from equipment.price_range
+PRICE_COLUMNS = (
+    ('price_min_cents', 'INTEGER'),
+    ('price_max_cents', 'INTEGER'),
+)
+
+PRICE_COLUMN_NAMES = tuple(name for name, _ in PRICE_COLUMNS)
+
+BACKFILL_CHUNK_SIZE = 50_000
+
+BYTE_UNITS = {'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4}
+
+# Nominal LiPo cell voltage, for inputs given as a cell count ("2-6S")
+LIPO_CELL_VOLTS = 3.7
+
+NUMBER = r'(\d+(?:\.\d+)?)'
+PROCESSOR_PATTERN = re.compile(r'\b(STM32[A-Z]\d|Cortex-[AMR]\d+[A-Z]*)', re.IGNORECASE)
+# A bare clock is a segment of its own; "433MHz/915MHz" radio bands are not
+CLOCK_PATTERN = re.compile(rf'^{NUMBER}\s*(MHz|GHz)$', re.IGNORECASE)
+FLASH_PATTERN = re.compile(rf'\b{NUMBER}\s*(KB|MB|GB)\s+Flash\b', re.IGNORECASE)
+RAM_PATTERN = re.compile(rf'\b{NUMBER}\s*(KB|MB|GB)\s+RAM\b', re.IGNORECASE)
+PWM_PATTERN = re.compile(r'\b(\d+)\s+PWM outputs?\b', re.IGNORECASE)
+INPUT_PATTERN = re.compile(rf'\bInput:\s*{NUMBER}\s*(?:-\s*{NUMBER})?\s*(V|S)\b', re.IGNORECASE)
+TOPS_PATTERN = re.compile(rf'\b{NUMBER}\s*TOPS\b', re.IGNORECASE)
+AMOUNT = r'(\d[\d,]*(?:\.\d+)?)'
+PRICE_PATTERN = re.compile(rf'^\$\s*{AMOUNT}(?:\s*-\s*\$?\s*{AMOUNT})?$')
+
+# Price texts meaning no purchase price; other text without a dollar amount
+# ("Cloud-based") has no price at all
+FREE_PRICES = {'open source', 'free'}
+
+def _bytes(match):
+    return int(float(match.group(1)) * BYTE_UNITS[match.group(2).upper()])
+
+def parse_specifications(text):
+    """Return the SPEC_COLUMNS values parsed from a specifications string.
+
+    Fields the text does not state are None.
+    """
+    values = dict.fromkeys(SPEC_COLUMN_NAMES)
+    if not text:
+        return tuple(values.values())
+
+    match = PROCESSOR_PATTERN.search(text)
+    if match:
+        family = match.group(1).upper()
+        values['processor_family'] = family if family.startswith('STM32') else 'Cortex-' + family[7:]
+    for segment in text.split(','):
+        match = CLOCK_PATTERN.match(segment.strip())
+        if match:
+            scale = 1000 if match.group(2).lower() == 'ghz' else 1
+            values['clock_mhz'] = float(match.group(1)) * scale
+            break
+    match = FLASH_PATTERN.search(text)
+    if match:
+        values['flash_bytes'] = _bytes(match)
+    match = RAM_PATTERN.search(text)
+    if match:
+        values['ram_bytes'] = _bytes(match)
+    match = PWM_PATTERN.search(text)
+    if match:
+        values['pwm_outputs'] = int(match.group(1))
+    match = INPUT_PATTERN.search(text)
+    if match:
+        low = float(match.group(1))
+        high = float(match.group(2)) if match.group(2) else low
+        scale = LIPO_CELL_VOLTS if match.group(3).upper() == 'S' else 1
+        values['input_min_volts'] = round(low * scale, 2)
+        values['input_max_volts'] = round(high * scale, 2)
+    match = TOPS_PATTERN.search(text)
+    if match:
+        values['ai_tops'] = float(match.group(1))
+    return tuple(values.values())
+
+def _cents(amount):
+    return round(float(amount.replace(',', '')) * 100)
+
+def parse_price_range(text):
+    """Return (price_min_cents, price_max_cents) parsed from a price range.
+
+    '$200-300' gives (20000, 30000) and a single price gives equal bounds;
+    'Open Source' costs 0 and text without a dollar amount gives None.
+    """
+    if not text:
+        return None, None
+    text = text.strip()
+    if text.lower() in FREE_PRICES:
+        return 0, 0
+    match = PRICE_PATTERN.match(text)
+    if not match:
+        return None, None
+    low = _cents(match.group(1))
+    high = _cents(match.group(2)) if match.group(2) else low
+    return min(low, high), max(low, high)
+
+def _backfill(conn, source, columns, parse, chunk_size):
+    """Re-parse a text column into its typed columns; return rows changed"""
+    assignments = ', '.join(f'{name} = ?' for name in columns)
+    unchanged = ' AND '.join(f'{name} IS ?' for name in columns)
+    sql = f"UPDATE equipment SET {assignments} WHERE id = ? AND NOT ({unchanged})"
+    changed = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            f"SELECT id, {source} FROM equipment WHERE id > ? ORDER BY id LIMIT ?",
+            (last_id, chunk_size)).fetchall()
+        if not rows:
+            return changed
+        updates = []
+        for row_id, text in rows:
+            values = parse(text)
+            updates.append(values + (row_id,) + values)
+        changed += conn.executemany(sql, updates).rowcount
+        last_id = rows[-1][0]
+
+def backfill_specifications(conn, chunk_size=BACKFILL_CHUNK_SIZE):
+    """Re-parse every equipment row's specifications; return rows changed.
+
+    Does not commit.
+    """
+    return _backfill(conn, 'specifications', SPEC_COLUMN_NAMES, parse_specifications, chunk_size)
+
+def backfill_prices(conn, chunk_size=BACKFILL_CHUNK_SIZE):
+    """Re-parse every equipment row's price range; return rows changed.
+
+    Does not commit.
+    """
+    return _backfill(conn, 'price_range', PRICE_COLUMN_NAMES, parse_price_range, chunk_size)
+
+# (keyword, column, comparison) filters accepted by search_equipment
+SEARCH_FILTERS = (
+    ('processor_family', 'processor_family', '='),
+    ('min_clock_mhz', 'clock_mhz', '>='),
+    ('max_clock_mhz', 'clock_mhz', '<='),
+    ('min_flash_bytes', 'flash_bytes', '>='),
+    ('min_ram_bytes', 'ram_bytes', '>='),
+    ('min_pwm_outputs', 'pwm_outputs', '>='),
+    ('min_ai_tops', 'ai_tops', '>='),
+    # A price range overlaps the budget when it starts at or below the
+    # budget's top and ends at or above its bottom
+    ('budget_max_cents', 'price_min_cents', '<='),
+    ('budget_min_cents', 'price_max_cents', '>='),
+)
+
+# Index key a filtered column's results are ordered by, so the ORDER BY
+# follows the index (rowid last) instead of sorting in a temp b-tree
+INDEX_ORDER = {
+    'price_min_cents': ('price_min_cents', 'price_max_cents'),
+    'price_max_cents': ('price_min_cents', 'price_max_cents'),
+}
+
+def build_search_query(limit=None, cheapest_first=False, compatible_with=(), **filters):
+    """Return (sql, params) for a parametric equipment search.
+
+    With ``cheapest_first`` only priced rows are returned, by ascending
+    price_min_cents. ``compatible_with`` names flight control systems the
+    equipment must be compatible with, every one of them.
+    """
+    clauses = []
+    params = []
+    order = ['id']
+    if compatible_with:
+        # The intersected link ranges are the smallest candidate set; rowid
+        # order lets the planner probe equipment from them directly
+        clause, names = ml_compatibility.compatible_equipment_clause(compatible_with)
+        clauses.append(clause)
+        params.extend(names)
+    if cheapest_first:
+        clauses.append("price_min_cents IS NOT NULL")
+        order[:0] = INDEX_ORDER['price_min_cents']
+    for keyword, column, comparison in SEARCH_FILTERS:
+        value = filters.pop(keyword, None)
+        if value is not None:
+            clauses.append(f"{column} {comparison} ?")
+            params.append(value)
+            if len(order) == 1 and not compatible_with:
+                order[:0] = INDEX_ORDER.get(column, (column,))
+    if filters:
+        raise ValueError(f"Unknown filters: {', '.join(sorted(filters))}")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    # Ordering by the first filtered column walks its index as a range scan;
+    # by id alone the planner prefers a rowid-order table scan
+    sql = (f"SELECT id, name, manufacturer, category, "
+           f"{', '.join(SPEC_COLUMN_NAMES + PRICE_COLUMN_NAMES)} "
+           f"FROM equipment {where} ORDER BY {', '.join(order)} LIMIT ?")
+    params.append(-1 if limit is None else limit)
+    return sql, params
+
+def search_equipment(conn, limit=None, cheapest_first=False, compatible_with=(), **filters):
+    """Find equipment by typed spec and price ranges and compatible systems,
+    e.g. compatible_with=('PX4', 'QGroundControl'), budget_max_cents=30000"""
+    sql, params = build_search_query(limit, cheapest_first, compatible_with, **filters)
+    return conn.execute(sql, params).fetchall()
+
+def _format_price(low, high):
+    if low is None:
+        return None
+    if low == high:
+        return f"${low / 100:,.0f}"
+    return f"${low / 100:,.0f}-{high / 100:,.0f}"
+
+def main():
+    """Backfill the spec and price columns or run a parametric equipment search"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database', default=ml_database_migrations.DATABASE_PATH)
+    parser.add_argument('--backfill', action='store_true',
+                        help='re-parse every row before searching')
+    parser.add_argument('--processor-family')
+    parser.add_argument('--min-clock-mhz', type=float)
+    parser.add_argument('--min-flash-mb', type=float)
+    parser.add_argument('--min-ram-mb', type=float)
+    parser.add_argument('--min-pwm-outputs', type=int)
+    parser.add_argument('--min-ai-tops', type=float)
+    parser.add_argument('--budget-min', type=float, help='dollars; matches overlapping price ranges')
+    parser.add_argument('--budget-max', type=float, help='dollars; matches overlapping price ranges')
+    parser.add_argument('--cheapest', action='store_true', help='priced rows only, cheapest first')
+    parser.add_argument('--compatible-with', action='append', default=[], metavar='SYSTEM',
+                        help='flight control system the equipment must support; repeatable')
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    conn = ml_database_migrations.connect(args.database)
+    if args.backfill:
+        print("🚀 Backfilling equipment spec and price columns...")
+        changed = backfill_specifications(conn) + backfill_prices(conn)
+        conn.commit()
+        print(f"✅ {changed} rows updated")
+
+    megabyte = BYTE_UNITS['MB']
+    results = search_equipment(
+        conn, args.limit, args.cheapest, args.compatible_with,
+        processor_family=args.processor_family,
+        min_clock_mhz=args.min_clock_mhz,
+        min_flash_bytes=None if args.min_flash_mb is None else int(args.min_flash_mb * megabyte),
+        min_ram_bytes=None if args.min_ram_mb is None else int(args.min_ram_mb * megabyte),
+        min_pwm_outputs=args.min_pwm_outputs,
+        min_ai_tops=args.min_ai_tops,
+        budget_min_cents=None if args.budget_min is None else round(args.budget_min * 100),
+        budget_max_cents=None if args.budget_max is None else round(args.budget_max * 100),
+    )
+    conn.close()
+
+    print(f"\n🔧 MATCHING EQUIPMENT ({len(results)}):")
+    print("=" * 80)
+    for row in results:
+        _, name, manufacturer, category, family, clock, flash, ram, pwm = row[:9]
+        details = [value for value in (
+            _format_price(*row[-2:]),
+            family,
+            f"{clock:g}MHz" if clock else None,
+            f"{flash / megabyte:g}MB Flash" if flash else None,
+            f"{ram / megabyte:g}MB RAM" if ram else None,
+            f"{pwm} PWM" if pwm else None,
+        ) if value]
+        print(f"• {name} ({manufacturer}, {category}): {', '.join(details)}")
+
+if __name__ == "__main__":
+    main()
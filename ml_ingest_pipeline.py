@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Parallel ingestion pipeline for large vendor catalogs: a process pool parses,
+validates and derives the typed columns of chunks of a JSONL or CSV file and
+a single writer thread upserts the resulting batches into SQLite
+"""
+
+import argparse
+import collections
+import csv
+import json
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ml_database_ingest
+import ml_database_migrations
+from ml_database_ingest import NATURAL_KEYS, TABLE_COLUMNS
+
+PIPELINE_CHUNK_SIZE = 20_000
+
+# Rejected rows reported back per chunk, beyond the rejection count
+MAX_REPORTED_ERRORS = 5
+
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 't'}
+FALSE_VALUES = {'0', 'false', 'no', 'n', 'f'}
+
+def _text(value):
+    """Trimmed text; blank is NULL"""
+    if isinstance(value, str):
+        return value.strip() or None
+    return None if value is None else str(value)
+
+def _integer(value):
+    value = _text(value) if not isinstance(value, int) else value
+    return None if value is None else int(value)
+
+def _boolean(value):
+    if isinstance(value, bool) or value is None:
+        return value
+    text = str(value).strip().lower()
+    if not text:
+        return None
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+def _date(value):
+    value = _text(value)
+    if value is not None and not DATE_PATTERN.match(value):
+        raise ValueError(f"not a YYYY-MM-DD date: {value!r}")
+    return value
+
+# Columns needing more than trimmed text
+CONVERTERS = {
+    'founded_year': _integer,
+    'open_source': _boolean,
+    'implementation_date': _date,
+}
+
+def parse_chunk(table, file_format, header, first_line, lines):
+    """Parse and validate raw lines into hashed rows; runs in a worker process.
+
+    Returns (rows, rejected count, sample errors, busy seconds). Each row is
+    in TABLE_COLUMNS order, followed by its DERIVED_COLUMNS values and its
+    content hash, ready for the writer to execute.
+    """
+    started = time.perf_counter()
+    columns = TABLE_COLUMNS[table]
+    _, derive = ml_database_ingest.derived_columns(table, columns)
+    converters = [(column, CONVERTERS.get(column, _text)) for column in columns]
+    required = [columns.index(column) for column in NATURAL_KEYS[table][0]]
+
+    rows, errors, rejected = [], [], 0
+    for number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        column = None
+        try:
+            if file_format == 'csv':
+                record = dict(zip(header, next(csv.reader([line]))))
+            else:
+                record = json.loads(line)
+            values = []
+            for column, convert in converters:
+                values.append(convert(record.get(column)))
+            row = tuple(values)
+            missing = [columns[i] for i in required if row[i] is None]
+            if missing:
+                raise ValueError(f"missing {', '.join(missing)}")
+        except (ValueError, TypeError, AttributeError) as error:
+            if column is not None and not str(error).startswith('missing'):
+                error = f"{column}: {error}"
+            rejected += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append((number, str(error)))
+            continue
+        derived = () if derive is None else derive(row)
+        rows.append(row + derived + (ml_database_ingest.content_hash(row),))
+    return rows, rejected, errors, time.perf_counter() - started
+
+def read_chunks(path, chunk_size):
+    """Yield (first line number, raw lines) chunks of a JSONL file, or of a CSV
+    file holding one record per line"""
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.endswith('.csv'):
+            next(f)
+        number = 2 if path.endswith('.csv') else 1
+        chunk = []
+        for line in f:
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                yield number, chunk
+                number += len(chunk)
+                chunk = []
+        if chunk:
+            yield number, chunk
+
+def _csv_header(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return next(csv.reader(f))
+
+class _Writer(threading.Thread):
+    """The only thread touching SQLite: upserts batches from a bounded queue"""
+
+    def __init__(self, database_path, table, batches, track_missing=False):
+        super().__init__(name='ingest-writer')
+        self.database_path = database_path
+        self.table = table
+        self.batches = batches
+        self.track_missing = track_missing
+        # Set by the producer before the end marker once the whole file parsed cleanly
+        self.delete_missing = False
+        self.counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+        self.busy = 0.0
+        self.error = None
+        self.finished = False
+
+    def run(self):
+        try:
+            self._write()
+        except Exception as error:
+            self.error = error
+            # Keep draining so the producer never blocks on a full queue
+            while not self.finished:
+                self.finished = self.batches.get() is None
+
+    def _write(self):
+        conn = ml_database_migrations.connect(self.database_path)
+        saved = ml_database_ingest.apply_pragmas(conn, ml_database_ingest.LOAD_PRAGMAS)
+        try:
+            stored = ml_database_ingest.stored_hashes(conn, self.table)
+            missing = set(stored) if self.track_missing else None
+            positions = [TABLE_COLUMNS[self.table].index(column)
+                         for column in NATURAL_KEYS[self.table][0]]
+            conn.execute("BEGIN")
+            while True:
+                rows = self.batches.get()
+                if rows is None:
+                    self.finished = True
+                    break
+                started = time.perf_counter()
+                if missing is not None:
+                    missing.difference_update(tuple(row[i] for i in positions) for row in rows)
+                counts = ml_database_ingest.upsert_rows(
+                    conn, self.table, rows, stored=stored, hashed=True, derived=True)
+                for name, value in counts.items():
+                    self.counts[name] += value
+                self.busy += time.perf_counter() - started
+            started = time.perf_counter()
+            if missing and self.delete_missing:
+                self.counts['deleted'] = ml_database_ingest.tombstone_rows(conn, self.table, missing)
+            conn.commit()
+            self.busy += time.perf_counter() - started
+        finally:
+            conn.rollback()  # no-op after the commit; discards a failed import
+            ml_database_ingest.restore_pragmas(conn, saved)
+            conn.close()
+
+def run_pipeline(database_path, table, path, workers=None, chunk_size=PIPELINE_CHUNK_SIZE,
+                 queue_depth=None, delta=False):
+    """Import a vendor catalog file into a table; return per-stage statistics.
+
+    Chunks are parsed in parallel but handed to the writer in file order, so
+    a natural key repeated in the file keeps its last row. At most
+    ``queue_depth`` parsed batches wait for the writer, which bounds memory
+    and pushes back on the parsers once SQLite is the bottleneck.
+
+    With ``delta`` the file is the complete source for the table: stored rows
+    whose natural key it lacks are deleted and recorded as tombstones. Any
+    rejected line disables the deletions, since its row may still exist.
+    """
+    if table not in TABLE_COLUMNS:
+        raise ValueError(f"Unknown table: {table}")
+    workers = workers or os.cpu_count() or 1
+    queue_depth = queue_depth or 2 * workers
+    file_format = 'csv' if path.endswith('.csv') else 'jsonl'
+    header = _csv_header(path) if file_format == 'csv' else None
+
+    batches = queue.Queue(maxsize=queue_depth)
+    writer = _Writer(database_path, table, batches, track_missing=delta)
+    writer.start()
+
+    stats = {
+        'read': {'rows': 0, 'seconds': 0.0},
+        'parse': {'rows': 0, 'seconds': 0.0, 'rejected': 0, 'errors': []},
+    }
+    started = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = collections.deque()
+
+            def hand_off(future):
+                rows, rejected, errors, busy = future.result()
+                stats['parse']['rows'] += len(rows)
+                stats['parse']['seconds'] += busy
+                stats['parse']['rejected'] += rejected
+                stats['parse']['errors'].extend(errors)
+                batches.put(rows)
+
+            chunks = read_chunks(path, chunk_size)
+            while True:
+                read_started = time.perf_counter()
+                chunk = next(chunks, None)
+                stats['read']['seconds'] += time.perf_counter() - read_started
+                if chunk is None:
+                    break
+                first_line, lines = chunk
+                stats['read']['rows'] += len(lines)
+                pending.append(pool.submit(parse_chunk, table, file_format, header, first_line, lines))
+                if len(pending) >= queue_depth:
+                    hand_off(pending.popleft())
+            while pending:
+                hand_off(pending.popleft())
+        writer.delete_missing = delta and stats['parse']['rejected'] == 0
+    finally:
+        batches.put(None)
+        writer.join()
+    if writer.error is not None:
+        raise writer.error
+
+    processed = writer.counts['inserted'] + writer.counts['updated'] + writer.counts['unchanged']
+    stats['write'] = dict(writer.counts, rows=processed, seconds=writer.busy)
+    stats['total'] = {'rows': stats['read']['rows'], 'seconds': time.perf_counter() - started}
+    stats['workers'] = workers
+    stats['delta'] = delta
+    return stats
+
+def _rate(rows, seconds):
+    return rows / seconds if seconds else float('inf')
+
+def print_stats(stats):
+    """Print rows/sec per pipeline stage"""
+    workers = stats['workers']
+    parse = stats['parse']
+    print(f"\n📊 Pipeline Summary ({workers} parse workers):")
+    print(f"   • Read:  {stats['read']['rows']:,} lines at "
+          f"{_rate(stats['read']['rows'], stats['read']['seconds']):,.0f} rows/s")
+    # Worker busy time is summed over processes; divide by the pool size
+    print(f"   • Parse: {parse['rows']:,} valid rows at "
+          f"{_rate(parse['rows'], parse['seconds'] / workers):,.0f} rows/s "
+          f"({parse['rejected']:,} rejected)")
+    write = stats['write']
+    print(f"   • Write: {write['rows']:,} rows at {_rate(write['rows'], write['seconds']):,.0f} rows/s "
+          f"({write['inserted']:,} inserted, {write['updated']:,} updated, "
+          f"{write['unchanged']:,} unchanged)")
+    if stats['delta']:
+        if parse['rejected']:
+            print(f"   ⚠️  Deletions skipped: {parse['rejected']:,} lines were rejected")
+        print(f"   • Changes: +{write['inserted']:,} ~{write['updated']:,} -{write['deleted']:,}")
+    print(f"   • Total: {_rate(stats['total']['rows'], stats['total']['seconds']):,.0f} rows/s "
+          f"in {stats['total']['seconds']:.2f}s")
+    for number, error in parse['errors'][:10]:
+        print(f"   ⚠️  line {number}: {error}")
+
+def main():
+    """Import a vendor catalog file through the parallel pipeline"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('table', choices=sorted(TABLE_COLUMNS))
+    parser.add_argument('path', help='JSONL file, or CSV with a header row')
+    parser.add_argument('--database', default='/home/vovkes/DATADOG/ml_technologies.db')
+    parser.add_argument('--workers', type=int, default=None, help='parse processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=PIPELINE_CHUNK_SIZE)
+    parser.add_argument('--delta', action='store_true',
+                        help='the file is the full source: tombstone rows missing from it')
+    args = parser.parse_args()
+
+    print(f"🚀 Importing {args.path} into {args.table}...")
+    stats = run_pipeline(args.database, args.table, args.path, args.workers, args.chunk_size,
+                         delta=args.delta)
+    print_stats(stats)
+    print("\n🎉 Import completed successfully!")
+
+if __name__ == "__main__":
+    main()
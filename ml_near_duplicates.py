@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for the catalog tables: MinHash signatures over
+word shingles, banded into locality-sensitive hash buckets, with candidate
+clusters written to a review table
+"""
+
+import argparse
+import re
+import time
+import zlib
+
+import numpy as np
+
+import ml_database_migrations
+
+# (label shown to reviewers, text columns compared) per table
+DUPLICATE_SOURCES = {
+    'ml_technologies': ("company_name || ' - ' || technology_name", ('technology_name', 'description')),
+    'equipment': ('name', ('name', 'description', 'specifications')),
+    'sensors': ('name', ('name', 'description', 'specifications')),
+}
+
+# Changing the permutation count or seed invalidates the stored signatures;
+# run a full pass afterwards
+NUM_PERM = 64
+SEED = 1
+PRIME = (1 << 31) - 1
+EMPTY = PRIME   # signature value of a row without any shingle
+
+DEFAULT_THRESHOLD = 0.5
+SIGNATURE_CHUNK_SIZE = 100_000
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+_rng = np.random.RandomState(SEED)
+_A = _rng.randint(1, PRIME, NUM_PERM).astype(np.uint64)
+_B = _rng.randint(0, PRIME, NUM_PERM).astype(np.uint64)
+
+def lsh_bands(threshold, num_perm=NUM_PERM):
+    """Return (bands, rows per band) whose S-curve midpoint, (1/b)^(1/r), is
+    closest to threshold"""
+    shapes = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    return min(shapes, key=lambda shape: abs((1 / shape[0]) ** (1 / shape[1]) - threshold))
+
+def _shingles(texts, token_hashes):
+    """Return (shingle values, per-text start offsets) for word bigrams; a
+    one-word text is its single word"""
+    values, starts = [], []
+    for text in texts:
+        hashes = []
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            value = token_hashes.get(token)
+            if value is None:
+                value = token_hashes[token] = zlib.crc32(token.encode('utf-8'))
+            hashes.append(value)
+        starts.append(len(values))
+        if len(hashes) == 1:
+            values.extend(hashes)
+        else:
+            values.extend((first * 0x9E3779B1 + second) & 0xFFFFFFFF
+                          for first, second in zip(hashes, hashes[1:]))
+    return np.array(values, dtype=np.uint64) % PRIME, np.array(starts, dtype=np.int64)
+
+def minhash(texts, token_hashes=None):
+    """MinHash signatures, a (len(texts), NUM_PERM) uint32 array"""
+    values, starts = _shingles(texts, {} if token_hashes is None else token_hashes)
+    signatures = np.full((len(texts), NUM_PERM), EMPTY, dtype=np.uint32)
+    filled = np.flatnonzero(np.diff(np.append(starts, len(values))) > 0)
+    if len(filled):
+        for column in range(NUM_PERM):
+            hashed = (_A[column] * values + _B[column]) % PRIME
+            signatures[filled, column] = np.minimum.reduceat(hashed, starts[filled])
+    return signatures
+
+def _band_keys(signatures, band, rows):
+    """One uint64 bucket key per signature for a band"""
+    keys = np.zeros(len(signatures), dtype=np.uint64)
+    for value in signatures[:, band * rows:(band + 1) * rows].T:
+        keys = keys * np.uint64(1_000_003) + value
+    return keys
+
+def _bucket_pairs(keys, members):
+    """(first, other) position pairs linking every member of a shared bucket
+    to its smallest position; linear in the number of members"""
+    members = members[np.argsort(keys[members], kind='stable')]
+    sorted_keys = keys[members]
+    new_run = np.ones(len(members), dtype=bool)
+    new_run[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    first = np.maximum.accumulate(np.where(new_run, np.arange(len(members)), 0))
+    linked = ~new_run
+    return members[first[linked]], members[linked]
+
+def candidate_pairs(signatures, threshold, probe=None):
+    """Verified (a, b) position pairs with estimated Jaccard >= threshold.
+
+    With ``probe`` (positions) only buckets holding a probed row are
+    examined, which is how new rows are checked against stored signatures.
+    """
+    bands, rows = lsh_bands(threshold)
+    signed = signatures[:, 0] != EMPTY
+    pairs = []
+    for band in range(bands):
+        keys = _band_keys(signatures, band, rows)
+        members = signed
+        if probe is not None:
+            probed = probe[signed[probe]]
+            members = signed & np.isin(keys, keys[probed])
+        pairs.append(_bucket_pairs(keys, np.flatnonzero(members)))
+    if not pairs:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64)
+    a = np.concatenate([first for first, _ in pairs])
+    b = np.concatenate([other for _, other in pairs])
+    unique = np.unique(a * len(signatures) + b)
+    a, b = unique // len(signatures), unique % len(signatures)
+    keep = _similarity(signatures, a, b) >= threshold
+    return a[keep], b[keep]
+
+def _similarity(signatures, a, b):
+    """Estimated Jaccard similarity of position pairs"""
+    return (signatures[a] == signatures[b]).mean(axis=1) if len(a) else np.zeros(0)
+
+def _components(count, a, b):
+    """Label every position with the smallest position connected to it"""
+    labels = np.arange(count)
+    while True:
+        before = labels.copy()
+        linked = np.minimum(labels[a], labels[b])
+        np.minimum.at(labels, a, linked)
+        np.minimum.at(labels, b, linked)
+        labels = labels[labels]
+        if np.array_equal(labels, before):
+            return labels
+
+def _text_sql(table, alias):
+    """SQL joining a row's compared columns into one text"""
+    _, columns = DUPLICATE_SOURCES[table]
+    return " || ' ' || ".join(f"COALESCE({alias}.{column}, '')" for column in columns)
+
+def sign_rows(conn, table, full=False):
+    """Store signatures for rows that are new or changed since last signed
+    (every row with ``full``); drop those of deleted rows. Returns the ids
+    signed. Does not commit."""
+    if full:
+        conn.execute("DELETE FROM minhash_signatures WHERE table_name = ?", (table,))
+    else:
+        conn.execute(f"DELETE FROM minhash_signatures WHERE table_name = ? "
+                     f"AND row_id NOT IN (SELECT id FROM {table})", (table,))
+    cursor = conn.execute(f'''
+        SELECT t.id, t.content_hash, {_text_sql(table, 't')}
+        FROM {table} t
+        LEFT JOIN minhash_signatures s ON s.table_name = ? AND s.row_id = t.id
+        WHERE s.row_id IS NULL OR s.content_hash IS NOT t.content_hash
+    ''', (table,))
+    token_hashes = {}
+    signed = []
+    while True:
+        rows = cursor.fetchmany(SIGNATURE_CHUNK_SIZE)
+        if not rows:
+            return signed
+        signatures = minhash([text for _, _, text in rows], token_hashes)
+        conn.executemany('''
+            INSERT INTO minhash_signatures (table_name, row_id, content_hash, signature)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (table_name, row_id) DO UPDATE SET
+                content_hash = excluded.content_hash, signature = excluded.signature
+        ''', [(table, row_id, digest, signature.tobytes())
+              for (row_id, digest, _), signature in zip(rows, signatures)])
+        signed.extend(row_id for row_id, _, _ in rows)
+
+def stored_signatures(conn, table):
+    """Return (row ids ascending, signature matrix) for a table"""
+    rows = conn.execute("SELECT row_id, signature FROM minhash_signatures WHERE table_name = ? "
+                        "ORDER BY row_id", (table,)).fetchall()
+    ids = np.array([row_id for row_id, _ in rows], dtype=np.int64)
+    signatures = np.frombuffer(b''.join(signature for _, signature in rows), dtype=np.uint32)
+    return ids, signatures.reshape(len(rows), NUM_PERM)
+
+def find_duplicates(conn, table, threshold=DEFAULT_THRESHOLD, full=False):
+    """Sign new and changed rows, find their candidate clusters and record
+    them in duplicate_candidates; return (rows signed, clusters written).
+
+    With ``full`` every row is re-signed and every bucket examined, and the
+    pending candidates of the table are replaced. Otherwise only buckets
+    shared with the rows just signed are examined, and their clusters merge
+    with those already recorded. Does not commit.
+    """
+    signed = sign_rows(conn, table, full)
+    conn.execute(f"DELETE FROM duplicate_candidates WHERE table_name = ? "
+                 f"AND row_id NOT IN (SELECT id FROM {table})", (table,))
+    if full:
+        conn.execute("DELETE FROM duplicate_candidates WHERE table_name = ? AND status = 'pending'",
+                     (table,))
+    if not signed:
+        return 0, 0
+
+    ids, signatures = stored_signatures(conn, table)
+    probe = None if full else np.searchsorted(ids, np.array(signed, dtype=np.int64))
+    a, b = candidate_pairs(signatures, threshold, probe)
+    if not len(a):
+        return len(signed), 0
+
+    # Earlier clusters touching these rows join the new ones
+    recorded = np.array(conn.execute(
+        "SELECT row_id, cluster_id FROM duplicate_candidates WHERE table_name = ?",
+        (table,)).fetchall(), dtype=np.int64).reshape(-1, 2)
+    known = np.isin(recorded, ids).all(axis=1)
+    recorded = np.searchsorted(ids, recorded[known])
+    labels = _components(len(ids), np.concatenate([a, recorded[:, 0]]),
+                         np.concatenate([b, recorded[:, 1]]))
+
+    touched = np.unique(labels[np.concatenate([a, b])])
+    members = np.flatnonzero(np.isin(labels, touched))
+    similarity = _similarity(signatures, labels[members], members)
+    conn.executemany('''
+        INSERT INTO duplicate_candidates (table_name, cluster_id, row_id, similarity)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (table_name, row_id) DO UPDATE SET
+            cluster_id = excluded.cluster_id, similarity = excluded.similarity
+        WHERE duplicate_candidates.status = 'pending'
+    ''', [(table, cluster, row_id, score) for cluster, row_id, score in zip(
+        ids[labels[members]].tolist(), ids[members].tolist(), similarity.tolist())])
+    return len(signed), len(touched)
+
+def pending_clusters(conn, table, limit=10):
+    """Return [(cluster id, [(row id, label, similarity)])] awaiting review,
+    largest first"""
+    label, _ = DUPLICATE_SOURCES[table]
+    clusters = conn.execute('''
+        SELECT cluster_id FROM duplicate_candidates
+        WHERE table_name = ? AND status = 'pending'
+        GROUP BY cluster_id ORDER BY COUNT(*) DESC, cluster_id LIMIT ?
+    ''', (table, limit)).fetchall()
+    results = []
+    for (cluster_id,) in clusters:
+        members = conn.execute(f'''
+            SELECT d.row_id, {label}, d.similarity
+            FROM duplicate_candidates d JOIN {table} t ON t.id = d.row_id
+            WHERE d.table_name = ? AND d.cluster_id = ?
+            ORDER BY d.similarity DESC, d.row_id
+        ''', (table, cluster_id)).fetchall()
+        results.append((cluster_id, members))
+    return results
+
+def main():
+    """Find near-duplicate catalog rows and list the clusters awaiting review"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database', default='/home/vovkes/DATADOG/ml_technologies.db')
+    parser.add_argument('--table', action='append', choices=sorted(DUPLICATE_SOURCES),
+                        help='table to check; repeatable (default: all)')
+    parser.add_argument('--full', action='store_true',
+                        help='re-sign every row instead of only new and changed ones')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='estimated Jaccard similarity a pair must reach')
+    parser.add_argument('--show', type=int, default=5, help='clusters listed per table')
+    args = parser.parse_args()
+
+    print("🚀 Looking for near-duplicate catalog rows...")
+    bands, rows = lsh_bands(args.threshold)
+    print(f"   • {NUM_PERM} permutations, {bands} bands of {rows} rows")
+
+    conn = ml_database_migrations.connect(args.database)
+    for table in args.table or list(DUPLICATE_SOURCES):
+        started = time.perf_counter()
+        signed, clusters = find_duplicates(conn, table, args.threshold, args.full)
+        conn.commit()
+        print(f"✅ {table}: {signed} rows signed, {clusters} clusters updated "
+              f"({time.perf_counter() - started:.2f}s)")
+        for cluster_id, members in pending_clusters(conn, table, args.show):
+            print(f"   🔁 cluster {cluster_id}:")
+            for row_id, label, similarity in members:
+                print(f"      • [{row_id}] {label} ({similarity:.2f})")
+    conn.close()
+
+    print("\n🎉 Duplicate candidates are ready for review in duplicate_candidates!")
+
+if __name__ == "__main__":
+    main()
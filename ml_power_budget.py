@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Vectorized power budgets for sensor sets: sums the SI current and power
+columns of ml_sensor_specs.py over thousands of candidate builds at once
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ml_database_migrations
+import ml_sensor_specs
+
+# Sensor id padding in a builds array, for builds with fewer sensors
+NO_SENSOR = -1
+
+class PowerBudget:
+    """Per-sensor supply voltage, current and power as arrays sorted by id.
+
+    A build is a row of sensor ids, padded with NO_SENSOR; a builds array
+    holds one build per row. A sensor whose draw is unknown makes its
+    build's totals NaN, so it never fits an envelope.
+    """
+
+    def __init__(self, ids, names, supply_volts, current_amps, power_watts):
+        order = np.argsort(np.asarray(ids, dtype=np.int64), kind='stable')
+        self.ids = np.asarray(ids, dtype=np.int64)[order]
+        self.names = [names[i] for i in order]
+        # One trailing slot for NO_SENSOR padding, drawing nothing
+        self.supply_volts = np.append(np.asarray(supply_volts, dtype=np.float64)[order], np.nan)
+        self.current_amps = np.append(np.asarray(current_amps, dtype=np.float64)[order], 0.0)
+        self.power_watts = np.append(np.asarray(power_watts, dtype=np.float64)[order], 0.0)
+
+    @classmethod
+    def load(cls, conn, sensor_type=None):
+        """Read the sensors (of one type) with their SI power columns"""
+        where = "WHERE type = ?" if sensor_type else ''
+        rows = conn.execute(
+            f"SELECT id, name, supply_volts, current_amps, power_watts FROM sensors {where}",
+            (sensor_type,) if sensor_type else ()).fetchall()
+        ids, names, volts, amps, watts = (list(column) for column in zip(*rows)) if rows else ([],) * 5
+        # NULL draws become NaN
+        return cls(ids, names, volts, amps, watts)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def positions(self, builds):
+        """Map a builds array of sensor ids to array positions; padding maps
+        to the trailing slot. Raises KeyError for an id not loaded."""
+        builds = np.asarray(builds, dtype=np.int64)
+        positions = np.searchsorted(self.ids, builds)
+        found = positions < len(self.ids)
+        found[found] = self.ids[positions[found]] == builds[found]
+        padding = builds == NO_SENSOR
+        unknown = ~found & ~padding
+        if unknown.any():
+            raise KeyError(f"Unknown sensor ids: {np.unique(builds[unknown])[:10].tolist()}")
+        positions[padding] = len(self.ids)
+        return positions
+
+    def totals(self, builds):
+        """Return (current in A, power in W) per build"""
+        positions = self.positions(builds)
+        return self.current_amps[positions].sum(axis=-1), self.power_watts[positions].sum(axis=-1)
+
+    def rail_currents(self, builds):
+        """Return {supply volts: current in A per build} for each supply rail"""
+        positions = self.positions(builds)
+        volts = self.supply_volts[positions]
+        amps = self.current_amps[positions]
+        rails = np.unique(self.supply_volts[~np.isnan(self.supply_volts)])
+        return {float(rail): np.where(volts == rail, amps, 0.0).sum(axis=-1) for rail in rails}
+
+    def within(self, builds, max_amps=None, max_watts=None):
+        """Boolean mask of the builds fitting a current and/or power envelope"""
+        current, power = self.totals(builds)
+        fits = np.ones(current.shape, dtype=bool)
+        if max_amps is not None:
+            fits &= current <= max_amps
+        if max_watts is not None:
+            fits &= power <= max_watts
+        return fits
+
+def combinations(*slots):
+    """Builds array of every choice of one sensor id per slot; a slot holding
+    NO_SENSOR makes that slot optional"""
+    grids = np.meshgrid(*[np.asarray(slot, dtype=np.int64) for slot in slots], indexing='ij')
+    return np.stack([grid.ravel() for grid in grids], axis=-1)
+
+def main():
+    """Total the power draw of a sensor set, or time random candidate builds"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database', default=ml_database_migrations.DATABASE_PATH)
+    parser.add_argument('sensors', nargs='*', help='sensor names making up one build')
+    parser.add_argument('--max-current-ma', type=float)
+    parser.add_argument('--random-builds', type=int, metavar='N',
+                        help='time N random builds of one sensor per type')
+    args = parser.parse_args()
+
+    conn = ml_database_migrations.connect(args.database)
+    budget = PowerBudget.load(conn)
+
+    if args.sensors:
+        placeholders = ', '.join('?' for _ in args.sensors)
+        rows = conn.execute(f"SELECT id, name FROM sensors WHERE name IN ({placeholders})",
+                            args.sensors).fetchall()
+        missing = set(args.sensors) - {name for _, name in rows}
+        if missing:
+            print(f"⚠️  Unknown sensors: {', '.join(sorted(missing))}")
+        build = np.array([[sensor_id for sensor_id, _ in rows]])
+        current, power = budget.totals(build)
+        print("\n🔋 POWER BUDGET:")
+        print("=" * 60)
+        for sensor_id, name in rows:
+            position = budget.positions([sensor_id])[0]
+            print(f"• {name}: {ml_sensor_specs.format_si(budget.current_amps[position], 'A')}"
+                  f" @ {ml_sensor_specs.format_si(budget.supply_volts[position], 'V')}")
+        for rail, amps in budget.rail_currents(build).items():
+            print(f"   {rail:g}V rail: {ml_sensor_specs.format_si(amps[0], 'A')}")
+        print(f"   Total: {ml_sensor_specs.format_si(current[0], 'A')}, "
+              f"{ml_sensor_specs.format_si(power[0], 'W')}")
+        if args.max_current_ma is not None:
+            fits = budget.within(build, max_amps=args.max_current_ma / 1000)[0]
+            print("✅ Within budget" if fits else "❌ Over budget")
+
+    if args.random_builds:
+        types = [sensor_type for (sensor_type,) in
+                 conn.execute("SELECT DISTINCT type FROM sensors WHERE current_amps IS NOT NULL")]
+        if not types:
+            print("⚠️  No sensors with a parsed supply current to build from")
+            conn.close()
+            return
+        rng = np.random.default_rng(0)
+        slots = [np.array([row[0] for row in conn.execute(
+            "SELECT id FROM sensors WHERE type = ? AND current_amps IS NOT NULL", (sensor_type,))])
+            for sensor_type in types]
+        builds = np.stack([rng.choice(slot, args.random_builds) for slot in slots], axis=-1)
+        start = time.perf_counter()
+        current, _ = budget.totals(builds)
+        elapsed = time.perf_counter() - start
+        print(f"\n⚡ {args.random_builds} builds of {len(types)} sensors in {elapsed * 1000:.1f}ms "
+              f"({args.random_builds / elapsed:,.0f} builds/s), "
+              f"median draw {ml_sensor_specs.format_si(float(np.median(current)), 'A')}")
+    conn.close()
+
+if __name__ == "__main__":
+    main()
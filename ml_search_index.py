@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Script to rebuild the FTS5 full-text search index over ML technologies
+"""
+
+import re
+
+import ml_database_migrations
+
+SEARCH_INDEX_TABLE = 'ml_technologies_fts'
+
+# External-content FTS5 table over ml_technologies_labeled, created and kept
+# in sync by triggers from ml_database_migrations.py
+# bm25 weights for technology_name, description, application_area
+SEARCH_QUERY = f"""
+    SELECT mt.company_name, mt.technology_name, mt.technology_type, mt.application_area, mt.description
+    FROM {SEARCH_INDEX_TABLE}
+    JOIN ml_technologies_labeled mt ON mt.id = {SEARCH_INDEX_TABLE}.rowid
+    WHERE {SEARCH_INDEX_TABLE} MATCH ?
+    ORDER BY bm25({SEARCH_INDEX_TABLE}, 10.0, 1.0, 5.0)
+    LIMIT ?
+    """
+
+# Unranked matches in id order, for keyset-paginated streaming
+SEARCH_PAGE = f"""
+    SELECT mt.company_name, mt.technology_name, mt.technology_type, mt.application_area, mt.description, mt.id
+    FROM {SEARCH_INDEX_TABLE}
+    JOIN ml_technologies_labeled mt ON mt.id = {SEARCH_INDEX_TABLE}.rowid
+    WHERE {SEARCH_INDEX_TABLE} MATCH ? AND {SEARCH_INDEX_TABLE}.rowid > ?
+    ORDER BY {SEARCH_INDEX_TABLE}.rowid
+    LIMIT ?
+    """
+
+_SEARCH_TERM = re.compile(r'"([^"]*)"|(\S+)')
+_WORD = re.compile(r'\w+')
+
+def build_match_expression(keyword):
+    """Turn a user keyword into a safe FTS5 MATCH expression.
+
+    Quoted text is matched as a phrase and a trailing ``*`` makes a prefix
+    query; every other word must appear somewhere in the row. FTS5 operator
+    characters in the input are never passed through.
+    """
+    terms = []
+    for phrase, word in _SEARCH_TERM.findall(keyword):
+        if phrase:
+            tokens = _WORD.findall(phrase)
+            if tokens:
+                terms.append('"' + ' '.join(tokens) + '"')
+            continue
+        tokens = _WORD.findall(word)
+        if not tokens:
+            continue
+        term = '"' + ' '.join(tokens) + '"'
+        if word.endswith('*'):
+            term += '*'
+        terms.append(term)
+    return ' AND '.join(terms)
+
+def has_search_index(conn):
+    """Check whether the database already carries the search index"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        [SEARCH_INDEX_TABLE]
+    ).fetchone()
+    return row is not None
+
+def rebuild_search_index(conn):
+    """Repopulate the search index from ml_technologies and merge its segments"""
+    cursor = conn.cursor()
+    cursor.execute(f"INSERT INTO {SEARCH_INDEX_TABLE} ({SEARCH_INDEX_TABLE}) VALUES ('rebuild')")
+    cursor.execute(f"INSERT INTO {SEARCH_INDEX_TABLE} ({SEARCH_INDEX_TABLE}) VALUES ('optimize')")
+    conn.commit()
+
+def search(conn, keyword, limit=None):
+    """Return bm25-ranked technologies matching the keyword"""
+    expression = build_match_expression(keyword)
+    if not expression:
+        return []
+    return conn.execute(SEARCH_QUERY, [expression, -1 if limit is None else limit]).fetchall()
+
+def main():
+    """Bring the database up to date and rebuild its search index"""
+    print("🚀 Building ML technologies search index...")
+
+    conn = ml_database_migrations.connect('/home/vovkes/DATADOG/ml_technologies.db')
+    print("✅ Schema and search index up to date")
+
+    rebuild_search_index(conn)
+    count = conn.execute("SELECT COUNT(*) FROM ml_technologies").fetchone()[0]
+    print(f"✅ Search index rebuilt from {count} ML technologies")
+
+    conn.close()
+    print("\n🎉 Search index ready!")
+
+if __name__ == "__main__":
+    main()
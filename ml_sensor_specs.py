@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+SI extraction for sensors: parses the free-text power consumption, range and
+accuracy into typed, indexed columns in SI units and runs parametric sensor
+searches over them
+"""
+
+import argparse
+import math
+import re
+
+import ml_database_migrations
+
+# Typed columns derived from sensors.power_consumption: '3.3V, 3.9mA' gives
+# 3.3 V, 0.0039 A and their product in watts unless a wattage is stated
+POWER_COLUMNS = (
+    ('supply_volts', 'REAL'),
+    ('current_amps', 'REAL'),
+    ('power_watts', 'REAL'),
+)
+
+# From sensors.range: the first quantity stated, '±8 Gauss' as -0.0008 to
+# 0.0008 'T' and '10-1200 mbar' as 1000 to 120000 'Pa'
+RANGE_COLUMNS = (
+    ('range_min', 'REAL'),
+    ('range_max', 'REAL'),
+    ('range_unit', 'TEXT'),
+)
+
+# From sensors.accuracy: the first figure stated, '±0.012 mbar' as 1.2 'Pa'
+# and '±5%' as 0.05 'ratio'
+ACCURACY_COLUMNS = (
+    ('accuracy_value', 'REAL'),
+    ('accuracy_unit', 'TEXT'),
+)
+
+POWER_COLUMN_NAMES = tuple(name for name, _ in POWER_COLUMNS)
+RANGE_COLUMN_NAMES = tuple(name for name, _ in RANGE_COLUMNS)
+ACCURACY_COLUMN_NAMES = tuple(name for name, _ in ACCURACY_COLUMNS)
+SENSOR_COLUMN_NAMES = POWER_COLUMN_NAMES + RANGE_COLUMN_NAMES + ACCURACY_COLUMN_NAMES
+
+BACKFILL_CHUNK_SIZE = 50_000
+
+# Stated unit -> (SI unit, scale, offset). Units are case-sensitive: 'g' is
+# standard gravity, 'G' is gauss
+UNITS = {
+    'V': ('V', 1, 0), 'mV': ('V', 1e-3, 0),
+    'A': ('A', 1, 0), 'mA': ('A', 1e-3, 0), 'μA': ('A', 1e-6, 0), 'uA': ('A', 1e-6, 0),
+    'W': ('W', 1, 0), 'mW': ('W', 1e-3, 0), 'μW': ('W', 1e-6, 0), 'uW': ('W', 1e-6, 0),
+    'Pa': ('Pa', 1, 0), 'hPa': ('Pa', 100, 0), 'kPa': ('Pa', 1000, 0),
+    'mbar': ('Pa', 100, 0), 'bar': ('Pa', 100_000, 0),
+    'T': ('T', 1, 0), 'mT': ('T', 1e-3, 0), 'μT': ('T', 1e-6, 0), 'uT': ('T', 1e-6, 0),
+    'nT': ('T', 1e-9, 0), 'Gauss': ('T', 1e-4, 0), 'G': ('T', 1e-4, 0), 'mG': ('T', 1e-7, 0),
+    'g': ('m/s^2', 9.80665, 0),
+    '°/s': ('rad/s', math.pi / 180, 0), 'dps': ('rad/s', math.pi / 180, 0),
+    '°': ('rad', math.pi / 180, 0), 'deg': ('rad', math.pi / 180, 0),
+    '°C': ('K', 1, 273.15), 'K': ('K', 1, 0),
+    'm': ('m', 1, 0), 'cm': ('m', 1e-2, 0), 'mm': ('m', 1e-3, 0), 'km': ('m', 1000, 0),
+    '%': ('ratio', 1e-2, 0),
+}
+
+NUMBER = r'([+-]?\d+(?:\.\d+)?)'
+UNIT = r'([^\s\d,]+)'
+# "Gyro: " and similar labels ahead of a quantity
+LABEL_PATTERN = re.compile(r'^[A-Za-z][\w ]*:\s*')
+QUANTITY_PATTERN = re.compile(rf'(?<![\w.]){NUMBER}\s*{UNIT}')
+SYMMETRIC_PATTERN = re.compile(rf'^±\s*{NUMBER}\s*{UNIT}$')
+SPAN_PATTERN = re.compile(rf'^{NUMBER}\s*{UNIT}?\s*(?:-|to)\s*{NUMBER}\s*{UNIT}$')
+# Trailing qualifiers such as '2.5m CEP' or '±1° RMS'
+FIGURE_PATTERN = re.compile(rf'^±?\s*{NUMBER}\s*{UNIT}(?:\s+[A-Z0-9]+)?$')
+
+def _normalize(unit):
+    """Spell the micro sign and degree variants the way UNITS does"""
+    return unit.replace('µ', 'μ').replace('º', '°')
+
+def _si(value, unit, delta=False):
+    """Return (SI value, SI unit) for a stated value, or None for an unknown
+    unit. A ``delta`` (an accuracy) skips the offset of a unit like °C."""
+    known = UNITS.get(_normalize(unit))
+    if known is None:
+        return None
+    si_unit, scale, offset = known
+    value = float(value) * scale + (0 if delta else offset)
+    # Twelve significant digits drop the binary noise of the scaling
+    return float(f'{value:.12g}'), si_unit
+
+def _segments(text):
+    """Comma-separated parts of a text with any leading label removed"""
+    return [LABEL_PATTERN.sub('', part.strip()) for part in text.split(',') if part.strip()]
+
+def parse_power_consumption(text):
+    """Return (supply_volts, current_amps, power_watts) from a power string.
+
+    '3.3V, 3.9mA' gives (3.3, 0.0039, 0.01287); fields the text does not
+    state, and a power it does not allow computing, are None.
+    """
+    values = dict.fromkeys(POWER_COLUMN_NAMES)
+    if not text:
+        return tuple(values.values())
+    for number, unit in QUANTITY_PATTERN.findall(text):
+        converted = _si(number, unit)
+        if converted is None:
+            continue
+        value, si_unit = converted
+        column = {'V': 'supply_volts', 'A': 'current_amps', 'W': 'power_watts'}.get(si_unit)
+        if column and values[column] is None:
+            values[column] = value
+    if values['power_watts'] is None and None not in (values['supply_volts'], values['current_amps']):
+        values['power_watts'] = float(f"{values['supply_volts'] * values['current_amps']:.12g}")
+    return tuple(values.values())
+
+def parse_range(text):
+    """Return (range_min, range_max, range_unit) for the first quantity in a
+    range string, in SI units; (None, None, None) for text like 'Global'"""
+    if not text:
+        return None, None, None
+    for segment in _segments(text):
+        match = SYMMETRIC_PATTERN.match(segment)
+        if match:
+            number, unit = match.groups()
+            low, high = _si('-' + number.lstrip('+-'), unit), _si(number.lstrip('+-'), unit)
+        else:
+            match = SPAN_PATTERN.match(segment)
+            if not match:
+                continue
+            low_number, low_unit, high_number, unit = match.groups()
+            low, high = _si(low_number, low_unit or unit), _si(high_number, unit)
+        if low is None or high is None or low[1] != high[1]:
+            continue
+        return min(low[0], high[0]), max(low[0], high[0]), low[1]
+    return None, None, None
+
+def parse_accuracy(text):
+    """Return (accuracy_value, accuracy_unit) for the first figure in an
+    accuracy string, in SI units. 'RTK: 1cm, Standard: 2.5m' gives
+    (0.01, 'm'); text without a known unit gives (None, None)."""
+    if not text:
+        return None, None
+    for segment in _segments(text):
+        match = FIGURE_PATTERN.match(segment)
+        if match:
+            converted = _si(match.group(1).lstrip('+-'), match.group(2), delta=True)
+            if converted is not None:
+                return converted
+    return None, None
+
+def parse_sensor(power_consumption, sensor_range, accuracy):
+    """Return every SENSOR_COLUMN_NAMES value for one sensor row"""
+    return (parse_power_consumption(power_consumption) + parse_range(sensor_range)
+            + parse_accuracy(accuracy))
+
+def backfill_sensors(conn, chunk_size=BACKFILL_CHUNK_SIZE):
+    """Re-parse every sensor's power, range and accuracy; return rows changed.
+
+    Does not commit.
+    """
+    assignments = ', '.join(f'{name} = ?' for name in SENSOR_COLUMN_NAMES)
+    unchanged = ' AND '.join(f'{name} IS ?' for name in SENSOR_COLUMN_NAMES)
+    sql = f"UPDATE sensors SET {assignments} WHERE id = ? AND NOT ({unchanged})"
+    changed = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            'SELECT id, power_consumption, "range", accuracy FROM sensors '
+            'WHERE id > ? ORDER BY id LIMIT ?', (last_id, chunk_size)).fetchall()
+        if not rows:
+            return changed
+        updates = []
+        for row_id, power, sensor_range, accuracy in rows:
+            values = parse_sensor(power, sensor_range, accuracy)
+            updates.append(values + (row_id,) + values)
+        changed += conn.executemany(sql, updates).rowcount
+        last_id = rows[-1][0]
+
+# (keyword, column, comparison) filters accepted by search_sensors. Range
+# and accuracy values are in the SI unit given by range_unit/accuracy_unit
+SEARCH_FILTERS = (
+    ('sensor_type', 'type', '='),
+    ('max_current_amps', 'current_amps', '<='),
+    ('max_power_watts', 'power_watts', '<='),
+    ('supply_volts', 'supply_volts', '='),
+    ('range_unit', 'range_unit', '='),
+    # The range must reach down to range_low and up to range_high
+    ('range_low', 'range_min', '<='),
+    ('range_high', 'range_max', '>='),
+    ('accuracy_unit', 'accuracy_unit', '='),
+    ('max_accuracy', 'accuracy_value', '<='),
+)
+
+# Index key a filtered column's results are ordered by, so the ORDER BY
+# follows the index (rowid last) instead of sorting in a temp b-tree
+INDEX_ORDER = {
+    'type': ('type', 'current_amps'),
+    'current_amps': ('current_amps',),
+    'range_unit': ('range_unit', 'range_min', 'range_max'),
+    'accuracy_unit': ('accuracy_unit', 'accuracy_value'),
+}
+
+def build_search_query(limit=None, **filters):
+    """Return (sql, params) for a parametric sensor search"""
+    clauses = []
+    params = []
+    order = ['id']
+    for keyword, column, comparison in SEARCH_FILTERS:
+        value = filters.pop(keyword, None)
+        if value is not None:
+            clauses.append(f"{column} {comparison} ?")
+            params.append(value)
+            if len(order) == 1 and column in INDEX_ORDER:
+                order[:0] = INDEX_ORDER[column]
+    if filters:
+        raise ValueError(f"Unknown filters: {', '.join(sorted(filters))}")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    sql = (f"SELECT id, name, type, manufacturer, {', '.join(SENSOR_COLUMN_NAMES)} "
+           f"FROM sensors {where} ORDER BY {', '.join(order)} LIMIT ?")
+    params.append(-1 if limit is None else limit)
+    return sql, params
+
+def search_sensors(conn, limit=None, **filters):
+    """Find sensors by SI power, range and accuracy, e.g.
+    sensor_type='Barometer', max_current_amps=0.002, range_unit='Pa',
+    range_high=110000"""
+    sql, params = build_search_query(limit, **filters)
+    return conn.execute(sql, params).fetchall()
+
+def format_si(value, unit):
+    """Render an SI value with a milli/micro prefix where that reads better"""
+    if value is None:
+        return None
+    if unit in ('A', 'W', 'V', 'm', 'T') and value and abs(value) < 1:
+        for prefix, scale in (('m', 1e3), ('μ', 1e6), ('n', 1e9)):
+            if abs(value) * scale >= 1:
+                return f"{value * scale:g}{prefix}{unit}"
+    if unit == 'ratio':
+        return f"{value * 100:g}%"
+    return f"{value:g}{unit}"
+
+def main():
+    """Backfill the SI sensor columns or run a parametric sensor search"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database', default=ml_database_migrations.DATABASE_PATH)
+    parser.add_argument('--backfill', action='store_true',
+                        help='re-parse every row before searching')
+    parser.add_argument('--type', dest='sensor_type')
+    parser.add_argument('--max-current-ma', type=float)
+    parser.add_argument('--max-power-mw', type=float)
+    parser.add_argument('--range-unit', help='SI unit: Pa, T, m, rad/s, m/s^2, K')
+    parser.add_argument('--range-low', type=float, help='SI value the range must reach down to')
+    parser.add_argument('--range-high', type=float, help='SI value the range must reach up to')
+    parser.add_argument('--accuracy-unit', help='SI unit: Pa, m, rad, K, ratio')
+    parser.add_argument('--max-accuracy', type=float, help='SI value')
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    conn = ml_database_migrations.connect(args.database)
+    if args.backfill:
+        print("🚀 Backfilling sensor SI columns...")
+        changed = backfill_sensors(conn)
+        conn.commit()
+        print(f"✅ {changed} rows updated")
+
+    results = search_sensors(
+        conn, args.limit,
+        sensor_type=args.sensor_type,
+        max_current_amps=None if args.max_current_ma is None else args.max_current_ma / 1000,
+        max_power_watts=None if args.max_power_mw is None else args.max_power_mw / 1000,
+        range_unit=args.range_unit,
+        range_low=args.range_low,
+        range_high=args.range_high,
+        accuracy_unit=args.accuracy_unit,
+        max_accuracy=args.max_accuracy,
+    )
+    conn.close()
+
+    print(f"\n📡 MATCHING SENSORS ({len(results)}):")
+    print("=" * 80)
+    for row in results:
+        _, name, sensor_type, manufacturer, volts, amps, watts, low, high, unit, accuracy, accuracy_unit = row
+        details = [value for value in (
+            format_si(volts, 'V'),
+            format_si(amps, 'A'),
+            format_si(watts, 'W'),
+            f"{format_si(low, unit)} to {format_si(high, unit)}" if unit else None,
+            f"±{format_si(accuracy, accuracy_unit)}" if accuracy_unit else None,
+        ) if value]
+        print(f"• {name} ({manufacturer}, {sensor_type}): {', '.join(details)}")
+
+if __name__ == "__main__":
+    main()
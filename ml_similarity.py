@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+TF-IDF similarity engine for ML technologies: term vectors over
+technology_name and description kept as memory-mapped .npy segments,
+answering top-k nearest-technology queries and growing incrementally as
+rows are inserted
+"""
+
+import argparse
+import collections
+import json
+import os
+import re
+import shutil
+import time
+
+import numpy as np
+
+import ml_database_migrations
+from query_ml_database import DATABASE_PATH
+
+INDEX_DIRECTORY = os.path.join(os.path.dirname(DATABASE_PATH), 'ml_similarity')
+
+VECTORIZE_CHUNK_SIZE = 100_000
+
+# New rows go into a segment of their own; past this many the segments are
+# merged back into one
+MAX_SEGMENTS = 8
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+STOP_WORDS = frozenset('''
+    a an and are as at based be by for from in into is it its of on or that the
+    this to using via with
+'''.split())
+
+# Arrays of one segment. doc_* is the row-major matrix (a technology's terms),
+# term_* the same weights column-major (a term's technologies); positions in
+# both are offsets into the segment's ids
+SEGMENT_ARRAYS = ('ids', 'doc_indptr', 'doc_terms', 'doc_weights',
+                  'term_indptr', 'term_docs', 'term_weights')
+
+def tokenize(text):
+    """Lowercase word tokens of a text, without stop words and single characters"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower())
+            if len(token) > 1 and token not in STOP_WORDS]
+
+def _document(name, description):
+    return f"{name or ''} {description or ''}"
+
+def _vectorize(rows, vocabulary):
+    """Turn (id, name, description) rows into (ids, indptr, terms, weights).
+
+    Terms not yet in ``vocabulary`` are added to it. Weights are sublinear
+    term frequencies, 1 + ln(count); IDF is applied at query time so that
+    adding rows never rewrites stored weights.
+    """
+    ids, lengths, flat = [], [], []
+    for row_id, name, description in rows:
+        terms = [vocabulary.setdefault(token, len(vocabulary))
+                 for token in tokenize(_document(name, description))]
+        ids.append(row_id)
+        lengths.append(len(terms))
+        flat.extend(terms)
+
+    width = max(len(vocabulary), 1)
+    docs = np.repeat(np.arange(len(ids), dtype=np.int64), lengths)
+    keys, counts = np.unique(docs * width + np.array(flat, dtype=np.int64), return_counts=True)
+    indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys // width, minlength=len(ids)), out=indptr[1:])
+    return (np.array(ids, dtype=np.int64), indptr, (keys % width).astype(np.int32),
+            (1 + np.log(counts)).astype(np.float32))
+
+def _segment(ids, indptr, terms, weights, term_count):
+    """Build a segment's arrays, adding the column-major copy"""
+    docs = np.repeat(np.arange(len(ids), dtype=np.int32), np.diff(indptr))
+    order = np.argsort(terms, kind='stable')
+    term_indptr = np.zeros(term_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(terms, minlength=term_count), out=term_indptr[1:])
+    return {
+        'ids': ids, 'doc_indptr': indptr, 'doc_terms': terms, 'doc_weights': weights,
+        'term_indptr': term_indptr, 'term_docs': docs[order], 'term_weights': weights[order],
+    }
+
+def _concatenate(parts):
+    """Join (ids, indptr, terms, weights) parts into one matrix"""
+    offsets = np.cumsum([0] + [part[1][-1] for part in parts])
+    indptr = np.concatenate([np.zeros(1, dtype=np.int64)] +
+                            [part[1][1:] + offset for part, offset in zip(parts, offsets)])
+    return (np.concatenate([part[0] for part in parts]), indptr,
+            np.concatenate([part[2] for part in parts]), np.concatenate([part[3] for part in parts]))
+
+def _top(scores, ids, k):
+    """Best k (ids, scores) by descending score then id, positive scores only"""
+    candidates = np.flatnonzero(scores > 0)
+    if k < len(candidates):
+        # Keep every row tied with the k-th score so ids break the tie
+        kth = np.partition(scores[candidates], len(candidates) - k)[len(candidates) - k]
+        candidates = candidates[scores[candidates] >= kth]
+    order = np.lexsort((ids[candidates], -scores[candidates]))[:k]
+    return ids[candidates[order]], scores[candidates[order]]
+
+def _read_manifest(directory):
+    with open(os.path.join(directory, 'manifest.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+class SimilarityIndex:
+    """TF-IDF vectors of ml_technologies stored under a directory.
+
+    ``manifest.json`` lists the segments, ``terms.json`` the vocabulary and
+    ``document_frequency.npy`` the per-term counts IDF is computed from.
+    Segment arrays are opened memory-mapped, so only the postings a query
+    touches are read. ``update()`` vectorizes the rows inserted since the
+    last build into a new segment; a row edited in place is only seen by
+    ``build()``.
+    """
+
+    def __init__(self, directory=INDEX_DIRECTORY):
+        self.directory = directory
+        self.manifest = _read_manifest(directory)
+        with open(os.path.join(directory, 'terms.json'), encoding='utf-8') as f:
+            self.vocabulary = {term: number for number, term in enumerate(json.load(f))}
+        self.document_frequency = np.load(os.path.join(directory, 'document_frequency.npy'))
+        self.segments = [self._open_segment(name) for name in self.manifest['segments']]
+        self._weights = None
+
+    @staticmethod
+    def exists(directory=INDEX_DIRECTORY):
+        return os.path.exists(os.path.join(directory, 'manifest.json'))
+
+    def __len__(self):
+        return self.manifest['documents']
+
+    def _open_segment(self, name):
+        path = os.path.join(self.directory, name)
+        return {array: np.load(os.path.join(path, f'{array}.npy'), mmap_mode='r')
+                for array in SEGMENT_ARRAYS}
+
+    # --- building -----------------------------------------------------------
+
+    @classmethod
+    def build(cls, conn, directory=INDEX_DIRECTORY):
+        """Vectorize every technology into a fresh single-segment index"""
+        os.makedirs(directory, exist_ok=True)
+        vocabulary = {}
+        cursor = conn.execute(
+            "SELECT id, technology_name, description FROM ml_technologies ORDER BY id")
+        parts = []
+        while True:
+            rows = cursor.fetchmany(VECTORIZE_CHUNK_SIZE)
+            if not rows:
+                break
+            parts.append(_vectorize(rows, vocabulary))
+        matrix = _concatenate(parts) if parts else _vectorize([], vocabulary)
+        # Segment names are never reused, so readers still holding the old
+        # segments memory-mapped are not truncated under them
+        next_segment = _read_manifest(directory)['next_segment'] if cls.exists(directory) else 0
+        manifest = {'segments': [], 'documents': 0, 'max_id': 0, 'next_segment': next_segment}
+        frequency = np.zeros(0, dtype=np.int64)
+        cls._write(directory, manifest, vocabulary, frequency, [matrix])
+        return cls(directory)
+
+    def update(self, conn):
+        """Add the technologies inserted since the last build or update.
+
+        Rebuilds instead when rows the index covers were deleted. Returns the
+        number of rows vectorized.
+        """
+        max_id = self.manifest['max_id']
+        covered = conn.execute("SELECT COUNT(*) FROM ml_technologies WHERE id <= ?",
+                               (max_id,)).fetchone()[0]
+        if covered != len(self):
+            rebuilt = type(self).build(conn, self.directory)
+            self.__dict__.update(rebuilt.__dict__)
+            return len(self)
+        rows = conn.execute(
+            "SELECT id, technology_name, description FROM ml_technologies WHERE id > ? ORDER BY id",
+            (max_id,)).fetchall()
+        if not rows:
+            return 0
+        matrices = [_vectorize(rows, self.vocabulary)]
+        if len(self.segments) + 1 > MAX_SEGMENTS:
+            # Merge everything back into one segment; nothing is re-read
+            # from SQLite
+            matrices = [_concatenate([tuple(np.asarray(segment[array]) for array in SEGMENT_ARRAYS[:4])
+                                      for segment in self.segments] + matrices)]
+            self.manifest = dict(self.manifest, segments=[], documents=0)
+            self.document_frequency = np.zeros(0, dtype=np.int64)
+        type(self)._write(self.directory, self.manifest, self.vocabulary,
+                          self.document_frequency, matrices)
+        self.__dict__.update(type(self)(self.directory).__dict__)
+        return len(rows)
+
+    @staticmethod
+    def _write(directory, manifest, vocabulary, frequency, matrices):
+        """Write matrices as new segments, then the vocabulary, document
+        frequencies and manifest; the manifest is replaced last, so a reader
+        never sees a half-written index. Unlisted segments are removed."""
+        manifest = dict(manifest, segments=list(manifest['segments']))
+        frequency = np.concatenate([frequency, np.zeros(len(vocabulary) - len(frequency), np.int64)])
+        for ids, indptr, terms, weights in matrices:
+            name = f"segment-{manifest['next_segment']:06d}"
+            path = os.path.join(directory, name)
+            os.makedirs(path, exist_ok=True)
+            for array, values in _segment(ids, indptr, terms, weights, len(vocabulary)).items():
+                np.save(os.path.join(path, f'{array}.npy'), values)
+            frequency += np.bincount(terms, minlength=len(vocabulary))
+            manifest['segments'].append(name)
+            manifest['next_segment'] += 1
+            manifest['documents'] += len(ids)
+            if len(ids):
+                manifest['max_id'] = max(manifest['max_id'], int(ids[-1]))
+
+        terms_list = sorted(vocabulary, key=vocabulary.get)
+        for name, write in (
+                ('terms.json', lambda f: json.dump(terms_list, f, ensure_ascii=False)),
+                ('document_frequency.npy', lambda f: np.save(f, frequency)),
+                ('manifest.json', lambda f: json.dump(manifest, f, indent=2))):
+            binary = name.endswith('.npy')
+            temporary = os.path.join(directory, name + '.tmp')
+            with open(temporary, 'wb' if binary else 'w', encoding=None if binary else 'utf-8') as f:
+                write(f)
+            os.replace(temporary, os.path.join(directory, name))
+
+        for name in os.listdir(directory):
+            if name.startswith('segment-') and name not in manifest['segments']:
+                shutil.rmtree(os.path.join(directory, name))
+
+    # --- querying -----------------------------------------------------------
+
+    def _idf(self):
+        """Smoothed IDF per term, ln((1 + n) / (1 + df)) + 1"""
+        return (np.log((1 + len(self)) / (1 + self.document_frequency)) + 1).astype(np.float32)
+
+    def _prepare(self):
+        """IDF and per-segment row norms; computed once per opened index,
+        since IDF shifts whenever rows are added"""
+        if self._weights is None:
+            idf = self._idf()
+            norms = []
+            for segment in self.segments:
+                indptr = np.asarray(segment['doc_indptr'])
+                squares = (segment['doc_weights'] * idf[segment['doc_terms']]) ** 2
+                norm = np.ones(len(indptr) - 1, dtype=np.float32)
+                filled = np.flatnonzero(np.diff(indptr))
+                if len(filled):
+                    norm[filled] = np.sqrt(np.add.reduceat(squares, indptr[filled]))
+                norms.append(norm)
+            self._weights = idf, norms
+        return self._weights
+
+    def _vector(self, terms, weights):
+        """IDF-weighted, unit-length query vector"""
+        idf, _ = self._prepare()
+        terms = np.asarray(terms, dtype=np.int64)
+        values = np.asarray(weights, dtype=np.float32) * idf[terms]
+        norm = np.sqrt((values ** 2).sum())
+        return terms, values / norm if norm else values
+
+    def _nearest(self, terms, values, k, exclude=None):
+        """Top k (ids, scores) by cosine similarity to a query vector"""
+        idf, norms = self._prepare()
+        found_ids, found_scores = [], []
+        for segment, norm in zip(self.segments, norms):
+            term_indptr = segment['term_indptr']
+            docs, contributions = [], []
+            for term, value in zip(terms.tolist(), values.tolist()):
+                # Terms newer than the segment have no postings in it
+                if term + 1 >= len(term_indptr):
+                    continue
+                start, end = term_indptr[term], term_indptr[term + 1]
+                if start < end:
+                    docs.append(segment['term_docs'][start:end])
+                    contributions.append(segment['term_weights'][start:end] * (value * idf[term]))
+            if not docs:
+                continue
+            scores = np.bincount(np.concatenate(docs), weights=np.concatenate(contributions),
+                                 minlength=len(norm)) / norm
+            ids = np.asarray(segment['ids'])
+            if exclude is not None:
+                position = np.searchsorted(ids, exclude)
+                if position < len(ids) and ids[position] == exclude:
+                    scores[position] = 0
+            segment_ids, segment_scores = _top(scores, ids, k)
+            found_ids.append(segment_ids)
+            found_scores.append(segment_scores)
+        if not found_ids:
+            return []
+        ids, scores = _top(np.concatenate(found_scores), np.concatenate(found_ids), k)
+        return list(zip(ids.tolist(), scores.tolist()))
+
+    def similar(self, technology_id, k=10):
+        """Return [(id, cosine similarity)] of the k technologies nearest to one"""
+        for segment in self.segments:
+            ids = segment['ids']
+            position = int(np.searchsorted(ids, technology_id))
+            if position < len(ids) and ids[position] == technology_id:
+                start, end = segment['doc_indptr'][position], segment['doc_indptr'][position + 1]
+                terms, values = self._vector(segment['doc_terms'][start:end],
+                                             segment['doc_weights'][start:end])
+                return self._nearest(terms, values, k, exclude=technology_id)
+        raise KeyError(f"Technology {technology_id} is not in the similarity index")
+
+    def search(self, text, k=10):
+        """Return [(id, cosine similarity)] of the k technologies nearest to free text"""
+        counts = collections.Counter(self.vocabulary[token] for token in tokenize(text)
+                                     if token in self.vocabulary)
+        if not counts:
+            return []
+        terms, values = self._vector(list(counts), [1 + np.log(count) for count in counts.values()])
+        return self._nearest(terms, values, k)
+
+def open_index(conn, directory=INDEX_DIRECTORY):
+    """Open the index under directory, building it or adding new rows first"""
+    if not SimilarityIndex.exists(directory):
+        return SimilarityIndex.build(conn, directory)
+    index = SimilarityIndex(directory)
+    index.update(conn)
+    return index
+
+def _describe(conn, matches):
+    """Attach (company_name, technology_name, technology_type) to (id, score)
+    matches, in order, dropping rows deleted since the index was updated"""
+    if not matches:
+        return []
+    placeholders = ', '.join('?' for _ in matches)
+    rows = {row[0]: row[1:] for row in conn.execute(
+        f"SELECT id, company_name, technology_name, technology_type FROM ml_technologies_labeled "
+        f"WHERE id IN ({placeholders})", [row_id for row_id, _ in matches])}
+    return [rows[row_id] + (score,) for row_id, score in matches if row_id in rows]
+
+def similar_technologies(conn, index, company_name, technology_name, k=10):
+    """Return (company, technology, type, score) of the k technologies most
+    similar to one, by TF-IDF cosine over name and description"""
+    row = conn.execute("SELECT id FROM ml_technologies WHERE company_name = ? AND technology_name = ?",
+                       (company_name, technology_name)).fetchone()
+    if row is None:
+        raise KeyError(f"No technology {technology_name!r} from {company_name!r}")
+    return _describe(conn, index.similar(row[0], k))
+
+def search_similar(conn, index, text, k=10):
+    """Return (company, technology, type, score) of the k technologies nearest to free text"""
+    return _describe(conn, index.search(text, k))
+
+def main():
+    """Build or update the similarity index and run a nearest-technology query"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database', default=DATABASE_PATH)
+    parser.add_argument('--index', default=INDEX_DIRECTORY, help='directory of the .npy segments')
+    parser.add_argument('--rebuild', action='store_true', help='re-vectorize every row')
+    parser.add_argument('--company', default='DATAGOD')
+    parser.add_argument('--technology', default='Anomaly Detection Engine')
+    parser.add_argument('--text', help='free-text query instead of a technology')
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    print("🚀 Updating technology similarity index...")
+
+    conn = ml_database_migrations.connect(args.database)
+    started = time.perf_counter()
+    if args.rebuild:
+        index = SimilarityIndex.build(conn, args.index)
+    else:
+        index = open_index(conn, args.index)
+    print(f"✅ {len(index)} technologies, {len(index.vocabulary)} terms, "
+          f"{len(index.segments)} segments ({time.perf_counter() - started:.2f}s)")
+
+    started = time.perf_counter()
+    if args.text:
+        label = args.text
+        results = search_similar(conn, index, args.text, args.top)
+    else:
+        label = f"{args.company} {args.technology}"
+        results = similar_technologies(conn, index, args.company, args.technology, args.top)
+    elapsed = (time.perf_counter() - started) * 1000
+    conn.close()
+
+    print(f"\n🔍 MOST SIMILAR TO {label.upper()} ({elapsed:.1f} ms):")
+    print("=" * 80)
+    for company, technology, technology_type, score in results:
+        print(f"• {score:.3f}  {company} - {technology} ({technology_type})")
+
+if __name__ == "__main__":
+    main()
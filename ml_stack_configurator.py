@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Autopilot stack configurator: picks a flight controller, GPS module,
+telemetry radio, power module and IMU, barometer and magnetometer for a
+flight control system by branch-and-bound over per-slot candidate sets,
+within a budget and a power envelope
+"""
+
+import argparse
+import heapq
+import itertools
+import sys
+
+import ml_database_migrations
+import ml_sensor_specs
+
+# (slot, table, category, spec column, better, unit). A slot with a spec is
+# ranked by that column under the 'best' objective, comparing only rows
+# whose unit column (SPEC_UNITS) holds the unit given; other rows score 0.
+# IMU accuracy is a temperature coefficient, so IMUs rank on gyro range
+STACK_SLOTS = (
+    ('flight_controller', 'equipment', 'Flight Controller', 'clock_mhz', 'higher', None),
+    ('gps', 'equipment', 'GPS Module', None, None, None),
+    ('telemetry', 'equipment', 'Telemetry Radio', None, None, None),
+    ('power_module', 'equipment', 'Power Management', None, None, None),
+    ('imu', 'sensors', 'IMU', 'range_max', 'higher', 'rad/s'),
+    ('barometer', 'sensors', 'Barometer', 'accuracy_value', 'lower', 'Pa'),
+    ('magnetometer', 'sensors', 'Magnetometer', 'accuracy_value', 'lower', 'rad'),
+)
+
+# Spec column -> the column holding its SI unit
+SPEC_UNITS = {'accuracy_value': 'accuracy_unit', 'range_max': 'range_unit'}
+
+SLOT_NAMES = tuple(slot[0] for slot in STACK_SLOTS)
+SLOT_CATEGORIES = {slot[0]: slot[2] for slot in STACK_SLOTS}
+
+# table -> (category column, resource column, extra condition). Equipment
+# costs its lowest listed price and must be linked to the system; sensors
+# have no price and draw their supply current
+SLOT_TABLES = {
+    'equipment': ('category', 'price_min_cents',
+                  'EXISTS (SELECT 1 FROM compatibility c '
+                  'WHERE c.system_id = :system AND c.equipment_id = t.id)'),
+    'sensors': ('type', 'current_amps', None),
+}
+
+OBJECTIVES = ('cheapest', 'best')
+DEFAULT_TOP = 5
+
+# Positions in a candidate part tuple
+SLOT, ID, NAME, COST, CURRENT, SCORE = range(6)
+
+# Parts carry current in nanoamps and score in millionths of the slot's best,
+# so stack sums and the bounds compare exactly
+CURRENT_SCALE = 10 ** 9
+SCORE_SCALE = 10 ** 6
+
+def candidate_sql(table, spec=None, better=None, unit=None, ranked=False):
+    """Return the walk over a slot's rows, as (id, name, resource, spec value).
+
+    Unranked walks go cheapest resource first; a ranked walk goes best spec
+    first. With a spec but not ranked, only the rows the spec cannot rank
+    are walked.
+    """
+    category, resource, condition = SLOT_TABLES[table]
+    clauses = [f"t.{category} = :category", f"t.{resource} IS NOT NULL"]
+    if condition:
+        clauses.append(condition)
+    value = 'NULL'
+    order = f"t.{resource}, t.id"
+    if spec and ranked:
+        clauses.append(f"t.{spec} IS NOT NULL")
+        if unit:
+            clauses.append(f"t.{SPEC_UNITS[spec]} = :unit")
+        value = f"t.{spec}"
+        order = f"t.{spec}{' DESC' if better == 'higher' else ''}, t.{resource}, t.id"
+    elif spec:
+        clauses.append(f"(t.{spec} IS NULL OR t.{SPEC_UNITS[spec]} IS NOT :unit)" if unit
+                       else f"t.{spec} IS NULL")
+    return (f"SELECT t.id, t.name, t.{resource}, {value} FROM {table} t "
+            f"WHERE {' AND '.join(clauses)} ORDER BY {order} LIMIT :limit")
+
+def _front(rows, top, floor):
+    """Keep the rows, walked best score first, that fewer than ``top``
+    earlier rows match on resource. The rest cannot be in a top-``top``
+    stack: swapping in any of those rows gives one at least as good.
+    Stops once ``top`` kept rows sit at the slot's lowest resource."""
+    kept = []
+    smallest = []   # negated, the top lowest resources walked so far
+    for row in rows:
+        resource = row[2]
+        if len(smallest) == top:
+            if resource >= -smallest[0]:
+                continue
+            heapq.heapreplace(smallest, -resource)
+        else:
+            heapq.heappush(smallest, -resource)
+        kept.append(row)
+        if len(smallest) == top and -smallest[0] <= floor:
+            break
+    return kept
+
+def _add(a, b):
+    return tuple(x + y for x, y in zip(a, b))
+
+class StackConfigurator:
+    """Per-slot candidate sets for one flight control system and objective.
+
+    Candidates depend on the system, objective and ``top`` only, so one
+    configurator answers any number of budgets and power envelopes.
+    """
+
+    def __init__(self, conn, system, objective='cheapest', top=DEFAULT_TOP, slots=SLOT_NAMES):
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective: {objective}")
+        row = conn.execute("SELECT id FROM flight_control_systems WHERE name = ?",
+                           (system,)).fetchone()
+        if row is None:
+            raise ValueError(f"Unknown flight control system: {system}")
+        unknown = set(slots) - set(SLOT_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown slots: {', '.join(sorted(unknown))}")
+        self.system = system
+        self.objective = objective
+        self.top = top
+        self.candidates = {}
+        for slot in STACK_SLOTS:
+            if slot[0] in slots:
+                self.candidates[slot[0]] = self._load_slot(conn, row[0], *slot)
+
+    def _load_slot(self, conn, system_id, slot, table, category, spec, better, unit):
+        """Walk a slot's rows into parts (slot, id, name, cost, current, score)"""
+        params = {'category': category, 'system': system_id, 'unit': unit, 'limit': self.top}
+        if spec is None or self.objective != 'best':
+            rows = conn.execute(candidate_sql(table), params).fetchall()
+        else:
+            cheapest = conn.execute(candidate_sql(table), dict(params, limit=1)).fetchone()
+            if cheapest is None:
+                return []
+            def walk():
+                yield from conn.execute(candidate_sql(table, spec, better, unit, True),
+                                        dict(params, limit=-1))
+                # Only reached when the ranked walk does not stop early
+                yield from conn.execute(candidate_sql(table, spec, better, unit), params)
+            rows = _front(walk(), self.top, cheapest[2])
+        best = next((value for *_, value in rows if value), None)
+        parts = []
+        for row_id, name, resource, value in rows:
+            if not value:
+                score = 0
+            elif better == 'higher':
+                score = round(SCORE_SCALE * value / best)
+            else:
+                score = round(SCORE_SCALE * best / value)
+            if table == 'equipment':
+                cost, current = resource, 0
+            else:
+                cost, current = 0, round(resource * CURRENT_SCALE)
+            parts.append((slot, row_id, name, cost, current, score))
+        return parts
+
+    def _key(self, part):
+        """The objective a part adds to its stack, smaller first"""
+        if self.objective == 'best':
+            return (-part[SCORE], part[COST], part[CURRENT])
+        return (part[COST], part[CURRENT])
+
+    def solve(self, budget_cents=None, max_amps=None, top=None):
+        """Return the ``top`` best stacks (at most the configurator's top)
+        costing at most ``budget_cents`` and drawing at most ``max_amps``"""
+        top = min(top or self.top, self.top)
+        # Fewest candidates first keeps the upper levels of the tree narrow
+        slots = sorted(([(self._key(part), part) for part in sorted(parts, key=self._key)]
+                        for parts in self.candidates.values()), key=len)
+        if not slots or not all(slots):
+            return []
+        width = len(slots[0][0][0])
+        # Lowest cost, current and objective any completion from a level adds
+        floor_cost = [0] * (len(slots) + 1)
+        floor_current = [0] * (len(slots) + 1)
+        floor_key = [(0,) * width] * (len(slots) + 1)
+        for level in range(len(slots) - 1, -1, -1):
+            floor_cost[level] = floor_cost[level + 1] + min(part[COST] for _, part in slots[level])
+            floor_current[level] = (floor_current[level + 1]
+                                    + min(part[CURRENT] for _, part in slots[level]))
+            floor_key[level] = _add(floor_key[level + 1],
+                                    tuple(map(min, zip(*(key for key, _ in slots[level])))))
+        budget = float('inf') if budget_cents is None else budget_cents
+        envelope = float('inf') if max_amps is None else round(max_amps * CURRENT_SCALE)
+        stacks = []   # heap of (negated key, -sequence, parts): the worst stack first
+        sequence = itertools.count()
+
+        def search(level, key, cost, current, chosen):
+            if level == len(slots):
+                entry = (tuple(-x for x in key), -next(sequence), chosen)
+                if len(stacks) < top:
+                    heapq.heappush(stacks, entry)
+                else:
+                    heapq.heapreplace(stacks, entry)
+                return
+            for part_key, part in slots[level]:
+                total = _add(key, part_key)
+                if (len(stacks) == top
+                        and _add(total, floor_key[level + 1]) >= tuple(-x for x in stacks[0][0])):
+                    # Parts come in key order, so no later one does better
+                    break
+                stack_cost = cost + part[COST]
+                stack_current = current + part[CURRENT]
+                if (stack_cost + floor_cost[level + 1] > budget
+                        or stack_current + floor_current[level + 1] > envelope):
+                    continue
+                search(level + 1, total, stack_cost, stack_current, chosen + (part,))
+
+        search(0, (0,) * width, 0, 0, ())
+        return [_stack(chosen) for _, _, chosen in sorted(stacks, key=lambda entry: (
+            tuple(-x for x in entry[0]), -entry[1]))]
+
+    def exhaustive(self, budget_cents=None, max_amps=None, top=None):
+        """Return what ``solve`` should, by scoring every combination of
+        candidates. Only fit for checking ``solve`` on small candidate sets"""
+        top = min(top or self.top, self.top)
+        if not self.candidates or not all(self.candidates.values()):
+            return []
+        budget = float('inf') if budget_cents is None else budget_cents
+        envelope = float('inf') if max_amps is None else round(max_amps * CURRENT_SCALE)
+        fits = [chosen for chosen in itertools.product(*self.candidates.values())
+                if sum(part[COST] for part in chosen) <= budget
+                and sum(part[CURRENT] for part in chosen) <= envelope]
+        fits.sort(key=lambda chosen: tuple(map(sum, zip(*map(self._key, chosen)))))
+        return [_stack(chosen) for chosen in fits[:top]]
+
+def _stack(chosen):
+    """Report a stack's parts in slot order with its totals"""
+    chosen = sorted(chosen, key=lambda part: SLOT_NAMES.index(part[SLOT]))
+    return {
+        'cost_cents': sum(part[COST] for part in chosen),
+        'current_amps': sum(part[CURRENT] for part in chosen) / CURRENT_SCALE,
+        'score': sum(part[SCORE] for part in chosen) / SCORE_SCALE,
+        'parts': [(part[SLOT], part[ID], part[NAME]) for part in chosen],
+    }
+
+def configure_stack(conn, system, budget_cents=None, max_amps=None, objective='cheapest',
+                    top=DEFAULT_TOP, slots=SLOT_NAMES):
+    """Return the ``top`` cheapest or best-spec stacks for a flight control
+    system, e.g. configure_stack(conn, 'PX4', budget_cents=80000, max_amps=0.05)"""
+    configurator = StackConfigurator(conn, system, objective, top, slots)
+    return configurator.solve(budget_cents, max_amps)
+
+def _sweep(values, steps):
+    """Up to ``steps`` evenly spaced values of a sorted list, and no limit"""
+    values = sorted(set(values))
+    stride = max(1, len(values) // steps)
+    return [None] + values[stride - 1::stride]
+
+def verify_solve(configurator, steps=8):
+    """Return (budget, envelope) for every point of a sweep where ``solve``
+    and ``exhaustive`` disagree on the totals of the top stacks.
+
+    The sweep walks the stack totals themselves, where a stack just fits or
+    just misses. Equal-objective stacks may come in either order, so only
+    the totals are compared.
+    """
+    combinations = list(itertools.product(*configurator.candidates.values()))
+    budgets = _sweep((sum(part[COST] for part in chosen) for chosen in combinations), steps)
+    envelopes = _sweep((sum(part[CURRENT] for part in chosen) / CURRENT_SCALE
+                        for chosen in combinations), steps)
+
+    def totals(stacks):
+        return [(stack['cost_cents'], stack['current_amps'], stack['score']) for stack in stacks]
+
+    return [(budget, envelope) for budget in budgets for envelope in envelopes
+            if totals(configurator.solve(budget, envelope))
+            != totals(configurator.exhaustive(budget, envelope))]
+
+def main():
+    """Print the best autopilot stacks for a flight control system"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database', default=ml_database_migrations.DATABASE_PATH)
+    parser.add_argument('--system', default='PX4', help='flight control system name')
+    parser.add_argument('--budget', type=float, help='dollars, at the parts\' lowest listed prices')
+    parser.add_argument('--max-current-ma', type=float, help='sensor supply current envelope')
+    parser.add_argument('--objective', choices=OBJECTIVES, default='cheapest')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP)
+    parser.add_argument('--skip', action='append', default=[], choices=SLOT_NAMES,
+                        help='leave a slot out of the stack; repeatable')
+    parser.add_argument('--verify', action='store_true',
+                        help='check the search against every combination of candidates '
+                             'over a sweep of budgets and envelopes')
+    args = parser.parse_args()
+
+    conn = ml_database_migrations.connect(args.database)
+    configurator = StackConfigurator(
+        conn, args.system, args.objective, args.top,
+        tuple(slot for slot in SLOT_NAMES if slot not in args.skip))
+    conn.close()
+    budget_cents = None if args.budget is None else round(args.budget * 100)
+    max_amps = None if args.max_current_ma is None else args.max_current_ma / 1000
+
+    if args.verify:
+        mismatches = verify_solve(configurator)
+        if mismatches:
+            print("❌ Branch-and-bound disagrees with exhaustive search at:")
+            for budget, envelope in mismatches:
+                print(f"   • budget {budget} cents, envelope {envelope} A")
+            sys.exit(1)
+        print("✅ Branch-and-bound matches exhaustive search")
+        return
+
+    stacks = configurator.solve(budget_cents, max_amps)
+
+    print(f"\n🛩️  {args.objective.upper()} {args.system.upper()} STACKS ({len(stacks)}):")
+    print("=" * 80)
+    if not stacks:
+        print("No stack fits the budget and power envelope.")
+    for number, stack in enumerate(stacks, 1):
+        score = f", spec score {stack['score']:.2f}" if args.objective == 'best' else ''
+        print(f"\n{number}. ${stack['cost_cents'] / 100:,.2f}, "
+              f"{ml_sensor_specs.format_si(stack['current_amps'], 'A')} sensor draw{score}")
+        for slot, _, name in stack['parts']:
+            print(f"   • {SLOT_CATEGORIES[slot]}: {name}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Integer day numbers for ml_technologies.implementation_date and time-bucket
+reports over the adoption_summary rollup (technologies per year or quarter
+by type or company)
+"""
+
+import argparse
+import datetime
+import re
+
+import ml_database_migrations
+
+# Days since 1970-01-01, derived from implementation_date
+DAY_COLUMN = 'implementation_day'
+DAY_COLUMN_NAMES = (DAY_COLUMN,)
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# SQL form of parse_day() for the backfill. A modifier makes date() roll
+# impossible dates such as 2024-02-30 over, so only text it returns
+# unchanged gets a day
+DAY_SQL = ("CASE WHEN date(implementation_date, '+0 days') = implementation_date "
+           "THEN CAST(julianday(implementation_date) - 2440587.5 AS INTEGER) END")
+
+TECHNOLOGIES_BETWEEN = f"""
+    SELECT company_name, technology_name, technology_type, implementation_date
+    FROM ml_technologies_labeled
+    WHERE {DAY_COLUMN} BETWEEN ? AND ?
+    ORDER BY {DAY_COLUMN}, id
+    LIMIT ?
+    """
+
+# bucket -> (period label, adoption_summary key columns)
+BUCKETS = {
+    'year': ("CAST(year AS TEXT)", 'year'),
+    'quarter': ("year || '-Q' || quarter", 'year, quarter'),
+}
+
+# group -> (adoption_summary key column, the value reported for it).
+# adoption_summary holds category_id; a type is reported by its name
+ADOPTION_GROUPS = {
+    'technology_type': ('category_id',
+                        "(SELECT category_name FROM technology_categories WHERE id = category_id)"),
+    'company_name': ('company_name', 'company_name'),
+}
+
+# (keyword, condition) filters accepted by build_adoption_query
+ADOPTION_FILTERS = (
+    ('start_year', 'year >= ?'),
+    ('end_year', 'year <= ?'),
+    ('technology_type', 'category_id = (SELECT id FROM technology_categories WHERE category_name = ?)'),
+    ('company_name', 'company_name = ?'),
+)
+
+def parse_day(value):
+    """Return (day number,) for a YYYY-MM-DD date, (None,) for anything else"""
+    if not isinstance(value, str) or not DATE_PATTERN.match(value):
+        return (None,)
+    try:
+        return (datetime.date.fromisoformat(value).toordinal() - EPOCH_ORDINAL,)
+    except ValueError:
+        return (None,)
+
+def day_to_date(day):
+    """Return the ISO date of a day number"""
+    return datetime.date.fromordinal(day + EPOCH_ORDINAL).isoformat()
+
+def backfill_days(conn):
+    """Recompute implementation_day for every row; return rows changed.
+
+    Does not commit.
+    """
+    return conn.execute(f"UPDATE ml_technologies SET {DAY_COLUMN} = {DAY_SQL} "
+                        f"WHERE {DAY_COLUMN} IS NOT {DAY_SQL}").rowcount
+
+def technologies_between(conn, start_date, end_date, limit=100):
+    """Technologies implemented between two ISO dates inclusive, oldest first"""
+    (start,), (end,) = parse_day(start_date), parse_day(end_date)
+    if start is None or end is None:
+        raise ValueError("dates must be YYYY-MM-DD")
+    return conn.execute(TECHNOLOGIES_BETWEEN, (start, end, limit)).fetchall()
+
+def build_adoption_query(bucket='quarter', by='technology_type', **filters):
+    """Return (sql, params) counting technologies per time bucket.
+
+    Rows are (period, group value, count) with ``by`` set to a key of
+    ADOPTION_GROUPS, or (period, count) with ``by=None``. Only
+    adoption_summary is read; the base table is never scanned.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown bucket: {bucket}")
+    if by is not None and by not in ADOPTION_GROUPS:
+        raise ValueError(f"Cannot group adoptions by {by}")
+    label, keys = BUCKETS[bucket]
+    clauses = []
+    params = []
+    for keyword, condition in ADOPTION_FILTERS:
+        value = filters.pop(keyword, None)
+        if value is not None:
+            clauses.append(condition)
+            params.append(value)
+    if filters:
+        raise ValueError(f"Unknown filters: {', '.join(sorted(filters))}")
+    group = f"{keys}, {ADOPTION_GROUPS[by][0]}" if by else keys
+    selected = f"{label} AS period, {ADOPTION_GROUPS[by][1]} AS {by}" if by else f"{label} AS period"
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    sql = (f"SELECT {selected}, SUM(technology_count) FROM adoption_summary {where} "
+           f"GROUP BY {group} ORDER BY {group}")
+    return sql, params
+
+def adoptions(conn, bucket='quarter', by='technology_type', **filters):
+    """Technologies per year or quarter, e.g. adoptions(conn, 'quarter',
+    'technology_type', start_year=2020)"""
+    sql, params = build_adoption_query(bucket, by, **filters)
+    return conn.execute(sql, params).fetchall()
+
+def main():
+    """Print technology adoptions per time bucket from the rollup"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database', default=ml_database_migrations.DATABASE_PATH)
+    parser.add_argument('--bucket', choices=sorted(BUCKETS), default='quarter')
+    parser.add_argument('--by', choices=tuple(ADOPTION_GROUPS) + ('none',), default='technology_type')
+    parser.add_argument('--start-year', type=int)
+    parser.add_argument('--end-year', type=int)
+    parser.add_argument('--technology-type')
+    parser.add_argument('--company')
+    parser.add_argument('--backfill', action='store_true', help='recompute implementation_day first')
+    args = parser.parse_args()
+
+    conn = ml_database_migrations.connect(args.database)
+    if args.backfill:
+        print("🚀 Backfilling implementation days...")
+        changed = backfill_days(conn)
+        conn.commit()
+        print(f"✅ {changed} rows updated")
+
+    by = None if args.by == 'none' else args.by
+    results = adoptions(conn, args.bucket, by, start_year=args.start_year,
+                        end_year=args.end_year, technology_type=args.technology_type,
+                        company_name=args.company)
+    conn.close()
+
+    heading = f"ADOPTIONS PER {args.bucket.upper()}" + (f" BY {by.upper()}" if by else '')
+    print(f"\n📈 {heading}:")
+    print("=" * 60)
+    for row in results:
+        if by:
+            period, value, count = row
+            print(f"• {period}  {value}: {count}")
+        else:
+            period, count = row
+            print(f"• {period}: {count}")
+
+if __name__ == "__main__":
+    main()
@@ -3,60 +3,552 @@
 Script to query the ML technologies database
 """
 
-import sqlite3
+import base64
+import json
+from collections import OrderedDict
 
-def connect_to_database():
-    """Connect to the SQLite database"""
-    return sqlite3.connect('/home/vovkes/DATADOG/ml_technologies.db')
+import ml_database_migrations
+import ml_equipment_specs
+import ml_search_index
+import ml_sensor_specs
+import ml_stack_configurator
+import ml_time_buckets
 
-def show_all_companies():
-    """Display all companies in the database"""
-    conn = connect_to_database()
-    cursor = conn.cursor()
-    query = """
+DATABASE_PATH = ml_database_migrations.DATABASE_PATH
+
+# Read-side tuning applied once per connection
+SESSION_PRAGMAS = (
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Number of prepared statements sqlite3 keeps per connection
+STATEMENT_CACHE_SIZE = 256
+
+# Result cache bounds: cached queries per session, and the largest result kept
+RESULT_CACHE_ENTRIES = 256
+RESULT_CACHE_MAX_ROWS = 10000
+
+COMPANIES_QUERY = """
+    SELECT company_name, industry, country, founded_year, description
+    FROM companies
+    ORDER BY company_name
+    """
+
+COMPANY_TECHNOLOGIES_QUERY = """
+    SELECT technology_name, technology_type, application_area, description, implementation_date
+    FROM ml_technologies_labeled
+    WHERE company_name = ?
+    ORDER BY implementation_date DESC
+    """
+
+ALL_TECHNOLOGIES_QUERY = """
+    SELECT company_name, technology_name, technology_type, application_area, description
+    FROM ml_technologies_labeled
+    ORDER BY company_name, technology_name
+    """
+
+CATEGORIES_QUERY = """
+    SELECT category_name, description
+    FROM technology_categories
+    ORDER BY category_name
+    """
+
+# Indexed reads of the trigger-maintained tables from ml_database_summary.py
+SUMMARY_COMPANY_STATS_QUERY = """
+    SELECT company_name, industry, technology_count
+    FROM company_summary
+    ORDER BY technology_count DESC, company_name
+    """
+
+SUMMARY_TECHNOLOGY_TYPE_STATS_QUERY = """
+    SELECT
+        (SELECT category_name FROM technology_categories tc WHERE tc.id = s.category_id) AS technology_type,
+        s.technology_count
+    FROM technology_type_summary s
+    ORDER BY s.technology_count DESC, technology_type
+    """
+
+# Keyset-paginated variants of the report queries. Each page resumes strictly
+# after the sort key of the last row seen, so a page costs an index range
+# probe no matter how deep into the listing it is.
+DEFAULT_PAGE_SIZE = 500
+MAX_ROWID = 2 ** 63 - 1
+
+COMPANIES_FIRST_PAGE = """
     SELECT company_name, industry, country, founded_year, description
     FROM companies
     ORDER BY company_name
+    LIMIT ?
+    """
+
+COMPANIES_NEXT_PAGE = """
+    SELECT company_name, industry, country, founded_year, description
+    FROM companies
+    WHERE company_name > ?
+    ORDER BY company_name
+    LIMIT ?
+    """
+
+ALL_TECHNOLOGIES_FIRST_PAGE = """
+    SELECT company_name, technology_name, technology_type, application_area, description, id
+    FROM ml_technologies_labeled
+    ORDER BY company_name, technology_name, id
+    LIMIT ?
+    """
+
+ALL_TECHNOLOGIES_NEXT_PAGE = """
+    SELECT company_name, technology_name, technology_type, application_area, description, id
+    FROM ml_technologies_labeled
+    WHERE (company_name, technology_name, id) > (?, ?, ?)
+    ORDER BY company_name, technology_name, id
+    LIMIT ?
+    """
+
+# implementation_date may be NULL; those rows sort last under DESC and are
+# paged separately by id because row-value comparisons skip NULLs
+COMPANY_TECHNOLOGIES_FIRST_PAGE = """
+    SELECT technology_name, technology_type, application_area, description, implementation_date, id
+    FROM ml_technologies_labeled
+    WHERE company_name = ?
+    ORDER BY implementation_date DESC, id DESC
+    LIMIT ?
+    """
+
+COMPANY_TECHNOLOGIES_NEXT_PAGE = """
+    SELECT technology_name, technology_type, application_area, description, implementation_date, id
+    FROM ml_technologies_labeled
+    WHERE company_name = ? AND (implementation_date, id) < (?, ?)
+    ORDER BY implementation_date DESC, id DESC
+    LIMIT ?
+    """
+
+COMPANY_TECHNOLOGIES_UNDATED_PAGE = """
+    SELECT technology_name, technology_type, application_area, description, implementation_date, id
+    FROM ml_technologies_labeled
+    WHERE company_name = ? AND implementation_date IS NULL AND id < ?
+    ORDER BY id DESC
+    LIMIT ?
+    """
+
+CATEGORIES_FIRST_PAGE = """
+    SELECT category_name, description
+    FROM technology_categories
+    ORDER BY category_name
+    LIMIT ?
+    """
+
+CATEGORIES_NEXT_PAGE = """
+    SELECT category_name, description
+    FROM technology_categories
+    WHERE category_name > ?
+    ORDER BY category_name
+    LIMIT ?
+    """
+
+# Streamed company stats come in company order: a keyset cannot follow the
+# technology_count ordering of SUMMARY_COMPANY_STATS_QUERY
+SUMMARY_COMPANY_STATS_PAGE = """
+    SELECT company_name, industry, technology_count
+    FROM company_summary
+    WHERE company_name > ?
+    ORDER BY company_name
+    LIMIT ?
+    """
+
+def encode_cursor(report, key):
+    """Pack a report name and sort key into an opaque cursor token"""
+    payload = json.dumps([report, key], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(report, token):
+    """Unpack a cursor token, checking that it belongs to the report"""
+    if token is None:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        name, key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor token: {token!r}") from exc
+    if name != report:
+        raise ValueError(f"Cursor token belongs to '{name}', not '{report}'")
+    return key
+
+class RowStream:
+    """Iterator over a report that fetches one keyset page at a time.
+
+    Only the current page is held in memory. ``cursor`` is the opaque token
+    for the last row handed out; pass it back as ``after`` to resume the
+    listing from the next row.
+    """
+
+    def __init__(self, report, fetch_page, key_of, row_of, after=None,
+                 page_size=DEFAULT_PAGE_SIZE):
+        self.report = report
+        self.page_size = page_size
+        self._fetch_page = fetch_page
+        self._key_of = key_of
+        self._row_of = row_of
+        self._key = decode_cursor(report, after)
+        self._page = []
+        self._position = 0
+        self._exhausted = False
+
+    @property
+    def cursor(self):
+        """Token that resumes after the last row returned, or None at the start"""
+        if self._key is None:
+            return None
+        return encode_cursor(self.report, self._key)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._position >= len(self._page):
+            if self._exhausted:
+                raise StopIteration
+            self._page = self._fetch_page(self._key, self.page_size)
+            self._position = 0
+            if len(self._page) < self.page_size:
+                self._exhausted = True
+            if not self._page:
+                raise StopIteration
+        row = self._page[self._position]
+        self._position += 1
+        self._key = self._key_of(row)
+        return self._row_of(row)
+
+class QueryCache:
+    """Size-bounded LRU of query results keyed by SQL text and parameters.
+
+    Every entry is tagged with the database version it was read at. A lookup
+    under a different version is a miss and drops the stale entry, so a
+    commit from any connection invalidates what was cached before it.
+    """
+
+    def __init__(self, max_entries=RESULT_CACHE_ENTRIES, max_rows=RESULT_CACHE_MAX_ROWS):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, version):
+        """Return the cached rows for key at this version, or None"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, version, rows):
+        """Cache rows read at version, evicting the least recently used entry"""
+        if len(rows) > self.max_rows:
+            return
+        self._entries[key] = (version, rows)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Return hit/miss counters and current size"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+        }
+
+def connect_to_database(database_path=DATABASE_PATH):
+    """Connect to the SQLite database, bringing its schema up to date"""
+    return ml_database_migrations.connect(database_path)
+
+class QuerySession:
+    """One long-lived database connection shared by every report.
+
+    The connection is opened lazily through ``ml_database_migrations.connect()``,
+    so the file is migrated before the first report reads it, tuned once
+    with ``SESSION_PRAGMAS`` and reused until ``close()``. Report SQL lives in module-level constants, so
+    sqlite3's per-connection statement cache hands back the already prepared
+    statement on every repeat call. Pass ``echo=False`` to get the rows back
+    without printing them.
+
+    Report results are kept in a ``QueryCache`` tagged with ``PRAGMA
+    data_version`` (which moves on commits from other connections) and this
+    connection's ``total_changes`` (which moves on its own writes). Pass
+    ``cache_entries=0`` to turn the cache off.
     """
-    cursor.execute(query)
-    results = cursor.fetchall()
-    conn.close()
-    
+
+    def __init__(self, database_path=DATABASE_PATH, echo=True,
+                 cache_entries=RESULT_CACHE_ENTRIES):
+        self.database_path = database_path
+        self.echo = echo
+        self.cache = QueryCache(cache_entries) if cache_entries else None
+        self._conn = None
+
+    @property
+    def connection(self):
+        """Return the open connection, connecting on first use"""
+        if self._conn is None:
+            conn = ml_database_migrations.connect(self.database_path,
+                                                  cached_statements=STATEMENT_CACHE_SIZE)
+            for pragma in SESSION_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Close the connection; the next report reconnects"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def execute(self, query, params=()):
+        """Run a query on the shared connection and return all rows"""
+        return self.connection.execute(query, params).fetchall()
+
+    def data_version(self):
+        """Return a token that changes whenever the database content may have"""
+        conn = self.connection
+        return conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes
+
+    def query(self, sql, params=()):
+        """Run a report query through the result cache"""
+        if self.cache is None:
+            return self.execute(sql, params)
+        key = (sql, tuple(params))
+        version = self.data_version()
+        results = self.cache.get(key, version)
+        if results is None:
+            results = self.execute(sql, params)
+            self.cache.put(key, version, results)
+        return list(results)
+
+    def show_all_companies(self):
+        """Display all companies in the database"""
+        results = self.query(COMPANIES_QUERY)
+        if self.echo:
+            print_companies(results)
+        return results
+
+    def show_ml_technologies_by_company(self, company_name=None):
+        """Display ML technologies by company"""
+        if company_name:
+            results = self.query(COMPANY_TECHNOLOGIES_QUERY, [company_name])
+        else:
+            results = self.query(ALL_TECHNOLOGIES_QUERY)
+        if self.echo:
+            print_technologies(results, company_name)
+        return results
+
+    def show_technology_categories(self):
+        """Display technology categories"""
+        results = self.query(CATEGORIES_QUERY)
+        if self.echo:
+            print_categories(results)
+        return results
+
+    def get_company_stats(self):
+        """Get statistics about companies and their ML technologies
+
+        Reads the trigger-maintained summary tables (see ml_database_summary.py).
+        """
+        results = self.query(SUMMARY_COMPANY_STATS_QUERY)
+        results2 = self.query(SUMMARY_TECHNOLOGY_TYPE_STATS_QUERY)
+        if self.echo:
+            print_company_stats(results, results2)
+        return results, results2
+
+    def search_technologies(self, keyword, limit=None):
+        """Search for technologies by keyword
+
+        Ranks matches with bm25 over the FTS5 index (see ml_search_index.py).
+        """
+        expression = ml_search_index.build_match_expression(keyword)
+        if expression:
+            results = self.query(ml_search_index.SEARCH_QUERY,
+                                 [expression, -1 if limit is None else limit])
+        else:
+            results = []
+        if self.echo:
+            print_search_results(keyword, results)
+        return results
+
+    def show_datagod_technologies(self):
+        """Show specific DATAGOD technologies"""
+        results = self.query(COMPANY_TECHNOLOGIES_QUERY, ['DATAGOD'])
+        if self.echo:
+            print_datagod_technologies(results)
+        return results
+
+    def search_equipment(self, limit=None, cheapest_first=False, **filters):
+        """Find equipment by typed spec and price ranges
+
+        Filters are those of ml_equipment_specs.SEARCH_FILTERS, e.g.
+        ``budget_min_cents=10000, budget_max_cents=40000`` for price ranges
+        overlapping $100-400, plus ``compatible_with=('PX4', 'QGroundControl')``
+        for equipment compatible with every system named. Reads only the
+        typed, indexed columns and the compatibility links.
+        """
+        sql, params = ml_equipment_specs.build_search_query(limit, cheapest_first, **filters)
+        results = self.query(sql, params)
+        if self.echo:
+            print_equipment(results)
+        return results
+
+    def search_sensors(self, limit=None, **filters):
+        """Find sensors by SI power draw, range and accuracy
+
+        Filters are those of ml_sensor_specs.SEARCH_FILTERS, e.g.
+        ``sensor_type='IMU', max_current_amps=0.005``. Values are in SI
+        units; range and accuracy filters name their unit, e.g.
+        ``range_unit='Pa', range_high=110000``.
+        """
+        sql, params = ml_sensor_specs.build_search_query(limit, **filters)
+        results = self.query(sql, params)
+        if self.echo:
+            print_sensors(results)
+        return results
+
+    def configure_stack(self, system, budget_cents=None, max_amps=None,
+                        objective='cheapest', top=5):
+        """Find the cheapest or best-spec autopilot stacks for a flight
+        control system within a budget and a sensor current envelope
+        (see ml_stack_configurator.py)
+        """
+        results = ml_stack_configurator.configure_stack(
+            self.connection, system, budget_cents, max_amps, objective, top)
+        if self.echo:
+            print_stacks(system, results)
+        return results
+
+    def adoptions(self, bucket='quarter', by='technology_type', **filters):
+        """Count technologies per year or quarter, by type or company
+
+        Filters are start_year, end_year, technology_type and company_name.
+        Reads only the adoption_summary rollup (see ml_time_buckets.py).
+        """
+        sql, params = ml_time_buckets.build_adoption_query(bucket, by, **filters)
+        results = self.query(sql, params)
+        if self.echo:
+            print_adoptions(results, bucket, by)
+        return results
+
+    def iter_companies(self, after=None, page_size=DEFAULT_PAGE_SIZE):
+        """Stream the companies report in company_name order"""
+        def fetch_page(key, limit):
+            if key is None:
+                return self.execute(COMPANIES_FIRST_PAGE, [limit])
+            return self.execute(COMPANIES_NEXT_PAGE, [key, limit])
+
+        return RowStream('companies', fetch_page, lambda row: row[0],
+                         lambda row: row, after, page_size)
+
+    def iter_ml_technologies_by_company(self, company_name=None, after=None,
+                                        page_size=DEFAULT_PAGE_SIZE):
+        """Stream ML technologies, for one company or for all of them"""
+        if not company_name:
+            def fetch_page(key, limit):
+                if key is None:
+                    return self.execute(ALL_TECHNOLOGIES_FIRST_PAGE, [limit])
+                return self.execute(ALL_TECHNOLOGIES_NEXT_PAGE, key + [limit])
+
+            return RowStream('technologies', fetch_page,
+                             lambda row: [row[0], row[1], row[5]],
+                             lambda row: row[:5], after, page_size)
+
+        def fetch_page(key, limit):
+            if key is None:
+                return self.execute(COMPANY_TECHNOLOGIES_FIRST_PAGE, [company_name, limit])
+            date, last_id = key
+            if date is None:
+                return self.execute(COMPANY_TECHNOLOGIES_UNDATED_PAGE,
+                                    [company_name, last_id, limit])
+            rows = self.execute(COMPANY_TECHNOLOGIES_NEXT_PAGE,
+                                [company_name, date, last_id, limit])
+            if len(rows) < limit:
+                rows += self.execute(COMPANY_TECHNOLOGIES_UNDATED_PAGE,
+                                     [company_name, MAX_ROWID, limit - len(rows)])
+            return rows
+
+        return RowStream(f'technologies:{company_name}', fetch_page,
+                         lambda row: [row[4], row[5]],
+                         lambda row: row[:5], after, page_size)
+
+    def iter_technology_categories(self, after=None, page_size=DEFAULT_PAGE_SIZE):
+        """Stream the technology categories report"""
+        def fetch_page(key, limit):
+            if key is None:
+                return self.execute(CATEGORIES_FIRST_PAGE, [limit])
+            return self.execute(CATEGORIES_NEXT_PAGE, [key, limit])
+
+        return RowStream('categories', fetch_page, lambda row: row[0],
+                         lambda row: row, after, page_size)
+
+    def iter_company_stats(self, after=None, page_size=DEFAULT_PAGE_SIZE):
+        """Stream per-company technology counts in company_name order"""
+        def fetch_page(key, limit):
+            return self.execute(SUMMARY_COMPANY_STATS_PAGE, ['' if key is None else key, limit])
+
+        return RowStream('company_stats', fetch_page, lambda row: row[0],
+                         lambda row: row, after, page_size)
+
+    def iter_search_technologies(self, keyword, after=None, page_size=DEFAULT_PAGE_SIZE):
+        """Stream every technology matching the keyword, in id order"""
+        expression = ml_search_index.build_match_expression(keyword)
+
+        def fetch_page(key, limit):
+            if not expression:
+                return []
+            return self.execute(ml_search_index.SEARCH_PAGE,
+                                [expression, 0 if key is None else key, limit])
+
+        return RowStream(f'search:{keyword}', fetch_page, lambda row: row[5],
+                         lambda row: row[:5], after, page_size)
+
+def _cell(value):
+    """Report cell for a column value; NULL prints as a dash"""
+    return '-' if value is None else value
+
+def print_companies(results):
+    """Print the companies report"""
     print("\n🏢 COMPANIES IN DATABASE:")
     print("=" * 100)
     print(f"{'Company':<15} {'Industry':<25} {'Country':<10} {'Founded':<8} {'Description'}")
     print("-" * 100)
     for row in results:
+        row = [_cell(value) for value in row]
         desc = row[4][:40] + "..." if len(row[4]) > 40 else row[4]
         print(f"{row[0]:<15} {row[1]:<25} {row[2]:<10} {row[3]:<8} {desc}")
-    return results
 
-def show_ml_technologies_by_company(company_name=None):
-    """Display ML technologies by company"""
-    conn = connect_to_database()
-    cursor = conn.cursor()
-    
+def print_technologies(results, company_name=None):
+    """Print the ML technologies report"""
     if company_name:
-        query = """
-        SELECT technology_name, technology_type, application_area, description, implementation_date
-        FROM ml_technologies
-        WHERE company_name = ?
-        ORDER BY implementation_date DESC
-        """
-        cursor.execute(query, [company_name])
         print(f"\n🤖 ML TECHNOLOGIES FOR {company_name.upper()}:")
     else:
-        query = """
-        SELECT company_name, technology_name, technology_type, application_area, description
-        FROM ml_technologies
-        ORDER BY company_name, technology_name
-        """
-        cursor.execute(query)
         print(f"\n🤖 ALL ML TECHNOLOGIES:")
-    
-    results = cursor.fetchall()
-    conn.close()
-    
+
     print("=" * 120)
     if company_name:
         print(f"{'Technology':<25} {'Type':<20} {'Application':<20} {'Description':<40} {'Date'}")
@@ -70,21 +562,9 @@ def show_ml_technologies_by_company(company_name=None):
         for row in results:
             desc = row[4][:30] + "..." if len(row[4]) > 30 else row[4]
             print(f"{row[0]:<15} {row[1]:<25} {row[2]:<20} {row[3]:<20} {desc}")
-    return results
 
-def show_technology_categories():
-    """Display technology categories"""
-    conn = connect_to_database()
-    cursor = conn.cursor()
-    query = """
-    SELECT category_name, description
-    FROM technology_categories
-    ORDER BY category_name
-    """
-    cursor.execute(query)
-    results = cursor.fetchall()
-    conn.close()
-    
+def print_categories(results):
+    """Print the technology categories report"""
     print("\n📊 TECHNOLOGY CATEGORIES:")
     print("=" * 80)
     print(f"{'Category':<25} {'Description'}")
@@ -92,101 +572,43 @@ def show_technology_categories():
     for row in results:
         desc = row[1][:50] + "..." if len(row[1]) > 50 else row[1]
         print(f"{row[0]:<25} {desc}")
-    return results
 
-def get_company_stats():
-    """Get statistics about companies and their ML technologies"""
-    conn = connect_to_database()
-    cursor = conn.cursor()
-    
-    # Count technologies per company
-    query = """
-    SELECT 
-        c.company_name,
-        c.industry,
-        COUNT(mt.id) as technology_count
-    FROM companies c
-    LEFT JOIN ml_technologies mt ON c.company_name = mt.company_name
-    GROUP BY c.company_name, c.industry
-    ORDER BY technology_count DESC
-    """
-    cursor.execute(query)
-    results = cursor.fetchall()
-    
+def print_company_stats(results, results2):
+    """Print the company statistics report"""
     print("\n📈 COMPANY STATISTICS:")
     print("=" * 70)
     print(f"{'Company':<15} {'Industry':<25} {'Technologies':<12}")
     print("-" * 70)
     for row in results:
-        print(f"{row[0]:<15} {row[1]:<25} {row[2]:<12}")
-    
-    # Technology type distribution
-    query2 = """
-    SELECT 
-        technology_type,
-        COUNT(*) as count
-    FROM ml_technologies
-    WHERE technology_type IS NOT NULL
-    GROUP BY technology_type
-    ORDER BY count DESC
-    """
-    cursor.execute(query2)
-    results2 = cursor.fetchall()
-    
+        print(f"{row[0]:<15} {_cell(row[1]):<25} {row[2]:<12}")
+
     print("\n🔬 TECHNOLOGY TYPE DISTRIBUTION:")
     print("=" * 50)
     print(f"{'Technology Type':<25} {'Count':<8}")
     print("-" * 50)
     for row in results2:
         print(f"{row[0]:<25} {row[1]:<8}")
-    
-    conn.close()
-    return results, results2
 
-def search_technologies(keyword):
-    """Search for technologies by keyword"""
-    conn = connect_to_database()
-    cursor = conn.cursor()
-    query = """
-    SELECT company_name, technology_name, technology_type, application_area, description
-    FROM ml_technologies
-    WHERE technology_name LIKE ? OR description LIKE ? OR application_area LIKE ?
-    ORDER BY company_name
-    """
-    search_term = f"%{keyword}%"
-    cursor.execute(query, [search_term, search_term, search_term])
-    results = cursor.fetchall()
-    conn.close()
-    
+def print_search_results(keyword, results):
+    """Print the technology search report"""
     print(f"\n🔍 SEARCH RESULTS FOR '{keyword.upper()}':")
     print("=" * 120)
-    if len(results) > 0:
-        print(f"{'Company':<15} {'Technology':<25} {'Type':<20} {'Application':<20} {'Description'}")
-        print("-" * 120)
-        for row in results:
-            desc = row[4][:30] + "..." if len(row[4]) > 30 else row[4]
-            print(f"{row[0]:<15} {row[1]:<25} {row[2]:<20} {row[3]:<20} {desc}")
-    else:
+    found = False
+    for row in results:
+        if not found:
+            print(f"{'Company':<15} {'Technology':<25} {'Type':<20} {'Application':<20} {'Description'}")
+            print("-" * 120)
+            found = True
+        desc = row[4][:30] + "..." if len(row[4]) > 30 else row[4]
+        print(f"{row[0]:<15} {row[1]:<25} {row[2]:<20} {row[3]:<20} {desc}")
+    if not found:
         print("No results found.")
-    return results
 
-def show_datagod_technologies():
-    """Show specific DATAGOD technologies"""
+def print_datagod_technologies(results):
+    """Print the DATAGOD technologies report"""
     print("\n🎯 DATAGOD SPECIFIC ML TECHNOLOGIES:")
     print("=" * 100)
-    
-    conn = connect_to_database()
-    cursor = conn.cursor()
-    query = """
-    SELECT technology_name, technology_type, application_area, description, implementation_date
-    FROM ml_technologies
-    WHERE company_name = 'DATAGOD'
-    ORDER BY implementation_date DESC
-    """
-    cursor.execute(query)
-    results = cursor.fetchall()
-    conn.close()
-    
+
     for i, row in enumerate(results, 1):
         print(f"\n{i}. {row[0]}")
         print(f"   Type: {row[1]}")
@@ -195,32 +617,137 @@ def show_datagod_technologies():
         print(f"   Implemented: {row[4]}")
         print("-" * 80)
 
+def print_equipment(results):
+    """Print the equipment search report"""
+    print("\n🔧 EQUIPMENT:")
+    print("=" * 100)
+    print(f"{'Name':<30} {'Manufacturer':<20} {'Category':<20} {'Price'}")
+    print("-" * 100)
+    for row in results:
+        low, high = row[-2:]
+        if low is None:
+            price = "-"
+        elif low == high:
+            price = f"${low / 100:,.0f}"
+        else:
+            price = f"${low / 100:,.0f}-{high / 100:,.0f}"
+        print(f"{row[1]:<30} {row[2] or '':<20} {row[3] or '':<20} {price}")
+
+def print_sensors(results):
+    """Print the sensor search report"""
+    print("\n📡 SENSORS:")
+    print("=" * 100)
+    print(f"{'Name':<25} {'Type':<15} {'Supply':<8} {'Current':<10} {'Range':<25} {'Accuracy'}")
+    print("-" * 100)
+    for row in results:
+        volts, amps, _, low, high, unit, accuracy, accuracy_unit = row[4:]
+        span = (f"{ml_sensor_specs.format_si(low, unit)}..{ml_sensor_specs.format_si(high, unit)}"
+                if unit else "-")
+        print(f"{row[1]:<25} {row[2] or '':<15} {ml_sensor_specs.format_si(volts, 'V') or '-':<8} "
+              f"{ml_sensor_specs.format_si(amps, 'A') or '-':<10} {span:<25} "
+              f"{ml_sensor_specs.format_si(accuracy, accuracy_unit) or '-'}")
+
+def print_stacks(system, results):
+    """Print the autopilot stack report"""
+    print(f"\n🛩️  {system.upper()} AUTOPILOT STACKS:")
+    print("=" * 80)
+    if not results:
+        print("No stack fits the budget and power envelope.")
+    for i, stack in enumerate(results, 1):
+        print(f"\n{i}. ${stack['cost_cents'] / 100:,.2f}, "
+              f"{ml_sensor_specs.format_si(stack['current_amps'], 'A')} sensor draw")
+        for slot, _, name in stack['parts']:
+            print(f"   {ml_stack_configurator.SLOT_CATEGORIES[slot]:<20} {name}")
+
+def print_adoptions(results, bucket='quarter', by='technology_type'):
+    """Print the adoptions per time bucket report"""
+    print(f"\n📅 ADOPTIONS PER {bucket.upper()}" + (f" BY {by.upper()}:" if by else ":"))
+    print("=" * 70)
+    print(f"{'Period':<10} {(by or '').replace('_', ' ').title():<40} {'Count':<8}")
+    print("-" * 70)
+    for row in results:
+        value = row[1] if by else ''
+        print(f"{row[0]:<10} {value:<40} {row[-1]:<8}")
+
+_default_session = None
+
+def get_session():
+    """Return the shared session used by the module-level report functions"""
+    global _default_session
+    if _default_session is None:
+        _default_session = QuerySession()
+    return _default_session
+
+def show_all_companies():
+    """Display all companies in the database"""
+    return get_session().show_all_companies()
+
+def show_ml_technologies_by_company(company_name=None):
+    """Display ML technologies by company"""
+    return get_session().show_ml_technologies_by_company(company_name)
+
+def show_technology_categories():
+    """Display technology categories"""
+    return get_session().show_technology_categories()
+
+def get_company_stats():
+    """Get statistics about companies and their ML technologies"""
+    return get_session().get_company_stats()
+
+def search_technologies(keyword, limit=None):
+    """Search for technologies by keyword"""
+    return get_session().search_technologies(keyword, limit)
+
+def show_datagod_technologies():
+    """Show specific DATAGOD technologies"""
+    get_session().show_datagod_technologies()
+
+def search_equipment(limit=None, cheapest_first=False, **filters):
+    """Find equipment by typed spec and price ranges and compatible systems"""
+    return get_session().search_equipment(limit, cheapest_first, **filters)
+
+def search_sensors(limit=None, **filters):
+    """Find sensors by SI power draw, range and accuracy"""
+    return get_session().search_sensors(limit, **filters)
+
+def configure_stack(system, budget_cents=None, max_amps=None, objective='cheapest', top=5):
+    """Find autopilot stacks for a flight control system"""
+    return get_session().configure_stack(system, budget_cents, max_amps, objective, top)
+
+def adoptions(bucket='quarter', by='technology_type', **filters):
+    """Count technologies per year or quarter from the adoption rollup"""
+    return get_session().adoptions(bucket, by, **filters)
+
 def main():
     """Main function to demonstrate database queries"""
     print("🚀 ML TECHNOLOGIES DATABASE QUERY TOOL")
     print("=" * 50)
-    
-    # Show all companies
-    show_all_companies()
-    
+
+    session = get_session()
+
+    # Show all companies, streamed page by page
+    print_companies(session.iter_companies())
+
     # Show technology categories
-    show_technology_categories()
-    
-    # Show all ML technologies
-    show_ml_technologies_by_company()
-    
+    print_categories(session.iter_technology_categories())
+
+    # Show all ML technologies, streamed page by page
+    print_technologies(session.iter_ml_technologies_by_company())
+
     # Show statistics
     get_company_stats()
-    
+
     # Show DATAGOD specific technologies
     show_datagod_technologies()
-    
+
     # Search for anomaly detection technologies
     search_technologies("anomaly")
-    
+
+    session.close()
+
     print("\n✅ Database query completed successfully!")
-    print(f"\n📁 Database location: /home/vovkes/DATADOG/ml_technologies.db")
+    print(f"\n📁 Database location: {DATABASE_PATH}")
     print(f"🔐 Environment file: /home/vovkes/DATADOG/env.main")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
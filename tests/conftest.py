@@ -0,0 +1,143 @@
+"""
+Shared fixtures for the ML technologies database tests: seeded databases
+built through ml_database_migrations.connect() and a file laid out the way
+create_ml_database.py and extend_database_final.py built it before
+migrations existed
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ml_database_ingest
+import ml_database_migrations
+
+# The tables and columns of a database created before migrations existed
+BASELINE_SCHEMA = (
+    '''
+    CREATE TABLE ml_technologies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_name TEXT NOT NULL,
+        technology_name TEXT NOT NULL,
+        technology_type TEXT,
+        application_area TEXT,
+        description TEXT,
+        implementation_date DATE,
+        source TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE companies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_name TEXT UNIQUE NOT NULL,
+        industry TEXT,
+        country TEXT,
+        founded_year INTEGER,
+        description TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE technology_categories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_name TEXT UNIQUE NOT NULL,
+        description TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE equipment (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        manufacturer TEXT,
+        category TEXT,
+        description TEXT,
+        specifications TEXT,
+        supported_software TEXT,
+        price_range TEXT,
+        availability TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE flight_control_systems (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT,
+        description TEXT,
+        features TEXT,
+        supported_hardware TEXT,
+        open_source BOOLEAN,
+        community_support TEXT,
+        documentation_url TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE sensors (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT,
+        manufacturer TEXT,
+        specifications TEXT,
+        accuracy TEXT,
+        range TEXT,
+        power_consumption TEXT,
+        interface TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+)
+
+@pytest.fixture(scope='session')
+def empty_template(tmp_path_factory):
+    """A database migrated to the latest version, with no rows"""
+    path = str(tmp_path_factory.mktemp('empty') / 'ml_technologies.db')
+    ml_database_migrations.connect(path).close()
+    return path
+
+@pytest.fixture(scope='session')
+def seeded_template(empty_template, tmp_path_factory):
+    """A database migrated to the latest version and loaded from seed_data/"""
+    path = str(tmp_path_factory.mktemp('seeded') / 'ml_technologies.db')
+    shutil.copy(empty_template, path)
+    conn = ml_database_migrations.connect(path)
+    ml_database_ingest.load_seed_files(conn)
+    conn.close()
+    return path
+
+@pytest.fixture
+def database_path(seeded_template, tmp_path):
+    """A private copy of the seeded database"""
+    path = str(tmp_path / 'ml_technologies.db')
+    shutil.copy(seeded_template, path)
+    return path
+
+@pytest.fixture
+def conn(database_path):
+    """A migrated connection to the private seeded database"""
+    conn = ml_database_migrations.connect(database_path)
+    yield conn
+    conn.close()
+
+@pytest.fixture
+def baseline_path(tmp_path):
+    """A version 0 database holding the seed rows in the original layout"""
+    path = str(tmp_path / 'baseline.db')
+    conn = sqlite3.connect(path)
+    for statement in BASELINE_SCHEMA:
+        conn.execute(statement)
+    for table, seed_path in ml_database_ingest.seed_files().items():
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+                   if row[1] in ml_database_ingest.TABLE_COLUMNS[table]]
+        names = ', '.join(f'"{column}"' for column in columns)
+        placeholders = ', '.join('?' for _ in columns)
+        conn.executemany(f"INSERT INTO {table} ({names}) VALUES ({placeholders})",
+                         ml_database_ingest.read_seed_file(seed_path, columns))
+    conn.commit()
+    conn.close()
+    return path
@@ -0,0 +1,77 @@
+"""
+Tests for the ETag / 304 handling of the catalog API
+"""
+
+import asyncio
+import json
+
+import ml_catalog_api
+import ml_database_ingest
+import ml_database_migrations
+
+async def _request(port, path, headers=()):
+    """Send one GET; return (status, headers, decoded body or None)"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    lines = [f'GET {path} HTTP/1.1', 'Host: localhost', 'Connection: close', *headers]
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, body = response.partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    response_headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(':')
+        response_headers[name.strip().lower()] = value.strip()
+    chunks = b''
+    while body:
+        size, _, rest = body.partition(b'\r\n')
+        size = int(size, 16)
+        chunks += rest[:size]
+        body = rest[size + 2:]
+    return int(status_line.split()[1]), response_headers, json.loads(chunks) if chunks else None
+
+def _serve(database_path, scenario):
+    async def run():
+        api = ml_catalog_api.CatalogApi(database_path, pool_size=2)
+        server = await asyncio.start_server(api.handle_connection, '127.0.0.1', 0)
+        try:
+            return await scenario(server.sockets[0].getsockname()[1])
+        finally:
+            server.close()
+            await server.wait_closed()
+            await api.close()
+    return asyncio.run(run())
+
+def test_unchanged_database_answers_not_modified(database_path):
+    async def scenario(port):
+        status, headers, body = await _request(port, '/companies?limit=5')
+        assert status == 200 and len(body) == 5
+        etag = headers['etag']
+
+        status, headers, body = await _request(port, '/companies?limit=5',
+                                               [f'If-None-Match: {etag}'])
+        assert (status, headers['etag'], body) == (304, etag, None)
+
+        status, _, body = await _request(port, '/stats/companies',
+                                         ['If-None-Match: "some-other-version"'])
+        assert status == 200 and body
+    _serve(database_path, scenario)
+
+def test_commit_changes_the_etag(database_path):
+    async def scenario(port):
+        _, headers, before = await _request(port, '/companies?name=NewCo')
+        assert before == []
+        etag = headers['etag']
+
+        conn = ml_database_migrations.connect(database_path)
+        ml_database_ingest.upsert_rows(conn, 'companies', [('NewCo', 'AI', 'Freedonia', 2020, None)])
+        conn.commit()
+        conn.close()
+
+        status, headers, after = await _request(port, '/companies?name=NewCo',
+                                                [f'If-None-Match: {etag}'])
+        assert status == 200 and headers['etag'] != etag
+        assert [row['company_name'] for row in after] == ['NewCo']
+    _serve(database_path, scenario)
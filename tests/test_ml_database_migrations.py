@@ -0,0 +1,77 @@
+"""
+Tests for the versioned schema migrations
+"""
+
+import sqlite3
+
+import pytest
+
+import ml_database_ingest
+import ml_database_migrations
+import ml_database_summary
+import query_ml_database
+
+def _objects(conn, kind):
+    return {name for (name,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = ?", (kind,))}
+
+def test_fresh_database_reaches_latest_version(tmp_path):
+    path = str(tmp_path / 'fresh.db')
+    conn = ml_database_migrations.connect(path)
+    assert ml_database_migrations.schema_version(conn) == ml_database_migrations.LATEST_VERSION
+    assert ml_database_summary.stale_summary_triggers(conn) == []
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    # Reopening costs nothing: every step is already applied
+    assert ml_database_migrations.migrate(conn) == []
+    conn.close()
+
+def test_migrations_apply_in_order_up_to_a_target(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'stepped.db'))
+    latest = ml_database_migrations.LATEST_VERSION
+    assert ml_database_migrations.migrate(conn, target=5) == [1, 2, 3, 4, 5]
+    assert ml_database_migrations.schema_version(conn) == 5
+    # Summary maintenance only starts at the latest version
+    assert not _objects(conn, 'trigger') & set(ml_database_migrations.SUMMARY_TRIGGER_SCHEMA)
+    assert ml_database_migrations.migrate(conn) == list(range(6, latest + 1))
+    assert ml_database_summary.stale_summary_triggers(conn) == []
+    conn.close()
+
+def test_failed_migration_keeps_previous_version(conn, monkeypatch):
+    latest = ml_database_migrations.LATEST_VERSION
+
+    def broken(conn):
+        conn.execute("CREATE TABLE half_done (id INTEGER PRIMARY KEY)")
+        conn.execute("SELECT * FROM no_such_table")
+
+    monkeypatch.setattr(ml_database_migrations, 'MIGRATIONS',
+                        ml_database_migrations.MIGRATIONS + ((latest + 1, 'broken', broken),))
+    with pytest.raises(sqlite3.OperationalError):
+        ml_database_migrations.migrate(conn, target=latest + 1)
+    assert ml_database_migrations.schema_version(conn) == latest
+    assert 'half_done' not in _objects(conn, 'table')
+
+def test_baseline_database_is_migrated_on_open(baseline_path):
+    conn = sqlite3.connect(baseline_path)
+    assert ml_database_migrations.schema_version(conn) == 0
+    technologies = conn.execute("SELECT COUNT(*) FROM ml_technologies").fetchone()[0]
+    conn.close()
+
+    with query_ml_database.QuerySession(baseline_path, echo=False) as session:
+        stats, type_counts = session.get_company_stats()
+        assert sum(count for _, _, count in stats) <= technologies
+        assert sum(count for _, count in type_counts) == technologies
+        assert session.search_technologies('anomaly')
+        assert session.show_ml_technologies_by_company('DATAGOD')
+        assert session.search_sensors(sensor_type='IMU')
+
+    conn = ml_database_migrations.connect(baseline_path)
+    assert ml_database_migrations.schema_version(conn) == ml_database_migrations.LATEST_VERSION
+    assert ml_database_summary.verify_summary_tables(conn) == []
+    # The migrated file takes writes like a fresh one
+    ml_database_ingest.upsert_rows(conn, 'ml_technologies', [
+        ('DATAGOD', 'Log Clustering', 'Clustering', 'Log Analytics',
+         'Groups similar log lines', '2024-05-02', None),
+    ])
+    conn.commit()
+    assert ml_database_summary.verify_summary_tables(conn) == []
+    conn.close()
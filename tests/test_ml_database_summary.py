@@ -0,0 +1,50 @@
+"""
+Tests for the trigger-maintained summary tables
+"""
+
+import ml_database_ingest
+import ml_database_migrations
+import ml_database_summary
+
+def test_seeded_summaries_match_recomputation(conn):
+    assert ml_database_summary.stale_summary_triggers(conn) == []
+    assert ml_database_summary.verify_summary_tables(conn) == []
+    assert conn.execute("SELECT COUNT(*) FROM company_summary").fetchone()[0] == \
+        conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
+
+def test_triggers_follow_every_write(conn):
+    steps = (
+        lambda: ml_database_ingest.upsert_rows(conn, 'ml_technologies', [
+            ('NewCo', 'Forecaster', 'Predictive Analytics', 'Capacity Planning',
+             None, '2024-03-01', None),
+        ]),
+        lambda: ml_database_ingest.upsert_rows(conn, 'companies', [
+            ('NewCo', 'AI', 'Freedonia', 2020, None),
+        ]),
+        lambda: ml_database_ingest.upsert_rows(conn, 'ml_technologies', [
+            ('NewCo', 'Ranker', 'Deep Learning', 'Search', None, 'not a date', None),
+        ]),
+        lambda: conn.execute("UPDATE companies SET country = 'USA' WHERE company_name = 'NewCo'"),
+        lambda: conn.execute("UPDATE companies SET company_name = 'NewCo2' WHERE company_name = 'NewCo'"),
+        lambda: conn.execute("UPDATE ml_technologies SET company_name = 'NewCo2', "
+                             "implementation_date = '2023-11-30' WHERE company_name = 'NewCo'"),
+        lambda: conn.execute("DELETE FROM ml_technologies WHERE company_name = 'NewCo2'"),
+        lambda: conn.execute("DELETE FROM companies WHERE company_name = 'NewCo2'"),
+    )
+    for step in steps:
+        step()
+        assert ml_database_summary.verify_summary_tables(conn) == []
+    conn.commit()
+
+def test_stale_trigger_is_reported_and_reinstalled(conn):
+    conn.execute("DROP TRIGGER companies_summary_insert")
+    conn.execute("DROP TRIGGER ml_technologies_summary_update")
+    conn.execute("CREATE TRIGGER ml_technologies_summary_update AFTER UPDATE ON ml_technologies "
+                 "BEGIN SELECT 1; END")
+    assert sorted(ml_database_summary.stale_summary_triggers(conn)) == [
+        'companies_summary_insert', 'ml_technologies_summary_update']
+
+    ml_database_migrations.create_summary_triggers(conn)
+    ml_database_summary.rebuild_summary_tables(conn)
+    assert ml_database_summary.stale_summary_triggers(conn) == []
+    assert ml_database_summary.verify_summary_tables(conn) == []
@@ -0,0 +1,68 @@
+"""
+Tests for the delta imports of the parallel ingestion pipeline
+"""
+
+import json
+
+import ml_database_ingest
+import ml_database_migrations
+import ml_database_summary
+import ml_ingest_pipeline
+
+def _seed_rows(table):
+    path = ml_database_ingest.seed_files()[table]
+    columns = ml_database_ingest.TABLE_COLUMNS[table]
+    return [dict(zip(columns, row)) for row in ml_database_ingest.read_seed_file(path, columns)]
+
+def _write_jsonl(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write((record if isinstance(record, str) else json.dumps(record)) + '\n')
+    return str(path)
+
+def _import(database_path, path, table='companies'):
+    return ml_ingest_pipeline.run_pipeline(database_path, table, path, workers=2,
+                                           chunk_size=10, delta=True)
+
+def test_unchanged_file_writes_nothing(database_path, tmp_path):
+    path = _write_jsonl(tmp_path / 'companies.jsonl', _seed_rows('companies'))
+    write = _import(database_path, path)['write']
+    assert (write['inserted'], write['updated'], write['deleted']) == (0, 0, 0)
+    assert write['unchanged'] == len(_seed_rows('companies'))
+
+def test_delta_upserts_and_tombstones(database_path, tmp_path):
+    companies = _seed_rows('companies')
+    removed = companies.pop()
+    companies[0] = dict(companies[0], country='Canada')
+    companies.append({'company_name': 'NewCo', 'industry': 'AI', 'country': 'Freedonia'})
+    write = _import(database_path, _write_jsonl(tmp_path / 'companies.jsonl', companies))['write']
+    assert (write['inserted'], write['updated'], write['deleted']) == (1, 1, 1)
+
+    conn = ml_database_migrations.connect(database_path)
+    assert conn.execute("SELECT country FROM companies WHERE company_name = ?",
+                        (companies[0]['company_name'],)).fetchone() == ('Canada',)
+    stone = conn.execute("SELECT row FROM tombstones WHERE table_name = 'companies' "
+                         "AND natural_key = json_array(?)", (removed['company_name'],)).fetchone()
+    assert json.loads(stone[0])['company_name'] == removed['company_name']
+    assert ml_database_summary.verify_summary_tables(conn) == []
+    conn.close()
+
+    # Bringing the row back clears its tombstone
+    _import(database_path, _write_jsonl(tmp_path / 'again.jsonl', companies + [removed]))
+    conn = ml_database_migrations.connect(database_path)
+    assert conn.execute("SELECT COUNT(*) FROM tombstones").fetchone() == (0,)
+    conn.close()
+
+def test_rejected_line_skips_deletions(database_path, tmp_path):
+    companies = _seed_rows('companies')[:-1]
+    path = _write_jsonl(tmp_path / 'companies.jsonl', companies + [
+        '{"company_name": "Broken", "founded_year": "not a year"}',
+    ])
+    stats = _import(database_path, path)
+    assert stats['parse']['rejected'] == 1
+    assert stats['write']['deleted'] == 0
+
+    conn = ml_database_migrations.connect(database_path)
+    assert conn.execute("SELECT COUNT(*) FROM companies").fetchone() == (len(companies) + 1,)
+    assert conn.execute("SELECT COUNT(*) FROM tombstones").fetchone() == (0,)
+    conn.close()
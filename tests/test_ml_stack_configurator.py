@@ -0,0 +1,66 @@
+"""
+Tests checking the branch-and-bound stack search against exhaustive search
+"""
+
+import random
+import shutil
+
+import pytest
+
+import ml_database_migrations
+import ml_stack_configurator
+
+EQUIPMENT_CATEGORIES = ('Flight Controller', 'GPS Module', 'Telemetry Radio', 'Power Management')
+SENSOR_TYPES = (('IMU', None), ('Barometer', 'Pa'), ('Magnetometer', 'rad'))
+
+def _random_catalog(template, path, seed):
+    """A copy of the empty template with one system and a few random
+    candidates per slot, repeating prices, currents and specs so that ties
+    and exact fits occur"""
+    rng = random.Random(seed)
+    shutil.copy(template, path)
+    conn = ml_database_migrations.connect(path)
+    system_id = conn.execute("INSERT INTO flight_control_systems (name) VALUES ('X')").lastrowid
+    for category in EQUIPMENT_CATEGORIES:
+        for number in range(rng.randint(1, 4)):
+            equipment_id = conn.execute(
+                "INSERT INTO equipment (name, category, price_min_cents, clock_mhz) VALUES (?, ?, ?, ?)",
+                (f'{category} {number}', category, rng.choice([100, 200, 300, rng.randint(50, 500)]),
+                 rng.choice([None, 0.1, 0.2, 0.3, 0.7, 216, 480]))).lastrowid
+            conn.execute("INSERT INTO compatibility (system_id, equipment_id, via) VALUES (?, ?, 'software')",
+                         (system_id, equipment_id))
+    for sensor_type, accuracy_unit in SENSOR_TYPES:
+        for number in range(rng.randint(1, 4)):
+            conn.execute(
+                "INSERT INTO sensors (name, type, current_amps, accuracy_value, accuracy_unit, "
+                "range_max, range_unit) VALUES (?, ?, ?, ?, ?, ?, 'rad/s')",
+                (f'{sensor_type} {number}', sensor_type,
+                 rng.choice([0.0001, 0.0002, 0.0003, 0.001, 0.0039]),
+                 rng.choice([None, 0.1, 0.2, 0.3, 0.7, 3]), accuracy_unit,
+                 rng.choice([None, 0.1, 0.2, 0.3, 2.18, 4.36])))
+    conn.commit()
+    return conn
+
+@pytest.mark.parametrize('objective', ml_stack_configurator.OBJECTIVES)
+def test_seeded_catalog_matches_exhaustive_search(conn, objective):
+    configurator = ml_stack_configurator.StackConfigurator(conn, 'PX4', objective)
+    assert configurator.solve()
+    assert ml_stack_configurator.verify_solve(configurator) == []
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_catalogs_match_exhaustive_search(empty_template, tmp_path, seed):
+    conn = _random_catalog(empty_template, str(tmp_path / 'catalog.db'), seed)
+    for objective in ml_stack_configurator.OBJECTIVES:
+        for top in (1, 3):
+            configurator = ml_stack_configurator.StackConfigurator(conn, 'X', objective, top)
+            assert ml_stack_configurator.verify_solve(configurator, steps=6) == [], (objective, top)
+    conn.close()
+
+def test_budget_and_envelope_are_respected(conn):
+    configurator = ml_stack_configurator.StackConfigurator(conn, 'PX4', 'best', top=3)
+    cheapest = ml_stack_configurator.StackConfigurator(conn, 'PX4').solve(top=1)[0]
+    budget = cheapest['cost_cents'] + 5000
+    for stack in configurator.solve(budget, max_amps=0.05):
+        assert stack['cost_cents'] <= budget
+        assert stack['current_amps'] <= 0.05
+    assert configurator.solve(cheapest['cost_cents'] - 1) == []
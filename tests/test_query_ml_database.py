@@ -0,0 +1,73 @@
+"""
+Tests for the keyset-paginated report streams of query_ml_database.py
+"""
+
+import itertools
+
+import pytest
+
+import ml_database_ingest
+import ml_database_migrations
+import query_ml_database
+
+@pytest.fixture
+def session(database_path):
+    with query_ml_database.QuerySession(database_path, echo=False) as session:
+        yield session
+
+def test_pages_cover_the_full_report(session):
+    technologies = session.show_ml_technologies_by_company()
+    assert list(session.iter_ml_technologies_by_company(page_size=7)) == technologies
+    assert [row[0] for row in session.iter_companies(page_size=5)] == \
+        [row[0] for row in session.show_all_companies()]
+
+def test_company_stream_places_undated_rows_last(session, database_path):
+    conn = ml_database_migrations.connect(database_path)
+    ml_database_ingest.upsert_rows(conn, 'ml_technologies', [
+        ('DATAGOD', f'Undated {number}', 'Clustering', None, None, None, None)
+        for number in range(3)
+    ])
+    conn.commit()
+    conn.close()
+
+    streamed = list(session.iter_ml_technologies_by_company('DATAGOD', page_size=2))
+    assert sorted(streamed, key=repr) == sorted(session.show_ml_technologies_by_company('DATAGOD'),
+                                                key=repr)
+    dates = [row[4] for row in streamed]
+    assert dates[-3:] == [None] * 3
+    assert dates[:-3] == sorted(dates[:-3], reverse=True)
+
+def test_cursor_resumes_after_the_last_row(session):
+    everything = list(session.iter_ml_technologies_by_company(page_size=4))
+    stream = session.iter_ml_technologies_by_company(page_size=4)
+    head = list(itertools.islice(stream, 10))
+    tail = list(session.iter_ml_technologies_by_company(after=stream.cursor, page_size=4))
+    assert head + tail == everything
+
+def test_cursor_is_stable_across_inserts(session, database_path):
+    stream = session.iter_companies(page_size=3)
+    head = list(itertools.islice(stream, 3))
+    cursor = stream.cursor
+
+    conn = ml_database_migrations.connect(database_path)
+    ml_database_ingest.upsert_rows(conn, 'companies', [('AAA First', None, None, None, None)])
+    conn.commit()
+    conn.close()
+
+    tail = list(session.iter_companies(after=cursor))
+    assert head[-1][0] < tail[0][0]
+    assert 'AAA First' not in [row[0] for row in head + tail]
+
+def test_search_stream_matches_search(session):
+    ranked = session.search_technologies('anomaly')
+    streamed = list(session.iter_search_technologies('anomaly', page_size=1))
+    assert sorted(streamed) == sorted(ranked)
+    assert list(session.iter_search_technologies('"')) == []
+
+def test_cursor_belongs_to_its_report(session):
+    stream = session.iter_companies(page_size=2)
+    next(stream)
+    with pytest.raises(ValueError):
+        list(session.iter_technology_categories(after=stream.cursor))
+    with pytest.raises(ValueError):
+        list(session.iter_companies(after='not a cursor'))